@@ -1,35 +1,147 @@
 """
 Imports all teh functions from the files in this package
 
+The modules which import requests, bs4, aiohttp or pyarrow (the scrapers
+and the Parquet writer) are imported on first use, so the command line
+starts (and e.g. baskref --help answers) without importing them.
+
 Author: Dominik Zulovec Sajovic - August 2022
 """
 
+# pylint: disable=too-many-lines
+
 import sys
 import os
 import argparse
 import logging
-from typing import Callable
-from datetime import date
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    TypeAlias,
+)
+from datetime import date, timedelta
 
 from baskref.settings import Settings, InLine
-from baskref.utils import valid_date
+from baskref.utils import (
+    valid_date,
+    season_of_date,
+    parse_game_id,
+    lazy_import,
+)
 from baskref.exceptions import IllegalArgumentError
 
-from baskref.data_collection import (
-    BaskRefUrlScraper,
-    BaskRefDataScraper,
+from baskref.data_collection.rate_limiter import RateLimiter, Backoff
+from baskref.data_collection.response_cache import ResponseCache
+from baskref.data_collection.page_archive import PageArchive, parse_game_date
+from baskref.data_collection.parser_backends import PARSER_BACKENDS
+from baskref.data_collection.metrics import ScrapeMetrics
+from baskref.data_collection.user_agents import (
+    ROTATION_STRATEGIES,
+    UserAgentPool,
+    default_user_agent_pool,
+)
+
+from baskref.data_saving.file_saver import CSVStreamWriter, create_folder
+from baskref.data_saving.sqlite_saver import (
+    SQLiteStreamWriter,
+    GAMES_TABLE,
+    PLAYER_STATS_TABLE,
+    GAME_URLS_TABLE,
 )
-from baskref.data_collection.html_scraper import (
-    TooManyRequests,
-    PermissionDenied,
-    ScrapingError,
+from baskref.data_saving.schema import (
+    GAME_COLUMNS,
+    PLAYER_STATS_COLUMNS,
+    URL_COLUMNS,
 )
+from baskref.data_saving.journal import GameJournal
 
-from baskref.data_saving.file_saver import save_file_from_list
+if TYPE_CHECKING:
+    from requests import Session
+    from baskref.data_collection import (
+        BaskRefUrlScraper,
+        BaskRefDataScraper,
+    )
+    from baskref.data_saving.parquet_saver import ParquetStreamWriter
+
+# pylint: disable=import-outside-toplevel
 
 logger = logging.getLogger(__name__)
 
 
+# types of scraping which collect the games by date
+DAILY_MODES: tuple[str, ...] = ("g", "gu", "gpl", "gall")
+
+# types of scraping which only collect the game urls
+URL_MODES: tuple[str, ...] = ("gu", "gsu", "gpu")
+
+# types of scraping which only collect the player stats
+PLAYER_STATS_MODES: tuple[str, ...] = ("gpl", "gspl", "gppl")
+
+# the longest range of dates (in days) collected from the daily pages, one
+# request per day instead of the season page and its month pages
+DAILY_PAGES_MAX_DAYS: int = 3
+
+# formats in which the collected rows can be saved (-o)
+OUTPUT_FORMATS: tuple[str, ...] = ("csv", "parquet", "sqlite")
+
+# name of the database all the rows are saved into with -o sqlite
+SQLITE_DB_NAME: str = "baskref.sqlite"
+
+# types of scraping which can be run offline from the archive of pages
+OFFLINE_MODES: tuple[str, ...] = ("g", "gpl", "gall", "gs", "gspl", "gsall")
+
+# types of scraping which collect the games and the player stats together
+# (mapped to the types under which the two kinds of rows are saved)
+COMBINED_MODES: dict[str, tuple[str, str]] = {
+    "gall": ("g", "gpl"),
+    "gsall": ("gs", "gspl"),
+    "gpall": ("gp", "gppl"),
+}
+
+
+# the writers of the rows in the output formats (-o)
+RowWriter: TypeAlias = (
+    "CSVStreamWriter | ParquetStreamWriter | SQLiteStreamWriter"
+)
+
+# name -> module of the names imported on first use
+LAZY_IMPORTS: dict[str, str] = {
+    "BaskRefUrlScraper": "baskref.data_collection.baskref_url_scraper",
+    "BaskRefDataScraper": "baskref.data_collection.baskref_data_scraper",
+    "create_session": "baskref.data_collection.html_scraper",
+    "TooManyRequests": "baskref.data_collection.html_scraper",
+    "PermissionDenied": "baskref.data_collection.html_scraper",
+    "ScrapingError": "baskref.data_collection.html_scraper",
+    "ParquetStreamWriter": "baskref.data_saving.parquet_saver",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_import(__name__, name, LAZY_IMPORTS)
+
+
+class CollectedGame(NamedTuple):
+    """
+    The rows collected from one game.
+    :partition: prefix of the files the rows are saved into
+        (the date or the season of the games)
+    :game_url: url of the game
+    :rows: lists of rows by data type
+    """
+
+    partition: str
+    game_url: str
+    rows: dict[str, Sequence[Mapping]]
+
+
 def run_baskref() -> None:
     """Entry point script which runs baskref"""
 
@@ -61,15 +173,31 @@ def run_baskref() -> None:
             g - for game by date,
             gu - for game by date (only urls),
             gpl - player stats by date,
+            gall - games and player stats by date,
             gs - for all games in a year,
             gsu - for all games in a year (only urls),
             gspl - player stats all games in a year,
+            gsall - games and player stats all games in a year,
             gp - for all playoff games in a year,
             gpu - for all playoff games in a year (only urls)
             gppl - player stats playoff games in a year
+            gpall - games and player stats playoff games in a year
         )
         """,
-        choices=["g", "gu", "gpl", "gs", "gsu", "gspl", "gp", "gpu", "gppl"],
+        choices=[
+            "g",
+            "gu",
+            "gpl",
+            "gall",
+            "gs",
+            "gsu",
+            "gspl",
+            "gsall",
+            "gp",
+            "gpu",
+            "gppl",
+            "gpall",
+        ],
         type=str,
     )
 
@@ -114,6 +242,52 @@ def run_baskref() -> None:
         type=int,
     )
 
+    parser.add_argument(
+        "--from_date",
+        "--from-date",
+        help="""
+        If type of scraping is by date (g, gu, gpl, gall) then this
+        parameter together with --to_date specifies a range of dates
+        (both included) instead of a single date (-d).
+        The files are saved per season.
+        """,
+        default=None,
+        type=valid_date,
+    )
+
+    parser.add_argument(
+        "--to_date",
+        "--to-date",
+        help="""
+        Last date of the range of dates (see --from_date).
+        """,
+        default=None,
+        type=valid_date,
+    )
+
+    parser.add_argument(
+        "--from_year",
+        "--from-year",
+        help="""
+        If type of scraping is by season or playoffs (gs, gp, ...) then
+        this parameter together with --to_year specifies a range of years
+        (both included) instead of a single year (-y).
+        The files are saved per season.
+        """,
+        default=None,
+        type=int,
+    )
+
+    parser.add_argument(
+        "--to_year",
+        "--to-year",
+        help="""
+        Last year of the range of years (see --from_year).
+        """,
+        default=None,
+        type=int,
+    )
+
     parser.add_argument(
         "-fp",
         "--file_path",
@@ -125,6 +299,20 @@ def run_baskref() -> None:
         type=str,
     )
 
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="""
+        Format of the saved files: csv, parquet (typed columns, requires
+        pip install baskref[parquet]) or sqlite (all the rows are upserted
+        into the games / player_stats tables of baskref.sqlite).
+        By default it is set to csv.
+        """,
+        default="csv",
+        choices=OUTPUT_FORMATS,
+        type=str,
+    )
+
     parser.add_argument(
         "-p",
         "--proxy",
@@ -135,6 +323,226 @@ def run_baskref() -> None:
         type=str,
     )
 
+    parser.add_argument(
+        "--user_agents_file",
+        "--user-agents-file",
+        help="""
+        Text file with the user agents (one per line) used when a
+        request is retried with a different user agent.
+        By default a bundled list of browser user agents is used.
+        """,
+        default=None,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--user_agent_rotation",
+        "--user-agent-rotation",
+        help="""
+        How the user agents are rotated: round_robin (one after another),
+        random (seeded) or best (the one the server accepted most often).
+        By default it is set to round_robin.
+        """,
+        default="round_robin",
+        choices=ROTATION_STRATEGIES,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--pool_connections",
+        help="""
+        Number of hosts for which a pool of connections is kept open.
+        """,
+        default=10,
+        type=int,
+    )
+
+    parser.add_argument(
+        "--pool_maxsize",
+        help="""
+        Maximum number of connections kept open per host.
+        """,
+        default=10,
+        type=int,
+    )
+
+    parser.add_argument(
+        "--no_keep_alive",
+        help="""
+        If set, connections are closed after every request
+        instead of being reused.
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="""
+        Number of game pages scraped concurrently.
+        By default the pages are scraped one by one.
+        """,
+        default=1,
+        type=int,
+    )
+
+    parser.add_argument(
+        "-r",
+        "--rate",
+        help="""
+        Maximum number of requests per second sent to the website
+        (shared by all the workers). Set to 0 to disable the rate limiter.
+        By default it is set to 0.3 (18 requests per minute).
+        """,
+        default=0.3,
+        type=float,
+    )
+
+    parser.add_argument(
+        "--burst",
+        help="""
+        Number of requests which can be sent at once before the rate
+        limit kicks in.
+        """,
+        default=2,
+        type=int,
+    )
+
+    parser.add_argument(
+        "--retries",
+        help="""
+        Number of times a request is retried (with exponential backoff)
+        when the server responds with 429 or 503.
+        """,
+        default=3,
+        type=int,
+    )
+
+    parser.add_argument(
+        "-c",
+        "--cache_dir",
+        help="""
+        This parameter specifies a folder in which the scraped pages are
+        cached. Pages which never change (box scores, past schedules) are
+        not downloaded again. By default the cache is disabled.
+        """,
+        default=None,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--parser",
+        help="""
+        HTML parser backend used to parse the scraped pages
+        (html.parser, lxml, selectolax). lxml and selectolax are faster
+        but need to be installed separately.
+        By default it is set to html.parser.
+        """,
+        default="html.parser",
+        choices=PARSER_BACKENDS,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--parse_workers",
+        "--parse-workers",
+        help="""
+        Number of processes parsing the game pages while the workers
+        download them. Useful on machines with many cores, especially
+        when the pages come from the cache. By default the pages are
+        parsed by the workers downloading them.
+        """,
+        default=0,
+        type=int,
+    )
+
+    parser.add_argument(
+        "--archive_dir",
+        "--archive-dir",
+        help="""
+        This parameter specifies a folder in which the html of every
+        scraped game page is archived (compressed, one file per game),
+        so the games can be parsed again offline (--offline).
+        By default the pages are not archived.
+        """,
+        default=None,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--offline",
+        help="""
+        If set, the games are parsed from the pages in --archive_dir
+        without sending any request. The games are selected by the date
+        (-d, --from_date, --to_date) or the season (-y, --from_year,
+        --to_year) like when scraping.
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--pipeline",
+        help="""
+        If set, the box scores are scraped as soon as the first schedule
+        (month) page is scraped instead of after all the game urls are
+        collected. Useful for long seasons or ranges of seasons.
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        help="""
+        If set, a report of the requests (per class of url: status codes,
+        retries, downloaded bytes, time to first byte, download, soup
+        building and parsing times) is logged at the end of the run.
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--metrics_file",
+        "--metrics-file",
+        help="""
+        Path of a JSON file the report of the requests (see --metrics)
+        is written into at the end of the run.
+        """,
+        default=None,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--new_only",
+        "--new-only",
+        help="""
+        If set, the games collected by any previous run of the same type
+        (kept in an index next to the saved files, e.g. datasets/g.index)
+        are not scraped again.
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--since_last_run",
+        "--since-last-run",
+        help="""
+        If set, the new games (--new_only) from the day before the last
+        successful run of the same type until today are collected.
+        Only for the daily types (-t g, gu, gpl, gall).
+        """,
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--resume",
+        help="""
+        If set, the games already saved by a previous (interrupted) run
+        of the same type are skipped and the new rows are appended to
+        the existing files.
+        """,
+        action="store_true",
+    )
+
     parameters = parser.parse_args()
 
     main(parameters)
@@ -143,6 +551,12 @@ def run_baskref() -> None:
 def main(args: argparse.Namespace) -> None:
     """Extension of the baskref entrypoint."""
 
+    from baskref.data_collection.html_scraper import (
+        TooManyRequests,
+        PermissionDenied,
+        ScrapingError,
+    )
+
     in_line = InLine(
         type=args.type,
         date=args.date,
@@ -150,41 +564,120 @@ def main(args: argparse.Namespace) -> None:
         year=args.year,
         file_path=args.file_path,
         proxy=args.proxy,
+        user_agents_file=args.user_agents_file,
+        user_agent_rotation=args.user_agent_rotation,
+        output=args.output,
+        pool_connections=args.pool_connections,
+        pool_maxsize=args.pool_maxsize,
+        keep_alive=not args.no_keep_alive,
+        workers=args.workers,
+        rate=args.rate,
+        burst=args.burst,
+        retries=args.retries,
+        cache_dir=args.cache_dir,
+        parser=args.parser,
+        resume=args.resume,
+        pipeline=args.pipeline,
+        new_only=args.new_only,
+        since_last_run=args.since_last_run,
+        metrics=args.metrics,
+        metrics_file=args.metrics_file,
+        parse_workers=args.parse_workers,
+        archive_dir=args.archive_dir,
+        offline=args.offline,
+        from_date=args.from_date,
+        to_date=args.to_date,
+        from_year=args.from_year,
+        to_year=args.to_year,
     )
 
-    settings = Settings(in_line=in_line)
-
-    # 1. Run the data collection
-    try:
-        collected = run_data_collection_manager(settings)
-    except TooManyRequests as exp:
-        logger.info(
-            ":( Server responded with an error due to too many requests. "
-            "Try using a proxy or waiting at least 1 hour before continuing."
-        )
-        logger.debug(exp)
-        sys.exit(1)
-    except PermissionDenied as exp:
-        logger.info(
-            ":( Server responded with a permission error. "
-            "Try using a proxy or different combination of user agents.",
-        )
-        logger.debug(exp)
-        sys.exit(1)
-    except ScrapingError as exp:
-        logger.info(":( Server responded with an unexpected error.")
-        logger.debug(exp)
-        sys.exit(1)
+    settings = Settings(
+        in_line=in_line,
+        metrics=(
+            ScrapeMetrics()
+            if in_line.metrics or in_line.metrics_file
+            else None
+        ),
+        user_agents=init_user_agents(in_line),
+    )
 
-    # 2. Run the data saver
-    run_data_saving_manager(settings, collected)
+    started_on = date.today()
+    if settings.in_line.since_last_run:
+        apply_since_last_run(settings, started_on)
+
+    # one connection pool shared by all the scrapers for the whole run
+    session = init_session(settings)
+
+    # 1. Run the data collection and save every game as soon as it's
+    #    scraped (the rows scraped before an error are kept)
+    with session:
+        try:
+            collected = run_data_collection_manager(
+                settings, session, load_completed_games(settings)
+            )
+
+            # 2. Run the data saver
+            run_data_saving_manager(settings, collected)
+
+            record_successful_run(settings, started_on)
+        except TooManyRequests as exp:
+            logger.info(
+                ":( Server responded with an error due to too many requests. "
+                "Try using a proxy or waiting at least 1 hour "
+                "before continuing."
+            )
+            logger.debug(exp)
+            sys.exit(1)
+        except PermissionDenied as exp:
+            logger.info(
+                ":( Server responded with a permission error. "
+                "Try using a proxy or different combination of user agents.",
+            )
+            logger.debug(exp)
+            sys.exit(1)
+        except ScrapingError as exp:
+            logger.info(":( Server responded with an unexpected error.")
+            logger.debug(exp)
+            sys.exit(1)
+        finally:
+            report_metrics(settings)
+
+
+def report_metrics(settings: Settings) -> None:
+    """Logs and / or saves the report of the metrics of the run"""
+
+    if settings.metrics is None:
+        return
+
+    if settings.in_line.metrics:
+        logger.info(f"Metrics report:\n{settings.metrics.format_report()}")
+
+        if settings.user_agents is not None and settings.user_agents.stats():
+            logger.info(f"User agents:\n{settings.user_agents.format_stats()}")
+
+    if settings.in_line.metrics_file:
+        create_folder(settings.in_line.metrics_file)
+        settings.metrics.save_json(settings.in_line.metrics_file)
+        logger.info(f"Saved the metrics to: {settings.in_line.metrics_file}")
 
 
 ## Data Collection Functions
 
 
-def run_data_collection_manager(settings: Settings) -> list:
-    """This function runs the selected mode of collection"""
+def run_data_collection_manager(
+    settings: Settings,
+    session: "Session | None" = None,
+    skip_urls: Collection[str] = (),
+) -> Iterator[CollectedGame]:
+    """
+    This function runs the selected mode of collection.
+    If a session is passed, all the scrapers send their requests through it.
+    The games whose url (or game id) is in skip_urls are not collected.
+    The collection is lazy: it yields the rows of every game as soon as
+    the game is scraped as a tuple (game url, rows by data type).
+    The combined modes (gall, gsall, gpall) yield the game data and the
+    player stats data under the types of the single modes.
+    """
 
     logger.info("Started the data collection manager")
 
@@ -192,12 +685,15 @@ def run_data_collection_manager(settings: Settings) -> list:
         "g": run_daily_collector,
         "gu": run_daily_collector,
         "gpl": run_daily_collector,
+        "gall": run_daily_collector,
         "gs": run_season_collector,
         "gsu": run_season_collector,
         "gspl": run_season_collector,
+        "gsall": run_season_collector,
         "gp": run_playoffs_collector,
         "gpu": run_playoffs_collector,
         "gppl": run_playoffs_collector,
+        "gpall": run_playoffs_collector,
     }
 
     if settings.in_line.type not in collection_modes:
@@ -206,114 +702,670 @@ def run_data_collection_manager(settings: Settings) -> list:
             "(-t) argument.",
         )
 
-    return collection_modes[settings.in_line.type](settings)
+    validate_ranges(settings)
+
+    if settings.in_line.offline:
+        validate_offline(settings)
+        return run_archive_collector(settings, session, skip_urls)
+
+    return collection_modes[settings.in_line.type](
+        settings, session, skip_urls
+    )
+
+
+def init_scrapers(
+    settings: Settings, session: "Session | None" = None
+) -> "tuple[BaskRefUrlScraper, BaskRefDataScraper]":
+    """
+    Initializes the url and the data scraper.
+    If a session is passed both scrapers share it (and its connection pool).
+    Both scrapers share the same rate limiter and pool of user agents.
+    """
+
+    from baskref.data_collection import (
+        BaskRefUrlScraper,
+        BaskRefDataScraper,
+    )
+
+    session = session or init_session(settings)
+
+    rate_limiter = (
+        RateLimiter(settings.in_line.rate, settings.in_line.burst)
+        if settings.in_line.rate > 0
+        else None
+    )
+    backoff = Backoff(retries=settings.in_line.retries)
+    user_agents = settings.user_agents or default_user_agent_pool()
+    cache = (
+        ResponseCache(settings.in_line.cache_dir)
+        if settings.in_line.cache_dir
+        else None
+    )
+
+    url_scraper = BaskRefUrlScraper(
+        settings.in_line.proxy,
+        session=session,
+        workers=settings.in_line.workers,
+        rate_limiter=rate_limiter,
+        backoff=backoff,
+        cache=cache,
+        parser=settings.in_line.parser,
+        metrics=settings.metrics,
+        user_agents=user_agents,
+    )
+    data_scraper = BaskRefDataScraper(
+        settings.in_line.proxy,
+        session=session,
+        workers=settings.in_line.workers,
+        rate_limiter=rate_limiter,
+        backoff=backoff,
+        cache=cache,
+        parser=settings.in_line.parser,
+        metrics=settings.metrics,
+        user_agents=user_agents,
+        parse_workers=settings.in_line.parse_workers,
+        archive=(
+            PageArchive(settings.in_line.archive_dir)
+            if settings.in_line.archive_dir
+            else None
+        ),
+        offline=settings.in_line.offline,
+    )
+
+    return url_scraper, data_scraper
 
 
-def run_daily_collector(settings: Settings) -> list:
+def init_user_agents(in_line: InLine) -> UserAgentPool:
+    """
+    Creates the pool of user agents shared by the scrapers, loaded from
+    the user agents file or the bundled list.
+    """
+
+    if in_line.user_agents_file:
+        return UserAgentPool.from_file(
+            in_line.user_agents_file, strategy=in_line.user_agent_rotation
+        )
+
+    return UserAgentPool(strategy=in_line.user_agent_rotation)
+
+
+def init_session(settings: Settings) -> "Session":
+    """
+    Creates the pooled session used by the scrapers.
+    The pool keeps at least as many connections per host as there are
+    workers, so concurrent requests never wait for a free connection.
+    """
+
+    from baskref.data_collection.html_scraper import create_session
+
+    return create_session(
+        pool_connections=settings.in_line.pool_connections,
+        pool_maxsize=max(
+            settings.in_line.pool_maxsize, settings.in_line.workers
+        ),
+        keep_alive=settings.in_line.keep_alive,
+    )
+
+
+def run_daily_collector(
+    settings: Settings,
+    session: "Session | None" = None,
+    skip_urls: Collection[str] = (),
+) -> Iterator[CollectedGame]:
     """
     This function orchestrates the collection of data from NBA games on
-    a specific day.
+    a specific day or in a range of days (saved per season).
     """
 
     logger.info("DAILY GAME COLLECTOR MODE")
-    logger.info(f"Collecting all game urls for: {settings.in_line.date}")
-
-    # 1. Get all the game urls for the specific day
-    url_scraper = BaskRefUrlScraper(settings.in_line.proxy)
-    game_urls = url_scraper.get_game_urls_day(settings.in_line.date)
-    logger.info(f"Scraped {len(game_urls)} game urls")
+    url_scraper, data_scraper = init_scrapers(settings, session)
+    prefix = get_saving_prefix(settings)
+
+    # 1. Get all the game urls for the specific day(s)
+    game_urls: Iterable[tuple[str, str]]
+    if settings.in_line.from_date is None:
+        logger.info(f"Collecting all game urls for: {settings.in_line.date}")
+        game_urls = (
+            (prefix, url)
+            for url in url_scraper.get_game_urls_day(settings.in_line.date)
+        )
+    else:
+        logger.info(
+            f"Collecting all game urls from {settings.in_line.from_date} "
+            f"to {settings.in_line.to_date}"
+        )
+        from_date = settings.in_line.from_date
+        to_date = settings.in_line.to_date or from_date
 
-    if settings.in_line.type == "gu":
-        return [{"url": url} for url in game_urls]
+        if (to_date - from_date).days < DAILY_PAGES_MAX_DAYS:
+            seasons = url_scraper.iter_game_urls_days(from_date, to_date)
+        else:
+            seasons = url_scraper.iter_game_urls_dates(from_date, to_date)
+        game_urls = ((f"{year}_{prefix}", url) for year, url in seasons)
 
     # 2. Get the game data for the list of games
-    data_scraper = BaskRefDataScraper(settings.in_line.proxy)
+    yield from collect_games_data(
+        data_scraper,
+        game_urls,
+        settings.in_line.type,
+        skip_urls,
+        settings.in_line.pipeline,
+    )
 
-    if settings.in_line.type == "gpl":
-        data = data_scraper.get_player_stats_data(game_urls)
-    elif settings.in_line.type == "g":
-        data = data_scraper.get_games_data(game_urls)
 
-    logger.info(f"Scraped {len(data)} data points")
+def run_season_collector(
+    settings: Settings,
+    session: "Session | None" = None,
+    skip_urls: Collection[str] = (),
+) -> Iterator[CollectedGame]:
+    """
+    Orchestrates the collection of data in all games of a season or of
+    a range of seasons (saved per season)
+    """
 
-    return data
+    years = get_years(settings)
 
+    logger.info("SEASON GAME COLLECTOR MODE")
+    logger.info(f"Collecting all games for: {', '.join(map(str, years))}")
 
-def run_season_collector(settings: Settings) -> list:
-    """Orchestrates the collection of data in all games of a season"""
+    # 1. Get all the game urls for the specific year(s)
+    url_scraper, data_scraper = init_scrapers(settings, session)
+    seasons = url_scraper.iter_game_urls_years(years)
+    game_urls = ((str(year), url) for year, url in seasons)
 
-    logger.info("SEASON GAME COLLECTOR MODE")
-    logger.info(f"Collecting all games for: {settings.in_line.year}")
+    # 2. Get the game data for the list of games
+    yield from collect_games_data(
+        data_scraper,
+        game_urls,
+        settings.in_line.type,
+        skip_urls,
+        settings.in_line.pipeline,
+    )
 
-    # 1. Get all the game urls for the specific year
-    url_scraper = BaskRefUrlScraper(settings.in_line.proxy)
-    game_urls = url_scraper.get_game_urls_year(settings.in_line.year)
-    logger.info(f"Scraped {len(game_urls)} game urls")
 
-    if settings.in_line.type == "gsu":
-        return [{"url": url} for url in game_urls]
+def run_playoffs_collector(
+    settings: Settings,
+    session: "Session | None" = None,
+    skip_urls: Collection[str] = (),
+) -> Iterator[CollectedGame]:
+    """
+    Orchestrates the collection of data in all games in a playoff or in
+    a range of playoffs (saved per season)
+    """
+
+    years = get_years(settings)
+
+    logger.info("PLAYOFF GAME COLLECTOR MODE")
+    logger.info(
+        f"Collecting all games for: {', '.join(map(str, years))} playoffs"
+    )
+
+    # 1. Get all the game urls for the specific postseason(s)
+    url_scraper, data_scraper = init_scrapers(settings, session)
+    seasons = url_scraper.iter_game_urls_playoffs_years(years)
+    game_urls = ((str(year), url) for year, url in seasons)
 
     # 2. Get the game data for the list of games
-    data_scraper = BaskRefDataScraper(settings.in_line.proxy)
+    yield from collect_games_data(
+        data_scraper,
+        game_urls,
+        settings.in_line.type,
+        skip_urls,
+        settings.in_line.pipeline,
+    )
 
-    if settings.in_line.type == "gspl":
-        data = data_scraper.get_player_stats_data(game_urls)
-    elif settings.in_line.type == "gs":
-        data = data_scraper.get_games_data(game_urls)
 
-    logger.info(f"Scraped {len(data)} data points")
+def run_archive_collector(
+    settings: Settings,
+    session: "Session | None" = None,
+    skip_urls: Collection[str] = (),
+) -> Iterator[CollectedGame]:
+    """
+    Orchestrates the offline collection of data from the game pages in
+    the archive. The games are selected and saved the same way as by
+    the daily and the season collectors, but no request is sent.
+    """
 
-    return data
+    logger.info("ARCHIVE GAME COLLECTOR MODE")
+    url_scraper, data_scraper = init_scrapers(settings, session)
 
+    # 1. Get the urls of the archived games matching the date(s) / year(s)
+    archive = PageArchive(str(settings.in_line.archive_dir))
+    game_urls = (
+        (partition, f"{url_scraper.base_url}/boxscores/{game_id}.html")
+        for game_id in archive.iter_game_ids()
+        if (partition := get_archive_partition(settings, game_id))
+    )
 
-def run_playoffs_collector(settings: Settings) -> list:
-    """Orchestrates the collection of data in all games in a playoff"""
+    # 2. Parse the game data out of the archived pages
+    yield from collect_games_data(
+        data_scraper,
+        game_urls,
+        settings.in_line.type,
+        skip_urls,
+        settings.in_line.pipeline,
+    )
 
-    logger.info("PLAYOFF GAME COLLECTOR MODE")
-    logger.info(f"Collecting all games for: {settings.in_line.year} playoffs")
 
-    # 1. Get all the game urls for the specific postseason
-    url_scraper = BaskRefUrlScraper(settings.in_line.proxy)
-    game_urls = url_scraper.get_game_urls_playoffs(settings.in_line.year)
-    logger.info(f"Scraped {len(game_urls)} game urls")
+def get_archive_partition(settings: Settings, game_id: str) -> str | None:
+    """
+    The partition an archived game is saved into, the same as when the
+    game is scraped online.
+    :return: the partition or None if the game isn't selected
+    """
 
-    if settings.in_line.type == "gpu":
-        return [{"url": url} for url in game_urls]
+    in_line = settings.in_line
+    game_date = parse_game_date(game_id)
+    season = season_of_date(game_date)
 
-    # 2. Get the game data for the list of games
-    data_scraper = BaskRefDataScraper(settings.in_line.proxy)
+    if in_line.type not in DAILY_MODES:
+        return str(season) if season in get_years(settings) else None
+
+    prefix = get_saving_prefix(settings)
+
+    if in_line.from_date is None:
+        return prefix if game_date == in_line.date else None
+
+    to_date = in_line.to_date or in_line.from_date
+    if in_line.from_date <= game_date <= to_date:
+        return f"{season}_{prefix}"
+
+    return None
+
+
+def collect_games_data(
+    data_scraper: "BaskRefDataScraper",
+    game_urls: Iterable[tuple[str, str]],
+    data_type: str,
+    skip_urls: Collection[str] = (),
+    pipeline: bool = False,
+) -> Iterator[CollectedGame]:
+    """
+    Scrapes the game urls according to the type of scraping and yields
+    the rows of every game as soon as the game is scraped. The games of
+    all the partitions are scraped as one stream, so the workers are
+    kept busy across the partition (season) boundaries.
+    :game_urls: tuples (partition the game is saved into, game url)
+    :data_type: type of scraping (-t)
+    :skip_urls: urls (or game ids) of the games which are not collected
+        again
+    :pipeline: if True the games are scraped while the game urls are
+        still being discovered, otherwise all the game urls are
+        discovered first
+    :return: yields the collected games, the url modes yield every url
+        as its own game (without scraping it)
+    """
+
+    if not pipeline:
+        game_urls = list(game_urls)
+        logger.info(f"Scraped {len(game_urls)} game urls")
+
+    skip_urls = set(skip_urls)
+    games: deque[tuple[str, str]] = deque()
+    nr_skipped = 0
+
+    def new_urls() -> Iterator[str]:
+        """The urls to scrape, remembering their partitions in order"""
+
+        nonlocal nr_skipped
+        for partition, url in game_urls:
+            if url in skip_urls or parse_game_id(url) in skip_urls:
+                nr_skipped += 1
+                continue
+
+            games.append((partition, url))
+            yield url
+
+    games_rows: Iterable[dict[str, Sequence[Mapping]]] = (
+        ({data_type: [{"url": url}]} for url in new_urls())
+        if data_type in URL_MODES
+        else iter_game_rows(data_scraper, new_urls(), data_type)
+    )
+
+    nr_games = 0
+    for rows in games_rows:
+        partition, game_url = games.popleft()
+        nr_games += 1
+        yield CollectedGame(partition, game_url, rows)
+
+    if nr_skipped > 0:
+        logger.info(f"Skipped {nr_skipped} games collected by a previous run")
+    logger.info(f"Scraped {nr_games} games")
+
+
+def iter_game_rows(
+    data_scraper: "BaskRefDataScraper",
+    game_urls: Iterable[str],
+    data_type: str,
+) -> Iterator[dict[str, Sequence[Mapping]]]:
+    """
+    Scrapes the games according to the type of scraping.
+    :return: yields the rows by data type of every game
+    """
+
+    if data_type in COMBINED_MODES:
+        games_type, pl_stats_type = COMBINED_MODES[data_type]
+        games = data_scraper.iter_games_and_player_stats_data(game_urls)
+        for game, pl_stats in games:
+            yield {games_type: [game], pl_stats_type: pl_stats}
+    elif data_type in PLAYER_STATS_MODES:
+        for pl_stats in data_scraper.iter_player_stats_data(game_urls):
+            yield {data_type: pl_stats}
+    else:
+        for game in data_scraper.iter_games_data(game_urls):
+            yield {data_type: [game]}
+
+
+def get_years(settings: Settings) -> list[int]:
+    """The years of the seasons to collect (-y or the range of years)"""
+
+    if settings.in_line.from_year is None:
+        return [settings.in_line.year]
+
+    from_year = settings.in_line.from_year
+    to_year = settings.in_line.to_year or from_year
+
+    return list(range(from_year, to_year + 1))
+
+
+def validate_ranges(settings: Settings) -> None:
+    """
+    Checks that the ranges of dates / years are complete and that they
+    match the type of scraping.
+    """
+
+    in_line = settings.in_line
+    daily_type = in_line.type in DAILY_MODES
 
-    if settings.in_line.type == "gppl":
-        data = data_scraper.get_player_stats_data(game_urls)
-    elif settings.in_line.type == "gp":
-        data = data_scraper.get_games_data(game_urls)
+    validate_range(in_line.from_date, in_line.to_date, "date", daily_type)
+    validate_range(in_line.from_year, in_line.to_year, "year", not daily_type)
 
-    logger.info(f"Scraped {len(data)} data points")
 
-    return data
+def validate_offline(settings: Settings) -> None:
+    """Checks that the type of scraping can be run from the archive"""
+
+    if not settings.in_line.archive_dir:
+        raise IllegalArgumentError("--offline requires --archive_dir.")
+
+    if settings.in_line.type not in OFFLINE_MODES:
+        raise IllegalArgumentError(
+            f"The type {settings.in_line.type} can't be run offline. "
+            f"Choose one of: {', '.join(OFFLINE_MODES)}"
+        )
+
+
+def validate_range(start: Any, end: Any, name: str, allowed: bool) -> None:
+    """
+    Checks a range passed by --from_{name} and --to_{name}.
+    :allowed: if the range can be used with the type of scraping
+    """
+
+    if start is None and end is None:
+        return
+
+    if start is None or end is None:
+        raise IllegalArgumentError(
+            f"--from_{name} and --to_{name} have to be used together."
+        )
+
+    if start > end:
+        raise IllegalArgumentError(
+            f"--from_{name} can't be after --to_{name}."
+        )
+
+    if not allowed:
+        raise IllegalArgumentError(
+            f"--from_{name} and --to_{name} can't be used with this type "
+            "of scraping (-t)."
+        )
 
 
 ## Data Saving Functions
 
 
-def run_data_saving_manager(settings: Settings, coll_data: list) -> None:
-    """Integration function which runs the saving of the data"""
+def run_data_saving_manager(
+    settings: Settings,
+    coll_data: Iterable[CollectedGame],
+) -> None:
+    """
+    Integration function which runs the saving of the data.
+    The rows are appended to the files as they are collected, every data
+    type into its own file named after the type (or upserted into its
+    table of the database with -o sqlite). Every saved game is
+    recorded in the journal, so if the collection fails the rows
+    collected up to that point stay saved and can be resumed (--resume).
+    The ids of the saved games are also added to the index of the type,
+    which is used to collect only the new games (--new_only). The rows
+    of those runs are appended to the existing files, like when resuming.
+    A game is only recorded once its rows are on disk: the games written
+    into Parquet files (complete only once closed) are recorded after the
+    writers are closed.
+    """
+
+    # the files already hold the games which are skipped
+    append = (
+        settings.in_line.resume
+        or settings.in_line.new_only
+        or settings.in_line.since_last_run
+    )
+    writers: dict[tuple[str, str], RowWriter] = {}
+
+    journal = GameJournal(get_journal_path(settings))
+    if not settings.in_line.resume:
+        journal.clear()
+
+    index = GameJournal(get_index_path(settings))
+
+    # the games whose rows are buffered by a writer until it's closed
+    pending: list[str] = []
+
+    def record_game(game_url: str) -> None:
+        journal.record(game_url)
+        index.record(parse_game_id(game_url))
+
+    try:
+        for game in coll_data:
+            durable = True
+            for data_type, rows in game.rows.items():
+                save_path = get_save_path(settings, game.partition, data_type)
+                if (save_path, data_type) not in writers:
+                    writers[save_path, data_type] = create_writer(
+                        settings.in_line.output, data_type, save_path, append
+                    )
+
+                writer = writers[save_path, data_type]
+                writer.write_rows(rows)
+                durable = durable and writer.durable_writes
+
+            if durable:
+                record_game(game.game_url)
+            else:
+                pending.append(game.game_url)
+    finally:
+        try:
+            for writer in writers.values():
+                writer.close()
+                if writer.rows_written > 0:
+                    logger.info(
+                        f"Saved {writer.rows_written} rows to: "
+                        f"{writer.filepath}"
+                    )
+
+            for game_url in pending:
+                record_game(game_url)
+        finally:
+            journal.close()
+            index.close()
+
+
+def get_save_path(settings: Settings, partition: str, data_type: str) -> str:
+    """
+    Path of the file the rows of the data type in the partition are saved
+    into. With -o sqlite all the rows are saved into one database.
+    """
+
+    output = settings.in_line.output
+
+    if output == "sqlite":
+        return os.path.join(settings.in_line.file_path, SQLITE_DB_NAME)
+
+    return os.path.join(
+        settings.in_line.file_path, f"{partition}_{data_type}.{output}"
+    )
+
+
+def create_writer(
+    output: str, data_type: str, save_path: str, append: bool = False
+) -> RowWriter:
+    """
+    Creates the writer of the rows of the data type in the output format.
+    The Parquet files get the fixed schema of the data type and the
+    SQLite rows its table (upserts, so append doesn't apply).
+    """
+
+    if output == "csv":
+        return CSVStreamWriter(save_path, append)
+
+    columns, table = GAME_COLUMNS, GAMES_TABLE
+    if data_type in URL_MODES:
+        columns, table = URL_COLUMNS, GAME_URLS_TABLE
+    elif data_type in PLAYER_STATS_MODES:
+        columns, table = PLAYER_STATS_COLUMNS, PLAYER_STATS_TABLE
+
+    if output == "parquet":
+        from baskref.data_saving.parquet_saver import ParquetStreamWriter
+
+        return ParquetStreamWriter(save_path, columns, append)
+
+    if output == "sqlite":
+        return SQLiteStreamWriter(save_path, table)
+
+    raise IllegalArgumentError(
+        f"{output} is not a valid value for the output (-o) argument."
+    )
+
+
+def get_saving_prefix(settings: Settings) -> str:
+    """
+    Prefix of the saved files of a run: the date or the year of the games
+    (or the range of dates / years)
+    """
+
+    in_line = settings.in_line
+
+    date_prefix = in_line.date.strftime("%Y%m%d")
+    if in_line.from_date is not None and in_line.to_date is not None:
+        date_prefix = f"{in_line.from_date:%Y%m%d}-{in_line.to_date:%Y%m%d}"
+
+    year_prefix = str(in_line.year)
+    if in_line.from_year is not None and in_line.to_year is not None:
+        year_prefix = f"{in_line.from_year}-{in_line.to_year}"
 
     saving_prefix_options: dict[str, str] = {
-        "g": settings.in_line.date.strftime("%Y%m%d"),
-        "gu": settings.in_line.date.strftime("%Y%m%d"),
-        "gpl": settings.in_line.date.strftime("%Y%m%d"),
-        "gs": str(settings.in_line.year),
-        "gsu": str(settings.in_line.year),
-        "gspl": str(settings.in_line.year),
-        "gp": str(settings.in_line.year),
-        "gpu": str(settings.in_line.year),
-        "gppl": str(settings.in_line.year),
+        "g": date_prefix,
+        "gu": date_prefix,
+        "gpl": date_prefix,
+        "gall": date_prefix,
+        "gs": year_prefix,
+        "gsu": year_prefix,
+        "gspl": year_prefix,
+        "gsall": year_prefix,
+        "gp": year_prefix,
+        "gpu": year_prefix,
+        "gppl": year_prefix,
+        "gpall": year_prefix,
     }
 
-    chosen_prefix = saving_prefix_options[settings.in_line.type]
-    file_name = f"{chosen_prefix}_{settings.in_line.type}.csv"
+    return saving_prefix_options[in_line.type]
+
+
+def get_journal_path(settings: Settings) -> str:
+    """Path of the journal of the saved games, next to the saved files"""
+
+    file_name = (
+        f"{get_saving_prefix(settings)}_{settings.in_line.type}.journal"
+    )
+
+    return os.path.join(settings.in_line.file_path, file_name)
+
+
+def get_index_path(settings: Settings) -> str:
+    """Path of the index of the ids of all the games collected by a type"""
+
+    return os.path.join(
+        settings.in_line.file_path, f"{settings.in_line.type}.index"
+    )
+
+
+def get_last_run_path(settings: Settings) -> str:
+    """Path of the file keeping the date of the last successful run"""
+
+    return os.path.join(
+        settings.in_line.file_path, f"{settings.in_line.type}.last_run"
+    )
+
+
+def load_completed_games(settings: Settings) -> set[str]:
+    """
+    Loads the games which are not collected again: the urls of the games
+    saved by a previous run when resuming (--resume) and the ids of all
+    the games collected so far when only the new games are collected
+    (--new_only, --since_last_run). Otherwise nothing is skipped.
+    """
+
+    completed: set[str] = set()
+
+    if settings.in_line.resume:
+        completed |= GameJournal(get_journal_path(settings)).load()
+
+    if settings.in_line.new_only or settings.in_line.since_last_run:
+        completed |= GameJournal(get_index_path(settings)).load()
+
+    return completed
+
+
+def apply_since_last_run(settings: Settings, today: date) -> None:
+    """
+    Sets the range of dates to collect from the day before the last
+    successful run (late games finish after midnight) until today.
+    Without a previous successful run only today is collected.
+    """
+
+    in_line = settings.in_line
+
+    if in_line.type not in DAILY_MODES:
+        raise IllegalArgumentError(
+            "--since_last_run can only be used with the daily types "
+            f"({', '.join(DAILY_MODES)})."
+        )
+
+    if in_line.from_date is not None or in_line.to_date is not None:
+        raise IllegalArgumentError(
+            "--since_last_run can't be used with --from_date and --to_date."
+        )
+
+    last_run = load_last_run(settings)
+    in_line.from_date = (
+        min(last_run - timedelta(days=1), today) if last_run else today
+    )
+    in_line.to_date = today
+
+
+def load_last_run(settings: Settings) -> date | None:
+    """The date of the last successful run of the type (None if unknown)"""
+
+    try:
+        with open(get_last_run_path(settings), encoding="UTF-8") as run_file:
+            return valid_date(run_file.read().strip())
+    except (OSError, argparse.ArgumentTypeError):
+        return None
+
+
+def record_successful_run(settings: Settings, started_on: date) -> None:
+    """Saves the date on which the last successful run was started"""
+
+    last_run_path = get_last_run_path(settings)
+    create_folder(last_run_path)
 
-    save_path = os.path.join(settings.in_line.file_path, file_name)
-    save_file_from_list(coll_data, save_path)
-    logger.info(f"Saved the file to: {save_path}")
+    with open(last_run_path, "w", encoding="UTF-8") as run_file:
+        run_file.write(started_on.isoformat())
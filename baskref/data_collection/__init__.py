@@ -1,12 +1,49 @@
 """
 Imports the functions/classes from the files in this package
 
+The scrapers are imported on first use (module level __getattr__), so
+importing a light module of the package (e.g. the metrics or the rate
+limiter) doesn't import requests, bs4 and aiohttp.
+
 Author: Dominik Zulovec Sajovic - September 2022
 """
 
-from baskref.data_collection.baskref_url_scraper import (
-    BaskRefUrlScraper,
-)
-from baskref.data_collection.baskref_data_scraper import (
-    BaskRefDataScraper,
-)
+from typing import TYPE_CHECKING, Any
+from baskref.utils import lazy_import
+
+if TYPE_CHECKING:
+    from baskref.data_collection.baskref_url_scraper import (
+        BaskRefUrlScraper,
+    )
+    from baskref.data_collection.baskref_data_scraper import (
+        BaskRefDataScraper,
+    )
+    from baskref.data_collection.async_baskref_scraper import (
+        AsyncBaskRefUrlScraper,
+        AsyncBaskRefDataScraper,
+    )
+    from baskref.data_collection.records import (
+        GameRecord,
+        PlayerStatRecord,
+    )
+
+
+# name -> module of the names imported on first use
+LAZY_IMPORTS: dict[str, str] = {
+    "BaskRefUrlScraper": "baskref.data_collection.baskref_url_scraper",
+    "BaskRefDataScraper": "baskref.data_collection.baskref_data_scraper",
+    "AsyncBaskRefUrlScraper": "baskref.data_collection.async_baskref_scraper",
+    "AsyncBaskRefDataScraper": "baskref.data_collection.async_baskref_scraper",
+    "GameRecord": "baskref.data_collection.records",
+    "PlayerStatRecord": "baskref.data_collection.records",
+}
+
+__all__ = list(LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_import(__name__, name, LAZY_IMPORTS)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *LAZY_IMPORTS])
@@ -0,0 +1,189 @@
+"""
+This page contains the asyncio counterparts of the basketball reference
+url and data scrapers. The pages are fetched with the AsyncHTMLScraper and
+parsed with the (unchanged) parsing functions of the synchronous scrapers,
+which never open a session as they don't send any request.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from dataclasses import dataclass
+from datetime import date
+import logging
+from baskref.data_collection.async_html_scraper import AsyncHTMLScraper
+from baskref.data_collection.baskref_url_scraper import BaskRefUrlScraper
+from baskref.data_collection.baskref_data_scraper import (
+    BaskRefDataScraper,
+    tag_game_data,
+    tag_player_stats_data,
+    tag_game_and_player_stats_data,
+)
+from baskref.data_collection.records import GameRecord, PlayerStatRecord
+
+# pylint: disable=protected-access
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncBaskRefUrlScraper(AsyncHTMLScraper):
+    """Async version of the BaskRefUrlScraper"""
+
+    base_url: str = "https://www.basketball-reference.com"
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._parser = BaskRefUrlScraper(
+            base_url=self.base_url, parser=self.parser
+        )
+
+    # public functions
+
+    async def get_game_urls_day(self, game_date: date) -> list:
+        """
+        Scrapes the urls to every game's boxscore on a specific day.
+        :game_date: A game_date to scrape games on
+        :return: a list of basketball reference urls
+        """
+
+        return await self.scrape(
+            self._parser._generate_daily_games_url(game_date),
+            self._parser._parse_daily_games,
+        )
+
+    async def get_game_urls_year(self, year: int) -> list:
+        """
+        Scrapes the urls to every game's boxscore in a season.
+        The month pages are scraped concurrently.
+        :year: A year of the season
+        :return: a list of basketball reference urls
+        """
+
+        monthly_urls = await self.scrape(
+            self._parser._generate_season_games_url(year),
+            self._parser._parse_months_in_year,
+        )
+
+        monthly_games = await self._gather(
+            self.scrape(murl, self._parser._parse_monthly_games)
+            for murl in monthly_urls
+        )
+
+        return [gurl for month in monthly_games for gurl in month]
+
+    async def get_game_urls_playoffs(self, year: int) -> list:
+        """
+        Scrapes the urls to every game's boxscore in a specific postseason.
+        :year: A year of the postseason
+        :return: a list of basketball reference urls
+        """
+
+        return await self.scrape(
+            self._parser._generate_playoff_games_url(year),
+            self._parser._parse_monthly_games,
+        )
+
+
+@dataclass
+class AsyncBaskRefDataScraper(AsyncHTMLScraper):
+    """Async version of the BaskRefDataScraper"""
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._parser = BaskRefDataScraper(parser=self.parser)
+
+    # public functions
+
+    async def get_games_data(self, game_urls: list) -> list[GameRecord]:
+        """
+        Scrapes the game data for all the game urls provided concurrently.
+        :game_urls: list of box score game urls from basketball reference
+        :return: returns a list of game records with game data
+        """
+
+        return await self._gather(
+            self._scrape_game_data(url) for url in game_urls
+        )
+
+    async def get_player_stats_data(
+        self, game_urls: list
+    ) -> list[PlayerStatRecord]:
+        """
+        Scrapes the player stats data for all the game urls provided
+        concurrently.
+        :game_urls: list of box score game urls from basketball reference
+        :return: returns a list of player stat records
+        """
+
+        pl_stats = await self._gather(
+            self._scrape_player_stats_data(url) for url in game_urls
+        )
+        return [pl for game in pl_stats for pl in game]
+
+    async def get_games_and_player_stats_data(
+        self, game_urls: list
+    ) -> tuple[list[GameRecord], list[PlayerStatRecord]]:
+        """
+        Scrapes the game data and the player stats data for all the game
+        urls provided concurrently. Every game page is fetched only once.
+        :game_urls: list of box score game urls from basketball reference
+        :return: returns a tuple (game data, player stats data)
+        """
+
+        games = await self._gather(
+            self._scrape_game_and_player_stats_data(url) for url in game_urls
+        )
+
+        return (
+            [game for game, _ in games],
+            [pl for _, pl_stats in games for pl in pl_stats],
+        )
+
+    # Private Methods
+
+    ## scraping functions
+
+    async def _scrape_game_data(self, game_url: str) -> GameRecord:
+        """
+        Scrapes the game data for the given game web page.
+        :game_url: a Basketball Reference URL to a game page
+        :return: returns a record of game data
+        """
+
+        logger.debug(f"\tScraping {game_url}")
+        game_data = await self.scrape(game_url, self._parser._parse_game_data)
+
+        return tag_game_data(game_url, game_data)
+
+    async def _scrape_player_stats_data(
+        self, game_url: str
+    ) -> list[PlayerStatRecord]:
+        """
+        Scrapes the player stats data for the given game web page.
+        :game_url: a Basketball Reference URL to a game page
+        :return: returns a list of records of player stats data
+        """
+
+        logger.debug(f"\tScraping {game_url}")
+        player_stats_data = await self.scrape(
+            game_url, self._parser._parse_player_stats_data
+        )
+
+        return tag_player_stats_data(game_url, player_stats_data)
+
+    async def _scrape_game_and_player_stats_data(
+        self, game_url: str
+    ) -> tuple[GameRecord, list[PlayerStatRecord]]:
+        """
+        Scrapes the game data and the player stats data for the given
+        game web page.
+        :game_url: a Basketball Reference URL to a game page
+        :return: returns a tuple (game data, list of player stats data)
+        """
+
+        logger.debug(f"\tScraping {game_url}")
+        data = await self.scrape(
+            game_url, self._parser._parse_game_and_player_stats_data
+        )
+
+        return tag_game_and_player_stats_data(game_url, data)
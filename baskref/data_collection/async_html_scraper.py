@@ -0,0 +1,199 @@
+"""
+This page contains the asyncio counterpart of the HTMLScraper class.
+It requires the optional aiohttp dependency (pip install baskref[async]).
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+from baskref.data_collection.html_scraper import HTMLScraper, retry_delay
+from baskref.data_collection.rate_limiter import RateLimiter, Backoff
+from baskref.data_collection.user_agents import (
+    UserAgentPool,
+    default_user_agent_pool,
+)
+from baskref.data_collection.parser_backends import (
+    make_soup,
+    validate_backend,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+# pylint: disable=protected-access
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncResponse:
+    """The parts of a HTTP response needed by the scrapers"""
+
+    url: str
+    status_code: int
+    text: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class AsyncHTMLScraper:  # pylint: disable=too-many-instance-attributes
+    """
+    Class for scraping the web with asyncio.
+    All requests are multiplexed on one event loop through self.session.
+    At most max_concurrency requests are in flight at the same time.
+    The rate limiter and the backoff policy work like in HTMLScraper.
+    """
+
+    proxy: str | None = None
+    max_concurrency: int = 10
+    session: Any = field(default=None, repr=False, compare=False)
+    rate_limiter: RateLimiter | None = field(default=None, compare=False)
+    backoff: Backoff = field(default_factory=Backoff)
+    parser: str = "html.parser"
+    user_agents: UserAgentPool = field(
+        default_factory=default_user_agent_pool, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "The async scrapers require aiohttp. "
+                "Install it with: pip install baskref[async]"
+            )
+
+        if not isinstance(self.max_concurrency, int) or (
+            self.max_concurrency < 1
+        ):
+            raise ValueError("max_concurrency has to be at least 1")
+
+        validate_backend(self.parser)
+
+        self._owns_session = self.session is None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def __aenter__(self) -> "AsyncHTMLScraper":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the session if it was created by the scraper"""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def scrape(self, url: str, parser_fun: Callable) -> Any:
+        """
+        This function lays out the skeleton for scraping.
+        First sends a GET request to the provided url and then uses
+        the provided function to parse out the wanted data.
+        """
+
+        try:
+            page = await self.get_page_logic(url)
+        except aiohttp.ClientProxyConnectionError as p_err:
+            logger.info(f"A Proxy Error occurred {p_err}. Trying again!")
+            page = await self.get_page_logic(url)
+
+        soup = make_soup(page.text, self.parser)
+        return parser_fun(soup)
+
+    async def get_page(
+        self, url: str, rand_agent: bool = False
+    ) -> AsyncResponse:
+        """
+        This function sends a GET request to scrape a static webpage.
+        Waits for a free slot if max_concurrency requests are in flight.
+        """
+
+        user_agent = self.user_agents.next() if rand_agent else None
+        headers = {"User-Agent": user_agent} if user_agent else None
+
+        async with self._get_semaphore():
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+
+            async with self._get_session().get(
+                url, proxy=self.proxy, headers=headers
+            ) as resp:
+                page = AsyncResponse(
+                    url, resp.status, await resp.text(), resp.headers
+                )
+
+        if user_agent is not None:
+            self.user_agents.record(user_agent, page.status_code < 400)
+
+        return page
+
+    async def get_page_logic(self, url: str) -> AsyncResponse:
+        """
+        This function scrapes a static webpage from the web.
+        It implements the same strategy as HTMLScraper.get_page_logic
+        (see retry_delay).
+
+        If the response status code is ok (200-300)
+        the function returns an AsyncResponse object.
+        Else it raises an error.
+        """
+
+        page = await self.get_page(url)
+
+        attempt = 0
+        while not HTMLScraper._is_success_code(page.status_code):
+            delay = retry_delay(url, page, attempt, self.backoff, self.proxy)
+            if delay > 0:
+                await self._wait(delay)
+
+            page = await self.get_page(url, rand_agent=True)
+            attempt += 1
+
+        return page
+
+    async def _wait(self, seconds: float) -> None:
+        """
+        Waits before retrying a request. With a rate limiter all the
+        requests sharing it are held back, not just the current one.
+        """
+
+        if self.rate_limiter is None:
+            await asyncio.sleep(seconds)
+        else:
+            self.rate_limiter.pause(seconds)
+
+    async def _gather(self, coros: Iterable[Awaitable]) -> list:
+        """
+        Runs all the coroutines concurrently and returns the results in
+        the same order as the coroutines. The exception of the first failing
+        coroutine is raised and the remaining ones are cancelled.
+        """
+
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+
+        try:
+            return [await task for task in tasks]
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _get_session(self) -> Any:
+        """Creates the session on first use (it needs a running loop)"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+            )
+        return self.session
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Creates the semaphore on first use (it needs a running loop)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
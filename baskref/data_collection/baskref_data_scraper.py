@@ -6,84 +6,378 @@ Author: Dominik Zulovec Sajovic, May 2022
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from urllib import parse
+from functools import lru_cache
+import multiprocessing
+from typing import Any, Iterable, Iterator, Mapping
 from bs4 import BeautifulSoup
 import baskref.data_collection.html_scraper as scr
-from baskref.utils import str_to_datetime, num, broadcast, join_list_dics
+from baskref.data_collection.parser_backends import make_soup
+from baskref.data_collection.page_archive import PageArchive
+from baskref.data_collection.records import GameRecord, PlayerStatRecord
+from baskref.data_collection.table_extractor import (
+    Column,
+    read_cells,
+    extract_columns,
+    empty_columns,
+    prefix_columns,
+)
+from baskref.utils import (
+    str_to_datetime,
+    num,
+    parse_game_id,
+)
 
 logger = logging.getLogger(__name__)
 
 
+TEAM_BASIC_STATS: tuple[Column, ...] = (
+    Column("fg", "fg", int),
+    Column("fga", "fga", int),
+    Column("fg_pct", "fg_pct", float, 0.0),
+    Column("fg3", "fg3", int),
+    Column("fg3a", "fg3a", int),
+    Column("fg3_pct", "fg3_pct", float, 0.0),
+    Column("ft", "ft", int),
+    Column("fta", "fta", int),
+    Column("ft_pct", "ft_pct", float, 0.0),
+    Column("orb", "orb", int),
+    Column("drb", "drb", int),
+    Column("trb", "trb", int),
+    Column("ast", "ast", int),
+    Column("stl", "stl", int),
+    Column("blk", "blk", int),
+    Column("tov", "tov", int),
+    Column("pf", "pf", int),
+    Column("pts", "pts", int),
+)
+
+TEAM_ADVANCED_STATS: tuple[Column, ...] = (
+    Column("ts_pct", "ts_pct", float),
+    Column("efg_pct", "efg_pct", float),
+    Column("fg3a_per_fga_pct", "fg3a_per_fga_pct", float),
+    Column("fta_per_fga_pct", "fta_per_fga_pct", float),
+    Column("orb_pct", "orb_pct", float),
+    Column("drb_pct", "drb_pct", float),
+    Column("trb_pct", "trb_pct", float),
+    Column("ast_pct", "ast_pct", float),
+    Column("stl_pct", "stl_pct", float),
+    Column("blk_pct", "blk_pct", float),
+    Column("tov_pct", "tov_pct", float),
+    Column("off_rtg", "off_rtg", float),
+    Column("def_rtg", "def_rtg", float),
+)
+
+# the team stats columns with the names prefixed by home_ or away_
+TEAM_BASIC_COLUMNS: dict[str, tuple[Column, ...]] = {
+    team: prefix_columns(TEAM_BASIC_STATS, f"{team}_")
+    for team in ("home", "away")
+}
+
+TEAM_ADVANCED_COLUMNS: dict[str, tuple[Column, ...]] = {
+    team: prefix_columns(TEAM_ADVANCED_STATS, f"{team}_")
+    for team in ("home", "away")
+}
+
+PLAYER_COLUMNS: tuple[Column, ...] = (
+    Column("player_name", "player", str),
+    Column("player_id", "player", str, attr="data-append-csv"),
+)
+
+PLAYER_BASIC_COLUMNS: tuple[Column, ...] = (
+    Column("mp", "mp", str),
+    Column("fg", "fg", num),
+    Column("fga", "fga", num),
+    Column("fg_pct", "fg_pct", num),
+    Column("fg3", "fg3", num),
+    Column("fg3a", "fg3a", num),
+    Column("fg3_pct", "fg3_pct", num),
+    Column("ft", "ft", num),
+    Column("fta", "fta", num),
+    Column("ft_pct", "ft_pct", num),
+    Column("orb", "orb", num),
+    Column("drb", "drb", num),
+    Column("trb", "trb", num),
+    Column("ast", "ast", num),
+    Column("stl", "stl", num),
+    Column("blk", "blk", num),
+    Column("tov", "tov", num),
+    Column("pf", "pf", num),
+    Column("pts", "pts", num),
+    Column("plsmin", "plus_minus", num),
+)
+
+PLAYER_ADVANCED_COLUMNS: tuple[Column, ...] = (
+    Column("ts_pct", "ts_pct", num),
+    Column("efg_pct", "efg_pct", num),
+    Column("fg3a_per_fga_pct", "fg3a_per_fga_pct", num),
+    Column("fta_per_fga_pct", "fta_per_fga_pct", num),
+    Column("orb_pct", "orb_pct", num),
+    Column("drb_pct", "drb_pct", num),
+    Column("trb_pct", "trb_pct", num),
+    Column("ast_pct", "ast_pct", num),
+    Column("stl_pct", "stl_pct", num),
+    Column("blk_pct", "blk_pct", num),
+    Column("tov_pct", "tov_pct", num),
+    Column("usg_pct", "usg_pct", num),
+    Column("off_rtg", "off_rtg", num),
+    Column("def_rtg", "def_rtg", num),
+)
+
+
 @dataclass
 class BaskRefDataScraper(scr.HTMLScraper):
-    """Class for scraping & Parsing basketball-reference.com data"""
+    """
+    Class for scraping & Parsing basketball-reference.com data
+    :parse_workers: number of processes parsing the game pages. With 0
+        (default) the pages are parsed by the workers downloading them,
+        otherwise the workers only download the raw html and the parsing
+        is spread over a pool of processes (not limited by the GIL).
+    :archive: if set, the html of every downloaded game page is stored
+        in the archive
+    :offline: if True the game pages are read from the archive instead
+        of being downloaded (no requests are sent)
+    """
+
+    parse_workers: int = 0
+    archive: PageArchive | None = None
+    offline: bool = False
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        if not isinstance(self.parse_workers, int) or self.parse_workers < 0:
+            raise ValueError("The number of parse workers can't be negative")
+
+        if self.offline and self.archive is None:
+            raise ValueError("The offline mode requires an archive")
+
+    def fetch(self, url: str) -> str:
+        """
+        Returns the raw html of the game page. The page is read from the
+        archive in the offline mode and stored in it otherwise.
+        """
+
+        game_id = self._parse_game_id(url)
+
+        if self.offline:
+            html = self.archive.load(game_id) if self.archive else None
+            if html is None:
+                scr.raise_scraping_error(url, 404)
+            return html
+
+        html = super().fetch(url)
+        if self.archive is not None:
+            self.archive.store(game_id, html)
+
+        return html
 
     # public functions
 
-    def get_games_data(self, game_urls: list) -> list:
+    def get_games_data(self, game_urls: list) -> list[GameRecord]:
         """
         Scrapes the game data for all the game urls provided
         :game_urls: list of box score game urls from basketball reference
-        :return: returns a list of dictionaries with game data
+        :return: returns a list of game records (see GameRecord) with
+            game data
         """
 
-        return [self._scrape_game_data(url) for url in game_urls]
+        return list(self.iter_games_data(game_urls))
 
-    def get_player_stats_data(self, game_urls: list) -> list:
+    def get_player_stats_data(self, game_urls: list) -> list[PlayerStatRecord]:
         """
         Scrapes the player stats data for all the game urls provided.
         :game_urls: list of box score game urls from basketball reference
-        :return: returns a list of dictionaries with plaayer stats data
+        :return: returns a list of player stat records
+            (see PlayerStatRecord) with player stats data
+        """
+
+        return [
+            pl
+            for pl_stats in self.iter_player_stats_data(game_urls)
+            for pl in pl_stats
+        ]
+
+    def get_games_and_player_stats_data(
+        self, game_urls: list
+    ) -> tuple[list[GameRecord], list[PlayerStatRecord]]:
+        """
+        Scrapes the game data and the player stats data for all the game
+        urls provided. Every game page is downloaded and parsed only once.
+        :game_urls: list of box score game urls from basketball reference
+        :return: returns a tuple of two lists of records
+            (game data, player stats data)
+        """
+
+        games = list(self.iter_games_and_player_stats_data(game_urls))
+
+        return (
+            [game for game, _ in games],
+            [pl for _, pl_stats in games for pl in pl_stats],
+        )
+
+    def iter_games_data(
+        self, game_urls: Iterable[str]
+    ) -> Iterator[GameRecord]:
+        """
+        Lazy version of get_games_data.
+        :game_urls: box score game urls from basketball reference
+        :return: yields the game data of every game as soon as it's scraped
         """
 
-        pl_stats = [self._scrape_player_stats_data(url) for url in game_urls]
-        return [pl for game in pl_stats for pl in game]
+        if not self.parse_workers:
+            return self._imap(self._scrape_game_data, game_urls)
+
+        return (
+            tag_game_data(url, game_data)
+            for url, game_data in self._imap_parse_pool(
+                game_urls, "_parse_game_data"
+            )
+        )
+
+    def iter_player_stats_data(
+        self, game_urls: Iterable[str]
+    ) -> Iterator[list[PlayerStatRecord]]:
+        """
+        Lazy version of get_player_stats_data.
+        :game_urls: box score game urls from basketball reference
+        :return: yields the list of player stats of every game as soon as
+            it's scraped
+        """
+
+        if not self.parse_workers:
+            return self._imap(self._scrape_player_stats_data, game_urls)
+
+        return (
+            tag_player_stats_data(url, player_stats_data)
+            for url, player_stats_data in self._imap_parse_pool(
+                game_urls, "_parse_player_stats_data"
+            )
+        )
+
+    def iter_games_and_player_stats_data(
+        self, game_urls: Iterable[str]
+    ) -> Iterator[tuple[GameRecord, list[PlayerStatRecord]]]:
+        """
+        Lazy version of get_games_and_player_stats_data.
+        :game_urls: box score game urls from basketball reference
+        :return: yields a tuple (game data, list of player stats data) for
+            every game as soon as it's scraped
+        """
+
+        if not self.parse_workers:
+            return self._imap(
+                self._scrape_game_and_player_stats_data, game_urls
+            )
+
+        return (
+            tag_game_and_player_stats_data(url, data)
+            for url, data in self._imap_parse_pool(
+                game_urls, "_parse_game_and_player_stats_data"
+            )
+        )
 
     # Private Methods
 
     ## scraping functions
 
-    def _scrape_game_data(self, game_url: str) -> dict:
+    def _scrape_game_data(self, game_url: str) -> GameRecord:
         """
         Scrapes the game data for the given game web page.
         :game_url: a Basketball Reference URL to a game page
-        :return: returns a dictionary of game data
+        :return: returns a record of game data
         """
 
         logger.debug(f"\tScraping {game_url}")
         game_data = self.scrape(game_url, self._parse_game_data)
-        game_data["game_id"] = self._parse_game_id(game_url)
-        game_data["game_url"] = game_url
 
-        return game_data
+        return tag_game_data(game_url, game_data)
 
-    def _scrape_player_stats_data(self, game_url: str) -> dict:
+    def _scrape_player_stats_data(
+        self, game_url: str
+    ) -> list[PlayerStatRecord]:
         """
         Scrapes the player stats data for the given game web page.
         :game_url: a Basketball Reference URL to a game page
-        :return: returns a dictionary of player stats data
+        :return: returns a list of records of player stats data
         """
 
         logger.debug(f"\tScraping {game_url}")
         player_stats_data = self.scrape(
             game_url, self._parse_player_stats_data
         )
-        game_id = self._parse_game_id(game_url)
 
-        for pl_stat in player_stats_data:
-            pl_stat["game_id"] = game_id
-            pl_stat["game_url"] = game_url
+        return tag_player_stats_data(game_url, player_stats_data)
+
+    def _scrape_game_and_player_stats_data(
+        self, game_url: str
+    ) -> tuple[GameRecord, list[PlayerStatRecord]]:
+        """
+        Scrapes the game data and the player stats data for the given
+        game web page.
+        :game_url: a Basketball Reference URL to a game page
+        :return: returns a tuple (game data, list of player stats data)
+        """
+
+        logger.debug(f"\tScraping {game_url}")
+        data = self.scrape(game_url, self._parse_game_and_player_stats_data)
 
-        return player_stats_data
+        return tag_game_and_player_stats_data(game_url, data)
+
+    def _fetch_game_page(self, game_url: str) -> tuple[str, str]:
+        """Downloads the game web page and returns (game url, raw html)"""
+
+        logger.debug(f"\tScraping {game_url}")
+        return game_url, self.fetch(game_url)
+
+    def _imap_parse_pool(
+        self, game_urls: Iterable[str], parse_fun_name: str
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Producer / consumer pipeline: the workers download the raw html of
+        the game pages and a pool of parse_workers processes parses them
+        with the parsing method named parse_fun_name. Both stages work
+        ahead of the consumer by a bounded number of pages.
+        :return: yields tuples (game url, parsed data) in the same order
+            as the game urls
+        """
+
+        pages = self._imap(self._fetch_game_page, game_urls)
+        jobs = (
+            (self.parser, parse_fun_name, url, html) for url, html in pages
+        )
+
+        # spawned (not forked) workers, the process runs download threads
+        with ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            yield from scr.ordered_imap(
+                executor, _parse_game_page, jobs, 2 * self.parse_workers
+            )
 
     ## parsing functions
 
-    def _parse_game_data(self, game_page: BeautifulSoup) -> dict:
+    def _parse_game_and_player_stats_data(
+        self, game_page: BeautifulSoup
+    ) -> tuple[GameRecord, list[PlayerStatRecord]]:
+        """
+        Parses the game data and the player stats data out of the same
+        game web page.
+        :return: returns a tuple (game data, list of player stats data)
+        """
+
+        return (
+            self._parse_game_data(game_page),
+            self._parse_player_stats_data(game_page),
+        )
+
+    def _parse_game_data(self, game_page: BeautifulSoup) -> GameRecord:
         """
         Parses the game data for the given game web page.
         :game_url: a Basketball Reference URL to a game page
-        :return: returns a dictionary of game data
+        :return: returns a record of game data
         """
 
         # Team names
@@ -111,17 +405,17 @@ class BaskRefDataScraper(scr.HTMLScraper):
             game_page, "away", away_team_sn
         )
 
-        return {
-            "home_team": home_team_sn,
-            "away_team": away_team_sn,
-            "home_team_full_name": home_team_fn,
-            "away_team_full_name": away_team_fn,
+        return GameRecord(
+            home_team=home_team_sn,
+            away_team=away_team_sn,
+            home_team_full_name=home_team_fn,
+            away_team_full_name=away_team_fn,
             **meta_data,
             **home_basic_dic,
             **away_basic_dic,
             **home_advanced_dic,
             **away_advanced_dic,
-        }
+        )
 
     def _parse_team_name(
         self, html: BeautifulSoup, team: str
@@ -171,7 +465,7 @@ class BaskRefDataScraper(scr.HTMLScraper):
 
         special_title_data = self._parse_special_title_data(html)
 
-        attendance = self._parse_attendance(html)
+        attendance = self._parse_attendance(self._parse_game_info(html))
 
         return {
             "game_time": game_time,
@@ -259,24 +553,47 @@ class BaskRefDataScraper(scr.HTMLScraper):
             "playoff_game_number": playoff_game_number,
         }
 
-    def _parse_attendance(self, html: BeautifulSoup) -> int | None:
+    def _parse_game_info(self, html: BeautifulSoup) -> dict[str, str]:
         """
-        Provided the BR game page it parses out the game attendance.
-        Sometimes the page doesn't include attendance in which case the
-        method returns None.
-        :return: attendance as an integer
+        Provided the BR game page it parses out the labelled game info
+        below the box scores (e.g. <div><strong>Attendance:</strong>
+        17,358</div>). Only the blocks of the page content without an id
+        are searched for the labels (at any depth), the sections of the
+        stats tables (id="all_...") are never visited.
+        :return: dictionary of label: value
+            {"Officials": "Scott Foster, ...", "Attendance": "17,358"}
+            empty if the page has no content
         """
 
-        if "Attendance" not in html.text:
-            return None
+        game_info: dict[str, str] = {}
+        content = html.select_one("#content")
+        if content is None:
+            return game_info
 
-        cont = str(html.text.encode("ascii", "replace"))
+        for block in content.find_all("div", recursive=False):
+            if block.get("id") is not None:
+                continue
 
-        attendance_text = cont[
-            cont.index("Attendance") : cont.index("Attendance") + 20
-        ]
+            for strong in block.find_all("strong"):
+                label = strong.text.replace("\xa0", " ").strip()
+                if not label.endswith(":") or strong.parent is None:
+                    continue
 
-        digits = [s for s in attendance_text if s.isdigit()]
+                row = strong.parent.text.replace("\xa0", " ")
+                value = row.split(label, 1)[-1]
+                game_info[label[:-1].strip()] = value.strip()
+
+        return game_info
+
+    def _parse_attendance(self, game_info: dict[str, str]) -> int | None:
+        """
+        Provided the game info (see _parse_game_info) it parses out the
+        game attendance. Sometimes the page doesn't include attendance in
+        which case the method returns None.
+        :return: attendance as an integer
+        """
+
+        digits = [s for s in game_info.get("Attendance", "") if s.isdigit()]
 
         if len(digits) == 0:
             return None
@@ -289,13 +606,11 @@ class BaskRefDataScraper(scr.HTMLScraper):
         :return: game id as a string.
         """
 
-        return (
-            parse.urlsplit(game_url).path.split("/")[-1].replace(".html", "")
-        )
+        return parse_game_id(game_url)
 
     def _parse_basic_stats(
         self, page: BeautifulSoup, team: str, team_sn: str
-    ) -> dict[str, int | float]:
+    ) -> Mapping[str, int | float | None]:
         """
         Provided the BR game page it parses out the basic stats
         for either the home or the road team, depending on the
@@ -304,43 +619,15 @@ class BaskRefDataScraper(scr.HTMLScraper):
         :return: dictionary of basic stats
         """
 
-        table_finder = f"#box-{team_sn.upper()}-game-basic"
-
-        table = page.select_one(table_finder)
-        tb_foot = table.select_one("tfoot")
-
-        game_dic = {
-            f"{team}_fg": int(tb_foot.select_one("td[data-stat=fg]").text),
-            f"{team}_fga": int(tb_foot.select_one("td[data-stat=fga]").text),
-            f"{team}_fg_pct": float(
-                tb_foot.select_one("td[data-stat=fg_pct]").text
-            ),
-            f"{team}_fg3": int(tb_foot.select_one("td[data-stat=fg3]").text),
-            f"{team}_fg3a": int(tb_foot.select_one("td[data-stat=fg3a]").text),
-            f"{team}_fg3_pct": float(
-                tb_foot.select_one("td[data-stat=fg3_pct]").text
-            ),
-            f"{team}_ft": int(tb_foot.select_one("td[data-stat=ft]").text),
-            f"{team}_fta": int(tb_foot.select_one("td[data-stat=fta]").text),
-            f"{team}_ft_pct": float(
-                tb_foot.select_one("td[data-stat=ft_pct]").text or 0
-            ),
-            f"{team}_orb": int(tb_foot.select_one("td[data-stat=orb]").text),
-            f"{team}_drb": int(tb_foot.select_one("td[data-stat=drb]").text),
-            f"{team}_trb": int(tb_foot.select_one("td[data-stat=trb]").text),
-            f"{team}_ast": int(tb_foot.select_one("td[data-stat=ast]").text),
-            f"{team}_stl": int(tb_foot.select_one("td[data-stat=stl]").text),
-            f"{team}_blk": int(tb_foot.select_one("td[data-stat=blk]").text),
-            f"{team}_tov": int(tb_foot.select_one("td[data-stat=tov]").text),
-            f"{team}_pf": int(tb_foot.select_one("td[data-stat=pf]").text),
-            f"{team}_pts": int(tb_foot.select_one("td[data-stat=pts]").text),
-        }
-
-        return game_dic
+        return self._parse_team_stats(
+            page,
+            f"#box-{team_sn.upper()}-game-basic",
+            TEAM_BASIC_COLUMNS[team],
+        )
 
     def _parse_advanced_stats(
         self, page: BeautifulSoup, team: str, team_sn: str
-    ) -> dict[str, int | float]:
+    ) -> Mapping[str, int | float | None]:
         """
         Provided the BR game page it parses out the advanced stats
         for either the home or the road team, depending on the
@@ -349,283 +636,150 @@ class BaskRefDataScraper(scr.HTMLScraper):
         :return: dictionary of basic stats
         """
 
-        table_finder = f"#box-{team_sn.upper()}-game-advanced"
+        return self._parse_team_stats(
+            page,
+            f"#box-{team_sn.upper()}-game-advanced",
+            TEAM_ADVANCED_COLUMNS[team],
+        )
+
+    def _parse_team_stats(
+        self,
+        page: BeautifulSoup,
+        table_finder: str,
+        columns: tuple[Column, ...],
+    ) -> Mapping[str, int | float | None]:
+        """
+        Provided the BR game page it parses out the team totals from the
+        footer of the stats table. The footer row is read only once.
+        If the page doesn't have the table (old games have no advanced
+        stats) all the stats are None.
+        :table_finder: css selector of the stats table
+        :columns: specification of the stats columns
+        :return: dictionary of team stats
+        """
 
         table = page.select_one(table_finder)
-        tb_foot = table.select_one("tfoot")
-
-        game_dic = {
-            f"{team}_ts_pct": float(
-                tb_foot.select_one("td[data-stat=ts_pct]").text
-            ),
-            f"{team}_efg_pct": float(
-                tb_foot.select_one("td[data-stat=efg_pct]").text
-            ),
-            f"{team}_fg3a_per_fga_pct": float(
-                tb_foot.select_one("td[data-stat=fg3a_per_fga_pct]").text
-            ),
-            f"{team}_fta_per_fga_pct": float(
-                tb_foot.select_one("td[data-stat=fta_per_fga_pct]").text
-            ),
-            f"{team}_orb_pct": float(
-                tb_foot.select_one("td[data-stat=orb_pct]").text
-            ),
-            f"{team}_drb_pct": float(
-                tb_foot.select_one("td[data-stat=drb_pct]").text
-            ),
-            f"{team}_trb_pct": float(
-                tb_foot.select_one("td[data-stat=trb_pct]").text
-            ),
-            f"{team}_ast_pct": float(
-                tb_foot.select_one("td[data-stat=ast_pct]").text
-            ),
-            f"{team}_stl_pct": float(
-                tb_foot.select_one("td[data-stat=stl_pct]").text
-            ),
-            f"{team}_blk_pct": float(
-                tb_foot.select_one("td[data-stat=blk_pct]").text
-            ),
-            f"{team}_tov_pct": float(
-                tb_foot.select_one("td[data-stat=tov_pct]").text
-            ),
-            f"{team}_off_rtg": float(
-                tb_foot.select_one("td[data-stat=off_rtg]").text
-            ),
-            f"{team}_def_rtg": float(
-                tb_foot.select_one("td[data-stat=def_rtg]").text
-            ),
-        }
+        if table is None:
+            return empty_columns(columns)
 
-        return game_dic
+        return extract_columns(
+            read_cells(table.select_one("tfoot > tr")), columns
+        )
 
-    def _parse_player_stats_data(self, game_page: BeautifulSoup) -> list[dict]:
+    def _parse_player_stats_data(
+        self, game_page: BeautifulSoup
+    ) -> list[PlayerStatRecord]:
         """
         Parses the player stats data for the given game web page.
         :game_url: a Basketball Reference URL to a game page
-        :return: returns a dictionary of game data
+        :return: returns a list of records of player stats data (the home
+            players first, in the order of the box score)
         """
 
         _, home_team_sn = self._parse_team_name(game_page, "home")
         _, away_team_sn = self._parse_team_name(game_page, "away")
 
-        # basic stats
-        home_basic_dic = self._parse_player_basic_stats(
-            game_page, home_team_sn
-        )
-        home_basic_dic = broadcast(home_basic_dic, "team", home_team_sn)
+        return [
+            *self._parse_team_player_stats(game_page, home_team_sn),
+            *self._parse_team_player_stats(game_page, away_team_sn),
+        ]
 
-        away_basic_dic = self._parse_player_basic_stats(
-            game_page, away_team_sn
-        )
-        away_basic_dic = broadcast(away_basic_dic, "team", away_team_sn)
+    def _parse_team_player_stats(
+        self, page: BeautifulSoup, team_sn: str
+    ) -> list[PlayerStatRecord]:
+        """
+        Provided the BR game page it parses out the stats of the players
+        of the team, joining its basic and advanced stats tables on the
+        player id in one pass. The first row of a player creates the
+        record of the player (indexed by the player id) and the rows of
+        the other table fill their stats into it, so the players keep the
+        order of the box score. The stats of the players missing in one of
+        the tables (old games have no advanced stats table) are None.
+        :team_sn: short name of the team
+        :return: list of records of player stats
+        """
 
-        # advanced stats
-        home_advanced_dic = self._parse_player_advanced_stats(
-            game_page, home_team_sn
-        )
+        players: dict[str, PlayerStatRecord] = {}
 
-        away_advanced_dic = self._parse_player_advanced_stats(
-            game_page, away_team_sn
-        )
+        for table_type, columns in [
+            ("basic", PLAYER_BASIC_COLUMNS),
+            ("advanced", PLAYER_ADVANCED_COLUMNS),
+        ]:
+            table = page.select_one(
+                f"#box-{team_sn.upper()}-game-{table_type}"
+            )
+            if table is None:
+                continue
 
-        # join basic and advanced
-        home_players = join_list_dics(
-            home_basic_dic, home_advanced_dic, "player_id"
-        )
+            for row in table.select("tbody > tr:not([class='thead'])"):
+                cells = read_cells(row)
+                player = extract_columns(cells, PLAYER_COLUMNS)
 
-        away_players = join_list_dics(
-            away_basic_dic, away_advanced_dic, "player_id"
-        )
+                record = players.get(player["player_id"])
+                if record is None:
+                    record = PlayerStatRecord(team=team_sn, **player)
+                    players[player["player_id"]] = record
 
-        return [
-            *home_players,
-            *away_players,
-        ]
+                # players who did not play have a reason instead of stats
+                if "reason" not in cells:
+                    extract_columns(cells, columns, record)
 
-    def _parse_player_basic_stats(
-        self, page: BeautifulSoup, team_sn: str
-    ) -> list[dict[str, int | float]]:
-        """
-        Provided the BR game page it parses out the basic stats
-        for either the home or the road team, depending on the
-        passed parameter.
-        :team: inidcates if it team is home or away
-        :return: dictionary of basic stats
-        """
+        return list(players.values())
 
-        table_finder = f"#box-{team_sn.upper()}-game-basic"
 
-        table = page.select_one(table_finder)
-        pl_trs = table.select("tbody > tr[class!='thead']")
+def tag_game_data(game_url: str, game_data: GameRecord) -> GameRecord:
+    """Adds the game id and the game url to the game data"""
 
-        return [self._parse_player_basic_stats_row(pl_tr) for pl_tr in pl_trs]
+    game_data["game_id"] = parse_game_id(game_url)
+    game_data["game_url"] = game_url
 
-    def _parse_player_basic_stats_row(self, row: BeautifulSoup) -> dict:
-        """
-        Provided a row from the BR game page it parses out the basic stats
-        :team: inidcates if it team is home or away
-        :return: dictionary of basic stats
-        """
+    return game_data
 
-        player_name = row.select_one("th[data-stat=player]").text
-        player_id = row.select_one("th[data-stat=player]").attrs[
-            "data-append-csv"
-        ]
 
-        dnp = bool(row.select_one("td[data-stat=reason]"))
+def tag_player_stats_data(
+    game_url: str, player_stats_data: list[PlayerStatRecord]
+) -> list[PlayerStatRecord]:
+    """Adds the game id and the game url to every player stats row"""
 
-        return {
-            "player_name": player_name,
-            "player_id": player_id,
-            "mp": None
-            if dnp
-            else (row.select_one("td[data-stat=mp]").text or None),
-            "fg": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fg]").text or None)),
-            "fga": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fga]").text or None)),
-            "fg_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fg_pct]").text or None)),
-            "fg3": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fg3]").text or None)),
-            "fg3a": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fg3a]").text or None)),
-            "fg3_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fg3_pct]").text or None)),
-            "ft": None
-            if dnp
-            else (num(row.select_one("td[data-stat=ft]").text or None)),
-            "fta": None
-            if dnp
-            else (num(row.select_one("td[data-stat=fta]").text or None)),
-            "ft_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=ft_pct]").text or None)),
-            "orb": None
-            if dnp
-            else (num(row.select_one("td[data-stat=orb]").text or None)),
-            "drb": None
-            if dnp
-            else (num(row.select_one("td[data-stat=drb]").text or None)),
-            "trb": None
-            if dnp
-            else (num(row.select_one("td[data-stat=trb]").text or None)),
-            "ast": None
-            if dnp
-            else (num(row.select_one("td[data-stat=ast]").text or None)),
-            "stl": None
-            if dnp
-            else (num(row.select_one("td[data-stat=stl]").text or None)),
-            "blk": None
-            if dnp
-            else (num(row.select_one("td[data-stat=blk]").text or None)),
-            "tov": None
-            if dnp
-            else (num(row.select_one("td[data-stat=tov]").text or None)),
-            "pf": None
-            if dnp
-            else (num(row.select_one("td[data-stat=pf]").text or None)),
-            "pts": None
-            if dnp
-            else (num(row.select_one("td[data-stat=pts]").text or None)),
-            "plsmin": None
-            if dnp
-            else (
-                num(row.select_one("td[data-stat=plus_minus]").text or None)
-            ),
-        }
+    game_id = parse_game_id(game_url)
 
-    def _parse_player_advanced_stats(
-        self, page: BeautifulSoup, team_sn: str
-    ) -> list[dict[str, int | float]]:
-        """
-        Provided the BR game page it parses out the advanced stats
-        for either the home or the road team, depending on the
-        passed parameter.
-        :team: inidcates if it team is home or away
-        :return: dictionary of basic stats
-        """
+    for pl_stat in player_stats_data:
+        pl_stat["game_id"] = game_id
+        pl_stat["game_url"] = game_url
 
-        table_finder = f"#box-{team_sn.upper()}-game-advanced"
+    return player_stats_data
 
-        table = page.select_one(table_finder)
-        pl_trs = table.select("tbody > tr[class!='thead']")
 
-        return [self._parse_player_adv_stats_row(pl_tr) for pl_tr in pl_trs]
+def tag_game_and_player_stats_data(
+    game_url: str, data: tuple[GameRecord, list[PlayerStatRecord]]
+) -> tuple[GameRecord, list[PlayerStatRecord]]:
+    """Adds the game id and the game url to the game and player rows"""
 
-    def _parse_player_adv_stats_row(self, row: BeautifulSoup) -> dict:
-        """
-        Provided a row from the BR game page it parses out the advanced stats
-        :team: inidcates if it team is home or away
-        :return: dictionary of basic stats
-        """
+    game_data, player_stats_data = data
 
-        player_name = row.select_one("th[data-stat=player]").text
-        player_id = row.select_one("th[data-stat=player]").attrs[
-            "data-append-csv"
-        ]
+    return (
+        tag_game_data(game_url, game_data),
+        tag_player_stats_data(game_url, player_stats_data),
+    )
 
-        dnp = bool(row.select_one("td[data-stat=reason]"))
 
-        return {
-            "player_name": player_name,
-            "player_id": player_id,
-            "ts_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=ts_pct]").text or None)),
-            "efg_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=efg_pct]").text or None)),
-            "fg3a_per_fga_pct": None
-            if dnp
-            else (
-                num(
-                    row.select_one("td[data-stat=fg3a_per_fga_pct]").text
-                    or None
-                )
-            ),
-            "fta_per_fga_pct": None
-            if dnp
-            else (
-                num(
-                    row.select_one("td[data-stat=fta_per_fga_pct]").text
-                    or None
-                )
-            ),
-            "orb_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=orb_pct]").text or None)),
-            "drb_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=drb_pct]").text or None)),
-            "trb_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=trb_pct]").text or None)),
-            "ast_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=ast_pct]").text or None)),
-            "stl_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=stl_pct]").text or None)),
-            "blk_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=blk_pct]").text or None)),
-            "tov_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=tov_pct]").text or None)),
-            "usg_pct": None
-            if dnp
-            else (num(row.select_one("td[data-stat=usg_pct]").text or None)),
-            "off_rtg": None
-            if dnp
-            else (num(row.select_one("td[data-stat=off_rtg]").text or None)),
-            "def_rtg": None
-            if dnp
-            else (num(row.select_one("td[data-stat=def_rtg]").text or None)),
-        }
+@lru_cache(maxsize=None)
+def _parsing_scraper(parser: str) -> BaskRefDataScraper:
+    """The scraper whose parsing methods are used by a parsing process"""
+    return BaskRefDataScraper(parser=parser)
+
+
+def _parse_game_page(job: tuple[str, str, str, str]) -> tuple[str, Any]:
+    """
+    Parses a game page inside a parsing process.
+    :job: tuple (parser backend, name of the parsing method, game url,
+        raw html of the game page)
+    :return: tuple (game url, parsed data)
+    """
+
+    parser, parse_fun_name, game_url, html = job
+    scraper = _parsing_scraper(parser)
+
+    return game_url, scraper.parse(
+        make_soup(html, parser), getattr(scraper, parse_fun_name)
+    )
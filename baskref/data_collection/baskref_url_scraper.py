@@ -15,10 +15,30 @@ Author: Dominik Zulovec Sajovic, September 2022
 
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
+from typing import Callable, Iterable, Iterator
 from urllib import parse
 from bs4 import BeautifulSoup
 import baskref.data_collection.html_scraper as scr
+from baskref.data_collection.page_archive import parse_game_date
+from baskref.utils import season_of_date, parse_game_id
+
+
+# the names of the months in the urls of the month pages
+MONTHS: tuple[str, ...] = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
 
 
 @dataclass
@@ -51,18 +71,99 @@ class BaskRefUrlScraper(scr.HTMLScraper):
         :return: a list of basketball reference urls
         """
 
-        # scrape yearly url for monthly urls
-        monthly_urls = self._scrape_month_urls(
-            self._generate_season_games_url(year)
+        return self.get_game_urls_years([year])[year]
+
+    def get_game_urls_years(self, years: Iterable[int]) -> dict[int, list]:
+        """
+        Scrapes the urls to every game's boxscore in multiple seasons.
+        The season pages and the month pages of all the seasons are
+        scraped concurrently (with more than one worker), so the workers
+        are kept busy across the season boundaries.
+        :years: years of the seasons
+        :return: a dictionary of lists of basketball reference urls
+            by the year of the season
+        """
+
+        years = list(years)
+        return self._group_by_year(years, self.iter_game_urls_years(years))
+
+    def iter_game_urls_years(
+        self, years: Iterable[int]
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Lazy version of get_game_urls_years, which yields the game urls of
+        every month page as soon as it's scraped, while the following
+        month pages are still being scraped. This lets the scraping of the
+        box scores start without waiting for the whole list of urls.
+        :years: years of the seasons
+        :return: yields tuples (year of the season, game url)
+        """
+
+        return self._iter_game_urls_months(years)
+
+    def get_game_urls_dates(
+        self, from_date: date, to_date: date
+    ) -> dict[int, list]:
+        """
+        Scrapes the urls to every game's boxscore between two dates
+        (both included). The games are collected from the month pages of
+        the seasons covering the dates, which takes far less requests
+        than scraping the games of every day.
+        :from_date: first day of the games
+        :to_date: last day of the games
+        :return: a dictionary of lists of basketball reference urls
+            by the year of the season
+        """
+
+        years = range(season_of_date(from_date), season_of_date(to_date) + 1)
+
+        return self._group_by_year(
+            years, self.iter_game_urls_dates(from_date, to_date)
         )
 
-        # scrape monthly urls for game data
-        return [
-            gurl
-            for murl in monthly_urls
-            for gurl in self._scrape_game_urls_month(murl)
+    def iter_game_urls_dates(
+        self, from_date: date, to_date: date
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Lazy version of get_game_urls_dates (see iter_game_urls_years).
+        Only the month pages overlapping the dates are scraped.
+        :from_date: first day of the games
+        :to_date: last day of the games
+        :return: yields tuples (year of the season, game url)
+        """
+
+        years = range(season_of_date(from_date), season_of_date(to_date) + 1)
+        first_month = (from_date.year, from_date.month)
+        last_month = (to_date.year, to_date.month)
+
+        def overlaps(year: int, month_url: str) -> bool:
+            month = self._parse_month(year, month_url)
+            return month is None or first_month <= month <= last_month
+
+        for year, gurl in self._iter_game_urls_months(years, overlaps):
+            if from_date <= parse_game_date(parse_game_id(gurl)) <= to_date:
+                yield year, gurl
+
+    def iter_game_urls_days(
+        self, from_date: date, to_date: date
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Scrapes the daily pages of the dates (one page per day), which takes
+        fewer requests than the season and month pages for a few days.
+        :from_date: first day of the games
+        :to_date: last day of the games
+        :return: yields tuples (year of the season, game url)
+        """
+
+        days = [
+            from_date + timedelta(days=day)
+            for day in range((to_date - from_date).days + 1)
         ]
 
+        for day, gurls in zip(days, self._imap(self.get_game_urls_day, days)):
+            for gurl in gurls:
+                yield season_of_date(day), gurl
+
     def get_game_urls_playoffs(self, year: int) -> list:
         """
         Scrapes the urls to every game's boxscore in a specific postseason.
@@ -74,10 +175,76 @@ class BaskRefUrlScraper(scr.HTMLScraper):
             self._generate_playoff_games_url(year)
         )
 
+    def get_game_urls_playoffs_years(
+        self, years: Iterable[int]
+    ) -> dict[int, list]:
+        """
+        Scrapes the urls to every game's boxscore in multiple postseasons.
+        :years: years of the postseasons
+        :return: a dictionary of lists of basketball reference urls
+            by the year of the postseason
+        """
+
+        years = list(years)
+        return self._group_by_year(
+            years, self.iter_game_urls_playoffs_years(years)
+        )
+
+    def iter_game_urls_playoffs_years(
+        self, years: Iterable[int]
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Lazy version of get_game_urls_playoffs_years, which yields the game
+        urls of every postseason as soon as its page is scraped.
+        :years: years of the postseasons
+        :return: yields tuples (year of the postseason, game url)
+        """
+
+        years = list(years)
+        playoff_games = self._imap(
+            self._scrape_game_urls_playoffs,
+            [self._generate_playoff_games_url(year) for year in years],
+        )
+
+        for year, gurls in zip(years, playoff_games):
+            for gurl in gurls:
+                yield year, gurl
+
     # private functions
 
     ## scraping functions
 
+    def _iter_game_urls_months(
+        self,
+        years: Iterable[int],
+        month_filter: Callable[[int, str], bool] | None = None,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Scrapes the month pages of the seasons (see iter_game_urls_years).
+        :month_filter: function (year of the season, month url) deciding
+            if the month page is scraped, default: all the months
+        :return: yields tuples (year of the season, game url)
+        """
+
+        years = list(years)
+
+        # scrape yearly urls for monthly urls
+        monthly_urls = self._imap(
+            self._scrape_month_urls,
+            [self._generate_season_games_url(year) for year in years],
+        )
+        months = (
+            (year, murl)
+            for year, murls in zip(years, monthly_urls)
+            for murl in murls
+            if month_filter is None or month_filter(year, murl)
+        )
+
+        # scrape monthly urls for game data
+        for year, gurls in self._imap(self._scrape_season_month, months):
+            for gurl in gurls:
+                yield year, gurl
+
     def _scrape_game_urls_day(self, daily_games_url: str) -> list:
         """
         Scrapes the urls to every game's boxscore on a specific day.
@@ -106,6 +273,16 @@ class BaskRefUrlScraper(scr.HTMLScraper):
 
         return self.scrape(month_games_url, self._parse_monthly_games)
 
+    def _scrape_season_month(self, month: tuple[int, str]) -> tuple[int, list]:
+        """
+        Scrapes the urls to every game's boxscore in a month of a season.
+        :month: tuple (year of the season, url to the games in that month)
+        :return: tuple (year of the season, list of basketball reference urls)
+        """
+
+        year, month_games_url = month
+        return year, self._scrape_game_urls_month(month_games_url)
+
     def _scrape_game_urls_playoffs(self, playoff_games_url: str) -> list:
         """
         Scrapes the urls to every game's boxscore in a specific postseason.
@@ -166,8 +343,44 @@ class BaskRefUrlScraper(scr.HTMLScraper):
 
         return game_urls
 
+    @staticmethod
+    def _parse_month(year: int, month_url: str) -> tuple[int, int] | None:
+        """
+        Parses the month of a month page of a season
+        (e.g. /leagues/NBA_2022_games-november.html -> (2021, 11)).
+        The months from October on are in the year before the season,
+        unless the year is in the url (NBA_2020_games-october-2020.html).
+        :return: tuple (year, month) or None if it can't be parsed
+        """
+
+        page = parse.urlsplit(month_url).path.split("/")[-1]
+        month_name, _, month_year = (
+            page.removesuffix(".html").partition("_games-")[2].partition("-")
+        )
+
+        if month_name not in MONTHS:
+            return None
+
+        month = MONTHS.index(month_name) + 1
+        if month_year.isdigit():
+            return int(month_year), month
+
+        return (year - 1 if month >= 10 else year), month
+
     # # helper functions
 
+    @staticmethod
+    def _group_by_year(
+        years: Iterable[int], game_urls: Iterable[tuple[int, str]]
+    ) -> dict[int, list]:
+        """Groups the game urls by the year (every year gets a list)"""
+
+        grouped: dict[int, list] = {year: [] for year in years}
+        for year, gurl in game_urls:
+            grouped[year].append(gurl)
+
+        return grouped
+
     def _generate_season_games_url(self, year: int) -> str:
 
         """Generates the url for all games in a year"""
@@ -5,24 +5,139 @@ Author: Dominik Zulovec Sajovic, September 2022
 """
 
 
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import logging
-from typing import Callable, Any
+import threading
+import time
+from typing import Callable, Any, Iterable, Iterator, NoReturn
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ProxyError
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from baskref.data_collection.rate_limiter import RateLimiter, Backoff
+from baskref.data_collection.response_cache import ResponseCache
+from baskref.data_collection.metrics import ScrapeMetrics
+from baskref.data_collection.user_agents import (
+    UserAgentPool,
+    default_user_agent_pool,
+)
+from baskref.data_collection.parser_backends import (
+    make_soup,
+    validate_backend,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Creates a requests.Session backed by a connection pool.
+    The session is meant to be long lived and shared between scrapers,
+    so that connections (TCP + TLS handshakes) are reused between requests.
+    :pool_connections: number of hosts for which a pool is kept
+    :pool_maxsize: maximum number of connections kept per host
+    :keep_alive: if False every connection is closed after the response
+    :return: a configured requests.Session
+    """
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def ordered_imap(
+    executor: Executor, fun: Callable, items: Iterable, window: int
+) -> Iterator:
+    """
+    Submits fun(item) for every item to the executor and yields the
+    results in the same order as the items. At most window items are
+    submitted ahead of the consumer, so the results never pile up in
+    memory. The exception of the first failing item is raised and the
+    items which haven't started yet are cancelled.
+    """
+
+    futures: deque[Future] = deque()
+    try:
+        for item in items:
+            futures.append(executor.submit(fun, item))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
 @dataclass
-class HTMLScraper:
-    """Class for scraping the web"""
+class HTMLScraper:  # pylint: disable=too-many-instance-attributes
+    """
+    Class for scraping the web.
+    All requests are sent through self.session. Pass the same session to
+    multiple scrapers to share one connection pool between them. Without
+    a session one is created on the first request, so a scraper which
+    only parses pages never opens one.
+    :workers: number of pages scraped concurrently (1 means serially)
+    :rate_limiter: paces the requests (share one between the scrapers)
+    :backoff: policy for retrying requests the server throttled
+    :cache: on-disk cache of the scraped pages
+    :parser: backend used to parse the pages (see PARSER_BACKENDS)
+    :metrics: collects the timings of the requests and of the parsing
+        (share one between the scrapers)
+    :user_agents: pool of the user agents of the retried requests
+        (by default the bundled pool shared by the whole process)
+    """
 
     proxy: str | None = None
+    session: requests.Session | None = field(
+        default=None, repr=False, compare=False
+    )
+    workers: int = 1
+    rate_limiter: RateLimiter | None = field(default=None, compare=False)
+    backoff: Backoff = field(default_factory=Backoff)
+    cache: ResponseCache | None = None
+    parser: str = "html.parser"
+    metrics: ScrapeMetrics | None = field(default=None, compare=False)
+    user_agents: UserAgentPool = field(
+        default_factory=default_user_agent_pool, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError("The number of workers has to be at least 1")
+
+        validate_backend(self.parser)
+
+        self._session_lock = threading.Lock()
+
+    def __enter__(self) -> "HTMLScraper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session and all the pooled connections"""
+        if self.session is not None:
+            self.session.close()
 
     def scrape(self, url: str, parser_fun: Callable) -> Any:
         """
@@ -31,14 +146,61 @@ class HTMLScraper:
         the provided function to parse out the wanted data.
         """
 
+        html = self.fetch(url)
+
+        if self.metrics is None:
+            return parser_fun(make_soup(html, self.parser))
+
+        start = time.perf_counter()
+        soup = make_soup(html, self.parser)
+        soup_built = time.perf_counter()
+        data = parser_fun(soup)
+
+        self.metrics.record_timing(url, "soup", soup_built - start)
+        self.metrics.record_timing(
+            url, "parse", time.perf_counter() - soup_built
+        )
+
+        return data
+
+    def fetch(self, url: str) -> str:
+        """
+        Sends a GET request to the provided url (retrying once on a proxy
+        error) and returns the raw html of the page without parsing it.
+        """
+
         try:
             page = self.get_page_logic(url)
         except ProxyError as p_err:
             logger.info(f"A Proxy Error occurred {p_err}. Trying again!")
             page = self.get_page_logic(url)
 
-        soup = BeautifulSoup(page.text, "html.parser")
-        return parser_fun(soup)
+        return page.text
+
+    def _map(self, fun: Callable, items: Iterable) -> list:
+        """
+        Calls fun on every item and returns the results in the same order
+        as the items. With more than one worker the calls are run
+        concurrently in a thread pool. In both cases the exception of the
+        first failing item is raised and no further items are processed.
+        """
+
+        return list(self._imap(fun, items))
+
+    def _imap(self, fun: Callable, items: Iterable) -> Iterator:
+        """
+        Lazy version of _map which yields the results one by one in the
+        same order as the items. With more than one worker at most twice
+        as many items as workers are processed ahead of the consumer,
+        so the results never pile up in memory.
+        """
+
+        if self.workers == 1:
+            yield from map(fun, items)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            yield from ordered_imap(executor, fun, items, 2 * self.workers)
 
     @staticmethod
     def parse(html: BeautifulSoup, parser_fun: Callable) -> Any:
@@ -58,12 +220,48 @@ class HTMLScraper:
         """
         This function uses as GET request wuth a few optional parameters
         to scrapes a static webpage from the web.
+        If the scraper has a rate limiter, the function waits for its turn.
+        If the scraper has a cache, fresh pages are served from the cache
+        and stale ones are revalidated with the server.
+        With rand_agent the request is sent with the next user agent of
+        the pool, which records if the server accepted it.
         """
 
-        headers = {"User-Agent": UserAgent().random} if rand_agent else None
+        cache = self.cache
+        cached = cache.load(url) if cache is not None else None
+
+        if cache is not None and cached is not None and cache.is_fresh(cached):
+            if self.metrics is not None:
+                self.metrics.record_cache_hit(url)
+            return cached.to_response()
+
+        user_agent = self.user_agents.next() if rand_agent else None
+        headers = {"User-Agent": user_agent} if user_agent else {}
+
+        if cached is not None:
+            headers.update(cached.validators())
 
-        with requests.Session() as session:
-            page = session.get(url, proxies=proxies, headers=headers)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        start = time.perf_counter()
+        page = self._get_session().get(
+            url, proxies=proxies, headers=headers or None
+        )
+
+        if user_agent is not None:
+            self.user_agents.record(user_agent, page.status_code < 400)
+
+        if self.metrics is not None:
+            self.metrics.record_request(url, page, time.perf_counter() - start)
+
+        if cache is not None:
+            if cached is not None and page.status_code == 304:
+                cache.refresh(cached)
+                return cached.to_response()
+
+            if self._is_success_response(page):
+                cache.store(url, page)
 
         return page
 
@@ -76,49 +274,45 @@ class HTMLScraper:
     def get_page_logic(self, url: str) -> Response:
         """
         This function scrapes a static webpage from the web.
-        It implements a strategy to avoid blocking by the host website.
-        All requests use a proxy if specified.
-        1. Normal GET request
-        2. GET request with a randomized user-agent
-        3. Browser automation (Selenium, pypeteer)
+        It implements a strategy to avoid blocking by the host website
+        (see retry_delay). All requests use a proxy if specified.
 
         If the response status code is ok (200-300)
         the function returns a Response object.
         Else it raises an error.
         """
 
-        # 1. Normal GET request
         page = self.get_page(url, proxies=self._proxies())
 
-        if self._is_success_response(page):
-            return page
-
-        logger.debug(
-            f"[1] Normal scrape failed ({page.status_code}). "
-            f"Proxy used: {self.proxy}"
-        )
+        attempt = 0
+        while not self._is_success_response(page):
+            delay = retry_delay(url, page, attempt, self.backoff, self.proxy)
+            if delay > 0:
+                self._wait(delay)
 
-        # 2. GET request with a randomized user-agent
-        page = self.get_page(url, proxies=self._proxies(), rand_agent=True)
+            # TODO: browser automation (self.get_page_browser(url))
+            self._record_retry(url)
+            page = self.get_page(url, proxies=self._proxies(), rand_agent=True)
+            attempt += 1
 
-        if self._is_success_response(page):
-            return page
+        return page
 
-        logger.debug(
-            f"[2] Random user agent scrape failed ({page.status_code}). "
-            f"Proxy used: {self.proxy}"
-        )
+    def _record_retry(self, url: str) -> None:
+        """Counts the request sent again for the url in the metrics"""
 
-        # 3. Browser automation (Selenium, puppeteer)
-        # TODO: self.get_page_browser(url)
-        # TODO: form a requests.Response
+        if self.metrics is not None:
+            self.metrics.record_retry(url)
 
-        if page.status_code == 429:
-            raise TooManyRequests(url, page.status_code)
-        if page.status_code == 403:
-            raise PermissionDenied(url, page.status_code)
+    def _wait(self, seconds: float) -> None:
+        """
+        Waits before retrying a request. With a rate limiter all the
+        requests sharing it are held back, not just the current one.
+        """
 
-        raise ScrapingError(url, page.status_code)
+        if self.rate_limiter is None:
+            time.sleep(seconds)
+        else:
+            self.rate_limiter.pause(seconds)
 
     def _is_success_response(self, resp: Response) -> bool:
         """
@@ -149,6 +343,14 @@ class HTMLScraper:
 
         return 200 <= code < 300
 
+    def _get_session(self) -> requests.Session:
+        """Creates the session on first use"""
+
+        with self._session_lock:
+            if self.session is None:
+                self.session = create_session()
+            return self.session
+
     def _proxies(self) -> dict | None:
         """If a proxy is passed"""
         if self.proxy:
@@ -159,6 +361,63 @@ class HTMLScraper:
         return None
 
 
+def retry_delay(
+    url: str, page: Any, attempt: int, backoff: Backoff, proxy: str | None
+) -> float:
+    """
+    The strategy to avoid blocking by the host website, shared by the
+    HTMLScraper and the AsyncHTMLScraper. Called after a request failed.
+    1. Normal GET request
+    2. GET request with a user-agent from the pool (see UserAgentPool)
+    3. Retries with a user-agent from the pool and exponential backoff
+       while the server throttles us (429, 503), honoring the Retry-After
+       header
+    :page: the failed response (requests.Response or AsyncResponse)
+    :attempt: number of the failed request, starting with 0
+    :return: seconds to wait before sending the request again
+    :raises ScrapingError: if the request isn't sent again
+    """
+
+    if attempt == 0:
+        logger.debug(
+            f"[1] Normal scrape failed ({page.status_code}). "
+            f"Proxy used: {proxy}"
+        )
+        return 0.0
+
+    if attempt == 1:
+        logger.debug(
+            f"[2] Random user agent scrape failed ({page.status_code}). "
+            f"Proxy used: {proxy}"
+        )
+
+    retry = attempt - 1
+    if (
+        retry >= backoff.retries
+        or page.status_code not in backoff.status_codes
+    ):
+        raise_scraping_error(url, page.status_code)
+
+    delay = backoff.delay(retry, page.headers.get("Retry-After"))
+    logger.info(
+        f"[3] Server responded with {page.status_code}. "
+        f"Retrying {url} in {delay:.1f}s"
+    )
+
+    return delay
+
+
+def raise_scraping_error(url: str, st_code: int) -> NoReturn:
+    """Raises the ScrapingError (sub)class matching the status code"""
+
+    if st_code == 429:
+        raise TooManyRequests(url, st_code)
+    if st_code == 403:
+        raise PermissionDenied(url, st_code)
+
+    raise ScrapingError(url, st_code)
+
+
 class ScrapingError(Exception):
     """
     Definition for a new type of error when scraping fails.
@@ -0,0 +1,231 @@
+"""
+This page contains the collection of the timings of the scraping, used to
+tune the concurrency and to spot when the website starts throttling us.
+Per class of url (see classify_url) it records the requests, their status
+codes, the retries, the downloaded bytes and the histograms of the time to
+the first byte, the download time, the soup building time and the parsing
+time.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+import json
+import threading
+from typing import TYPE_CHECKING, Any
+from baskref.data_collection.response_cache import classify_url
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+# upper bounds (in seconds) of the buckets of the histograms
+HISTOGRAM_BOUNDS: tuple[float, ...] = (
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# the timed stages of scraping a page
+STAGES: tuple[str, ...] = ("ttfb", "download", "soup", "parse")
+
+
+class Histogram:
+    """Histogram of durations (in seconds) with log scaled buckets"""
+
+    def __init__(self, bounds: tuple[float, ...] = HISTOGRAM_BOUNDS):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Adds a duration to the histogram"""
+
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, quant: float) -> float:
+        """
+        Estimates the quantile as the upper bound of the bucket holding it
+        (the maximum for the last bucket).
+        """
+
+        if self.count == 0:
+            return 0.0
+
+        rank = quant * self.count
+        seen = 0
+        for idx, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket > 0 and seen >= rank:
+                if idx == len(self.bounds):
+                    return self.max
+                return min(self.bounds[idx], self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """The summary and the buckets of the histogram"""
+
+        labels = [f"<={bound}" for bound in self.bounds]
+        labels.append(f">{self.bounds[-1]}")
+
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass
+class UrlClassMetrics:
+    """The metrics of the urls of a class"""
+
+    requests: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    bytes: int = 0
+    status_codes: Counter = field(default_factory=Counter)
+    timings: dict[str, Histogram] = field(
+        default_factory=lambda: {stage: Histogram() for stage in STAGES}
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """The metrics as a JSON serializable dictionary"""
+
+        return {
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "status_codes": {
+                str(code): count for code, count in self.status_codes.items()
+            },
+            "timings": {
+                stage: hist.to_dict() for stage, hist in self.timings.items()
+            },
+        }
+
+
+class ScrapeMetrics:
+    """
+    Thread safe collector of the metrics of the scrapers sharing it.
+    The metrics are kept per class of url (box_score, past_schedule,
+    current_schedule, other).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._classes: dict[str, UrlClassMetrics] = {}
+
+    def record_request(
+        self, url: str, page: "Response", seconds: float
+    ) -> None:
+        """
+        Records a request sent to the server.
+        :seconds: the time from sending the request to the downloaded body
+        """
+
+        ttfb = page.elapsed.total_seconds()
+
+        with self._lock:
+            metrics = self._url_class(url)
+            metrics.requests += 1
+            metrics.bytes += len(page.content or b"")
+            metrics.status_codes[page.status_code] += 1
+            metrics.timings["ttfb"].add(ttfb)
+            metrics.timings["download"].add(max(seconds - ttfb, 0.0))
+
+    def record_cache_hit(self, url: str) -> None:
+        """Records a page served from the cache"""
+
+        with self._lock:
+            self._url_class(url).cache_hits += 1
+
+    def record_retry(self, url: str) -> None:
+        """Records a request which is sent again after a failure"""
+
+        with self._lock:
+            self._url_class(url).retries += 1
+
+    def record_timing(self, url: str, stage: str, seconds: float) -> None:
+        """Records the duration of a stage (one of STAGES) for the url"""
+
+        with self._lock:
+            self._url_class(url).timings[stage].add(seconds)
+
+    def report(self) -> dict[str, Any]:
+        """The metrics of all the url classes"""
+
+        with self._lock:
+            return {
+                url_class: metrics.to_dict()
+                for url_class, metrics in sorted(self._classes.items())
+            }
+
+    def format_report(self) -> str:
+        """The metrics as a human readable table"""
+
+        lines = []
+        for url_class, metrics in self.report().items():
+            statuses = ", ".join(
+                f"{code}: {count}"
+                for code, count in metrics["status_codes"].items()
+            )
+            lines.append(
+                f"{url_class}: {metrics['requests']} requests "
+                f"({statuses or 'none'}), {metrics['cache_hits']} cached, "
+                f"{metrics['retries']} retries, "
+                f"{metrics['bytes'] / 1e6:.1f} MB"
+            )
+
+            for stage, hist in metrics["timings"].items():
+                if hist["count"] == 0:
+                    continue
+                lines.append(
+                    f"    {stage:<8} n={hist['count']:<6} "
+                    f"mean={hist['mean'] * 1000:.1f}ms "
+                    f"p50<={hist['p50'] * 1000:.0f}ms "
+                    f"p90<={hist['p90'] * 1000:.0f}ms "
+                    f"p99<={hist['p99'] * 1000:.0f}ms "
+                    f"max={hist['max'] * 1000:.0f}ms"
+                )
+
+        return "\n".join(lines)
+
+    def save_json(self, filepath: str) -> None:
+        """Writes the report as a JSON file"""
+
+        with open(filepath, "w", encoding="UTF-8") as json_file:
+            json.dump(self.report(), json_file, indent=2)
+
+    def _url_class(self, url: str) -> UrlClassMetrics:
+        """The metrics of the class of the url (call with the lock held)"""
+
+        url_class = classify_url(url)
+        if url_class not in self._classes:
+            self._classes[url_class] = UrlClassMetrics()
+
+        return self._classes[url_class]
@@ -0,0 +1,77 @@
+"""
+This page contains the archive of the raw html of the scraped game pages.
+Unlike the ResponseCache the archive never expires and is keyed by the
+game id, so it can be listed and the games can be parsed again without
+any network access (e.g. after the markup of the pages changes or new
+columns are added to the parsers).
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+import gzip
+import os
+from typing import Iterator
+from baskref.data_collection.response_cache import write_atomic
+
+
+ARCHIVE_EXTENSION: str = ".html.gz"
+
+
+def parse_game_date(game_id: str) -> date:
+    """The date of the game out of its id (e.g. 202201070BOS)"""
+    return datetime.strptime(game_id[:8], "%Y%m%d").date()
+
+
+@dataclass
+class PageArchive:
+    """
+    Permanent archive of the game pages, one gzip compressed html file
+    per game grouped into a folder per year
+    (e.g. {directory}/2022/202201070BOS.html.gz).
+    :directory: folder in which the pages are stored
+    """
+
+    directory: str
+
+    def store(self, game_id: str, html: str) -> None:
+        """Stores (or replaces) the html of the game page"""
+
+        write_atomic(self._path(game_id), gzip.compress(html.encode("UTF-8")))
+
+    def load(self, game_id: str) -> str | None:
+        """Loads the html of the game page. Returns None if it's missing."""
+
+        try:
+            with gzip.open(self._path(game_id), "rb") as page_file:
+                return page_file.read().decode("UTF-8")
+        except OSError:
+            return None
+
+    def __contains__(self, game_id: object) -> bool:
+        return isinstance(game_id, str) and os.path.exists(self._path(game_id))
+
+    def iter_game_ids(self) -> Iterator[str]:
+        """Yields the ids of all the archived games ordered by date"""
+
+        if not os.path.isdir(self.directory):
+            return
+
+        for year in sorted(os.listdir(self.directory)):
+            year_path = os.path.join(self.directory, year)
+            if not os.path.isdir(year_path):
+                continue
+
+            yield from sorted(
+                file_name[: -len(ARCHIVE_EXTENSION)]
+                for file_name in os.listdir(year_path)
+                if file_name.endswith(ARCHIVE_EXTENSION)
+            )
+
+    def _path(self, game_id: str) -> str:
+        """Path of the archived file of the game"""
+
+        return os.path.join(
+            self.directory, game_id[:4], f"{game_id}{ARCHIVE_EXTENSION}"
+        )
@@ -0,0 +1,158 @@
+"""
+This page contains the HTML parser backends which can be used to build
+the documents handed to the parsing functions of the scrapers.
+
+- html.parser: BeautifulSoup with the python built-in parser (default)
+- lxml: BeautifulSoup with the lxml parser (pip install baskref[lxml])
+- selectolax: the lexbor engine of selectolax, wrapped into the subset of
+  the BeautifulSoup API used by the parsing functions
+  (pip install baskref[selectolax])
+
+The parser libraries are imported by the first make_soup call, so the
+command line can list the backends without importing them.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+
+PARSER_BACKENDS: tuple[str, ...] = ("html.parser", "lxml", "selectolax")
+
+
+def make_soup(html: str, backend: str = "html.parser") -> Any:
+    """
+    Parses the html with the chosen backend.
+    :html: the html document as a string
+    :backend: one of PARSER_BACKENDS
+    :return: a BeautifulSoup object or a SelectolaxNode
+    """
+
+    validate_backend(backend)
+
+    if backend == "selectolax":
+        return SelectolaxNode(_lexbor_parser()(html).root)
+
+    return _beautiful_soup()(html, backend)
+
+
+@lru_cache(maxsize=None)
+def _beautiful_soup() -> Callable:
+    """BeautifulSoup, imported once on first use"""
+
+    # pylint: disable-next=import-outside-toplevel
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup
+
+
+@lru_cache(maxsize=None)
+def _lexbor_parser() -> Callable:
+    """The selectolax lexbor parser, imported once on first use"""
+
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError as exc:
+        raise ImportError(
+            "The selectolax backend requires selectolax. "
+            "Install it with: pip install baskref[selectolax]"
+        ) from exc
+
+    return LexborHTMLParser
+
+
+def validate_backend(backend: str) -> None:
+    """Raises a ValueError if the backend doesn't exist"""
+
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"{backend} is not a valid parser backend. "
+            f"Choose one of: {', '.join(PARSER_BACKENDS)}"
+        )
+
+
+class SelectolaxNode:
+    """
+    Wraps a selectolax node into the part of the BeautifulSoup Tag API
+    used by the parsing functions (select, select_one, find, find_all,
+    get, text, attrs and parent). Like in BeautifulSoup the selectors only
+    match descendants of the node.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Any):
+        self._node = node
+
+    @property
+    def text(self) -> str:
+        """All the text inside the node"""
+        return self._node.text(deep=True)
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        """The attributes of the node"""
+        return {
+            key: "" if val is None else val
+            for key, val in self._node.attributes.items()
+        }
+
+    @property
+    def parent(self) -> "SelectolaxNode | None":
+        """The parent of the node (None for the root)"""
+
+        parent = self._node.parent
+        return None if parent is None else SelectolaxNode(parent)
+
+    def select(self, selector: str) -> list["SelectolaxNode"]:
+        """All the descendants matching the css selector"""
+
+        return [
+            SelectolaxNode(node)
+            for node in self._node.css(selector)
+            if node.mem_id != self._node.mem_id
+        ]
+
+    def select_one(self, selector: str) -> "SelectolaxNode | None":
+        """The first descendant matching the css selector"""
+
+        for node in self._node.css(selector):
+            if node.mem_id != self._node.mem_id:
+                return SelectolaxNode(node)
+
+        return None
+
+    def find(self, name: str) -> "SelectolaxNode | None":
+        """The first descendant with the tag name"""
+        return self.select_one(name)
+
+    def find_all(
+        self, name: str | list[str], recursive: bool = True
+    ) -> list["SelectolaxNode"]:
+        """
+        All the descendants with the tag name (or one of the tag names).
+        If recursive is False only the direct children are searched.
+        """
+
+        names = [name] if isinstance(name, str) else name
+
+        if recursive:
+            return self.select(", ".join(names))
+
+        return [
+            SelectolaxNode(node)
+            for node in self._node.iter()
+            if node.tag in names
+        ]
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """The value of the attribute or the default if it's missing"""
+
+        attributes = self._node.attributes
+        if key not in attributes:
+            return default
+
+        val = attributes[key]
+        return "" if val is None else val
@@ -0,0 +1,129 @@
+"""
+This page contains the classes used to pace the requests sent by the
+scrapers: a token bucket rate limiter and an exponential backoff policy.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+
+
+@dataclass
+class RateLimiter:
+    """
+    Thread safe token bucket rate limiter.
+    The bucket holds at most burst tokens and refills with rate tokens
+    per second. Every request takes one token. One instance is meant to be
+    shared by all the scrapers (and threads) of a process.
+    :rate: sustained number of requests per second
+    :burst: number of requests which can be sent at once
+    """
+
+    rate: float
+    burst: int = 1
+    _tokens: float = field(init=False, repr=False)
+    _updated: float = field(init=False, repr=False)
+    _paused_until: float = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("The rate has to be a positive number")
+        if self.burst < 1:
+            raise ValueError("The burst has to be at least 1")
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket.
+        :return: seconds the caller has to wait before sending the request
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Blocks until the request is allowed to be sent"""
+        time.sleep(self.reserve())
+
+    def pause(self, seconds: float) -> None:
+        """Holds back all the requests for the given amount of seconds"""
+
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + seconds
+            )
+
+
+@dataclass
+class Backoff:
+    """
+    Exponential backoff with full jitter for retrying throttled requests.
+    :retries: number of retries before giving up
+    :base: delay in seconds of the first retry (before jitter)
+    :cap: maximum delay in seconds (before jitter)
+    """
+
+    retries: int = 3
+    base: float = 2.0
+    cap: float = 60.0
+    status_codes: tuple[int, ...] = (429, 503)
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Calculates how long to wait before the next retry.
+        If the server sent a Retry-After header its value is honored, up
+        to cap (a huge Retry-After would stall the scraper).
+        :attempt: the number of the retry starting with 0
+        :retry_after: value of the Retry-After response header
+        :return: delay in seconds
+        """
+
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.cap)
+
+        return random.uniform(0, min(self.cap, self.base * 2**attempt))
+
+
+def parse_retry_after(retry_after: str | None) -> float | None:
+    """
+    Parses the value of a Retry-After header which is either a number of
+    seconds or a HTTP date. Returns None if the value can't be parsed.
+    """
+
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,83 @@
+"""
+This page contains the rows produced by the data scraper. Instead of a
+dictionary per row (which holds a hash table of 40 to 90 string keys per
+game or player line) the values are kept in the __slots__ of a record,
+whose fields are the columns of the fixed schema of the row. The records
+are read-write mappings, so they can still be used like the dictionaries
+they replace (row["pts"], dict(row), {**row}).
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Iterator
+from baskref.data_saving.schema import GAME_COLUMNS, PLAYER_STATS_COLUMNS
+
+
+class Record(MutableMapping):
+    """
+    Base of the rows with a fixed set of fields (the __slots__ of the
+    subclass, in the order of the columns). Missing values are None, so
+    deleting a field sets it to None (the fields themselves are fixed).
+    """
+
+    __slots__: tuple[str, ...] = ()
+    _field_set: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+
+    def __init__(self, **values: Any):
+        unknown = values.keys() - self._field_set
+        if unknown:
+            raise ValueError(
+                f"The columns {', '.join(sorted(unknown))} are not in "
+                f"{type(self).__name__}"
+            )
+
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._field_set:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self[key] = None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def clear(self) -> None:
+        """Sets all the fields to None"""
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The row as a dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class GameRecord(Record):
+    """The game data of a game (see GAME_COLUMNS)"""
+
+    __slots__ = tuple(name for name, _ in GAME_COLUMNS)
+
+
+class PlayerStatRecord(Record):
+    """The stats of a player in a game (see PLAYER_STATS_COLUMNS)"""
+
+    __slots__ = tuple(name for name, _ in PLAYER_STATS_COLUMNS)
@@ -0,0 +1,216 @@
+"""
+This page contains the on-disk cache of the scraped web pages.
+Pages are stored gzip compressed together with the time they were fetched
+and their validators (ETag, Last-Modified). How long a page stays fresh
+depends on the class of its url (see classify_url).
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import TYPE_CHECKING
+from urllib import parse
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+# seconds a page stays fresh per url class (None means forever)
+DEFAULT_TTL_POLICIES: dict[str, float | None] = {
+    "box_score": None,
+    "past_schedule": None,
+    "current_schedule": 10 * 60,
+    "other": 60 * 60,
+}
+
+BOX_SCORE_PATH = re.compile(r"^/boxscores/\w+\.html$")
+SEASON_PATH = re.compile(r"^/(leagues|playoffs)/NBA_(\d{4})_games")
+
+
+def classify_url(url: str, today: date | None = None) -> str:
+    """
+    Classifies a basketball reference url for the caching policy.
+    - box_score: a game page, it never changes once the game is played
+    - past_schedule: list of games for a past day or season
+    - current_schedule: list of games for today or the ongoing season
+    - other: any other page
+    """
+
+    today = today or date.today()
+    split_url = parse.urlsplit(url)
+
+    if BOX_SCORE_PATH.match(split_url.path):
+        return "box_score"
+
+    if split_url.path == "/boxscores/":
+        return _classify_daily_games(split_url.query, today)
+
+    season_match = SEASON_PATH.match(split_url.path)
+    if season_match:
+        current_season = today.year + 1 if today.month >= 8 else today.year
+        if int(season_match.group(2)) < current_season:
+            return "past_schedule"
+        return "current_schedule"
+
+    return "other"
+
+
+def _classify_daily_games(query: str, today: date) -> str:
+    """Classifies the url of the games on a day by its query string"""
+
+    params = parse.parse_qs(query)
+    try:
+        games_date = date(
+            int(params["year"][0]),
+            int(params["month"][0]),
+            int(params["day"][0]),
+        )
+    except (KeyError, ValueError):
+        return "other"
+
+    # late games finish after midnight, so yesterday is still current
+    if games_date < today - timedelta(days=1):
+        return "past_schedule"
+    return "current_schedule"
+
+
+@dataclass
+class CachedPage:
+    """A page stored in the ResponseCache"""
+
+    url: str
+    content: bytes
+    fetched_at: float
+    encoding: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """The headers used to revalidate the page with the server"""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def to_response(self) -> "Response":
+        """Rebuilds a requests.Response out of the cached page"""
+
+        # imported here, so reading the cache doesn't import requests
+        # pylint: disable-next=import-outside-toplevel
+        from requests import Response
+
+        resp = Response()
+        resp._content = self.content  # pylint: disable=protected-access
+        resp.status_code = 200
+        resp.url = self.url
+        resp.encoding = self.encoding
+
+        return resp
+
+
+@dataclass
+class ResponseCache:
+    """
+    Persistent cache of web pages keyed by url.
+    :directory: folder in which the pages are stored
+    :ttl_policies: seconds a page stays fresh per url class
+    """
+
+    directory: str
+    ttl_policies: dict[str, float | None] = field(
+        default_factory=lambda: dict(DEFAULT_TTL_POLICIES)
+    )
+
+    def load(self, url: str) -> CachedPage | None:
+        """Loads the page from the cache. Returns None on a cache miss."""
+
+        path = self._path(url)
+
+        try:
+            with open(f"{path}.json", encoding="UTF-8") as meta_file:
+                meta = json.load(meta_file)
+            with gzip.open(f"{path}.html.gz", "rb") as content_file:
+                content = content_file.read()
+        except (OSError, ValueError):
+            return None
+
+        return CachedPage(content=content, **meta)
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Checks if the page can be used without asking the server"""
+
+        ttl = self.ttl_policies.get(
+            classify_url(page.url), self.ttl_policies["other"]
+        )
+
+        return ttl is None or time.time() - page.fetched_at < ttl
+
+    def store(self, url: str, resp: "Response") -> CachedPage:
+        """Stores a successful response in the cache"""
+
+        page = CachedPage(
+            url=url,
+            content=resp.content,
+            fetched_at=time.time(),
+            encoding=resp.encoding,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+        path = self._path(url)
+        write_atomic(f"{path}.html.gz", gzip.compress(page.content))
+        self._write_meta(path, page)
+
+        return page
+
+    def refresh(self, page: CachedPage) -> None:
+        """Marks a page as fresh after the server confirmed it (304)"""
+
+        page.fetched_at = time.time()
+        self._write_meta(self._path(page.url), page)
+
+    def _write_meta(self, path: str, page: CachedPage) -> None:
+        """Writes the meta data of a page (everything but the content)"""
+
+        meta = {
+            "url": page.url,
+            "fetched_at": page.fetched_at,
+            "encoding": page.encoding,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+        }
+        write_atomic(f"{path}.json", json.dumps(meta).encode("UTF-8"))
+
+    def _path(self, url: str) -> str:
+        """Path of the cached files (without the extension) for the url"""
+
+        key = hashlib.sha256(url.encode("UTF-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], key)
+
+
+def write_atomic(file_path: str, data: bytes) -> None:
+    """Writes the file so that readers never see a partial file"""
+
+    folder_path = os.path.dirname(file_path)
+    os.makedirs(folder_path, exist_ok=True)
+
+    file_desc, tmp_path = tempfile.mkstemp(dir=folder_path)
+    try:
+        with os.fdopen(file_desc, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
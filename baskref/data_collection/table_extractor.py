@@ -0,0 +1,87 @@
+"""
+This page contains the generic extractor of the basketball reference
+stats tables. Every cell of those tables carries a data-stat attribute,
+so a row is walked only once to map each data-stat to its cell and the
+values are then picked out of the map with a declarative column spec.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from typing import Any, Callable, MutableMapping, NamedTuple
+
+
+class Column(NamedTuple):
+    """
+    Specification of a column extracted from a stats table.
+    :name: name of the column in the extracted dictionary
+    :stat: data-stat attribute of the cell holding the value
+    :converter: converts the text of the cell into the value
+    :default: value used when the cell is empty
+    :attr: if set, the value is read from this attribute of the cell
+        instead of its text
+    """
+
+    name: str
+    stat: str
+    converter: Callable[[str], Any]
+    default: Any = None
+    attr: str | None = None
+
+
+def read_cells(row: Any) -> dict[str, Any]:
+    """
+    Walks the cells of a table row once.
+    :row: a tr element (BeautifulSoup Tag or SelectolaxNode)
+    :return: dictionary mapping the data-stat attributes to the cells
+    """
+
+    cells = {}
+    for cell in row.find_all(["th", "td"], recursive=False):
+        stat = cell.get("data-stat")
+        if stat is not None:
+            cells[stat] = cell
+
+    return cells
+
+
+def extract_columns(
+    cells: dict[str, Any],
+    columns: tuple[Column, ...],
+    values: MutableMapping[str, Any] | None = None,
+) -> MutableMapping[str, Any]:
+    """
+    Extracts the columns out of the cells of a row.
+    Empty cells get the default of the column and columns whose cell
+    is missing in the row are None.
+    :cells: the cells of a row as returned by read_cells
+    :columns: the specification of the columns to extract
+    :values: the mapping (e.g. a record) the values are written into,
+        a new dictionary by default
+    :return: the mapping of the extracted values
+    """
+
+    if values is None:
+        values = {}
+
+    for col in columns:
+        cell = cells.get(col.stat)
+        if cell is None:
+            values[col.name] = None
+            continue
+
+        text = cell.text if col.attr is None else cell.get(col.attr)
+        values[col.name] = col.converter(text) if text else col.default
+
+    return values
+
+
+def empty_columns(columns: tuple[Column, ...]) -> dict[str, None]:
+    """Returns the columns with all the values set to None"""
+    return dict.fromkeys(col.name for col in columns)
+
+
+def prefix_columns(
+    columns: tuple[Column, ...], prefix: str
+) -> tuple[Column, ...]:
+    """Returns the columns with the prefix added to their names"""
+    return tuple(col._replace(name=f"{prefix}{col.name}") for col in columns)
@@ -0,0 +1,178 @@
+"""
+This page contains the pool of user agents the scrapers rotate through
+when a request is retried with a different user agent. The pool is loaded
+once per process (from the bundled list or from a file) and keeps the
+success statistics of every user agent, so the rotation can prefer the
+user agents the server accepts.
+
+Rotation strategies (all deterministic, random is seeded):
+- round_robin: the user agents are used one after another
+- random: a seeded random user agent
+- best: the user agent with the best success rate (the untried ones
+  count as a 50% success rate, ties go to the earlier user agent)
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from functools import lru_cache
+import random
+import threading
+from typing import Any, Sequence
+
+
+ROTATION_STRATEGIES: tuple[str, ...] = ("round_robin", "random", "best")
+
+# recent desktop browsers on Windows, macOS and Linux
+USER_AGENTS: tuple[str, ...] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:131.0) "
+    "Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14.7; rv:131.0) "
+    "Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:131.0) "
+    "Gecko/20100101 Firefox/131.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:130.0) "
+    "Gecko/20100101 Firefox/130.0",
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:130.0) "
+    "Gecko/20100101 Firefox/130.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/18.0 Safari/605.1.15",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+    "(KHTML, like Gecko) Version/17.6 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 Edg/129.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36 Edg/128.0.0.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 Edg/129.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36 OPR/114.0.0.0",
+)
+
+
+class UserAgentPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread safe pool of user agents with a rotation strategy.
+    Share one pool between the scrapers, so they rotate through the same
+    user agents and share their statistics.
+    :user_agents: the user agents of the pool
+    :strategy: one of ROTATION_STRATEGIES
+    :seed: seed of the random strategy
+    """
+
+    def __init__(
+        self,
+        user_agents: Sequence[str] = USER_AGENTS,
+        strategy: str = "round_robin",
+        seed: int | None = 0,
+    ):
+        if not user_agents:
+            raise ValueError("The pool needs at least one user agent")
+
+        if strategy not in ROTATION_STRATEGIES:
+            raise ValueError(
+                f"{strategy} is not a valid rotation strategy. "
+                f"Choose one of: {', '.join(ROTATION_STRATEGIES)}"
+            )
+
+        self.user_agents = tuple(user_agents)
+        self.strategy = strategy
+        self._random = random.Random(seed)
+        self._next_idx = 0
+        self._requests = [0] * len(self.user_agents)
+        self._successes = [0] * len(self.user_agents)
+        self._index = {ua: idx for idx, ua in enumerate(self.user_agents)}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, filepath: str, **kwargs: Any) -> "UserAgentPool":
+        """
+        Loads the user agents from a text file with one user agent per
+        line. Empty lines and lines starting with # are skipped.
+        :kwargs: the other arguments of the pool (strategy, seed)
+        """
+
+        with open(filepath, encoding="UTF-8") as ua_file:
+            user_agents = [
+                line.strip()
+                for line in ua_file
+                if line.strip() and not line.startswith("#")
+            ]
+
+        if not user_agents:
+            raise ValueError(f"No user agents found in {filepath}")
+
+        return cls(user_agents, **kwargs)
+
+    def next(self) -> str:
+        """The user agent of the next request"""
+
+        with self._lock:
+            if self.strategy == "random":
+                return self._random.choice(self.user_agents)
+
+            if self.strategy == "best":
+                return self.user_agents[
+                    max(range(len(self.user_agents)), key=self._score)
+                ]
+
+            user_agent = self.user_agents[self._next_idx]
+            self._next_idx = (self._next_idx + 1) % len(self.user_agents)
+            return user_agent
+
+    def record(self, user_agent: str, success: bool) -> None:
+        """
+        Records the outcome of a request sent with the user agent.
+        User agents which are not in the pool are ignored.
+        """
+
+        idx = self._index.get(user_agent)
+        if idx is None:
+            return
+
+        with self._lock:
+            self._requests[idx] += 1
+            self._successes[idx] += success
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """The requests and the successes of the used user agents"""
+
+        with self._lock:
+            return {
+                ua: {"requests": requests, "successes": successes}
+                for ua, requests, successes in zip(
+                    self.user_agents, self._requests, self._successes
+                )
+                if requests > 0
+            }
+
+    def format_stats(self) -> str:
+        """The statistics as a human readable table"""
+
+        return "\n".join(
+            f"{stat['successes']}/{stat['requests']} ok  {user_agent}"
+            for user_agent, stat in self.stats().items()
+        )
+
+    def _score(self, idx: int) -> float:
+        """
+        Success rate of the user agent, smoothed so the untried user
+        agents count as 50% (call with the lock held)
+        """
+
+        return (self._successes[idx] + 1) / (self._requests[idx] + 2)
+
+
+@lru_cache(maxsize=None)
+def default_user_agent_pool() -> UserAgentPool:
+    """The pool of the bundled user agents, created once per process"""
+    return UserAgentPool()
@@ -6,9 +6,11 @@ Author: Dominik Zulovec Sajovic, June 2022
 
 import os
 import csv
+from collections.abc import Mapping
+from typing import Iterable, TextIO
 
 
-def save_file_from_list(data: list[dict], filepath: str) -> None:
+def save_file_from_list(data: list[Mapping], filepath: str) -> None:
     """
     Saves a list of dictionaries as a CSV.
     This used to be implemented with pandas
@@ -27,10 +29,7 @@ def save_file_from_list(data: list[dict], filepath: str) -> None:
             "All the elements of the parameter data have to be dictionaires"
         )
 
-    # if path to file doesn't exist -> create it
-    folder_path = os.path.dirname(filepath)
-    if (not os.path.exists(folder_path)) and (folder_path != ""):
-        os.makedirs(folder_path)
+    create_folder(filepath)
 
     with open(filepath, "w", newline="", encoding="UTF-8") as csv_file:
         writer = csv.DictWriter(csv_file, fieldnames=data[0].keys())
@@ -39,11 +38,125 @@ def save_file_from_list(data: list[dict], filepath: str) -> None:
 
 
 def check_all_elements_dicts(list_param: list) -> bool:
-    """inspects if all elements of the list are dictionaries"""
+    """
+    inspects if all elements of the list are dictionaries (or other
+    mappings like the records of the data scraper)
+    """
 
     if not isinstance(list_param, list):
         raise ValueError("The parameter list_param has to be a list")
 
-    non_dicts = [ele for ele in list_param if not isinstance(ele, dict)]
+    non_dicts = [ele for ele in list_param if not isinstance(ele, Mapping)]
 
     return len(non_dicts) == 0
+
+
+def create_folder(filepath: str) -> None:
+    """if path to file doesn't exist -> create it"""
+
+    folder_path = os.path.dirname(filepath)
+    if (not os.path.exists(folder_path)) and (folder_path != ""):
+        os.makedirs(folder_path)
+
+
+class CSVStreamWriter:
+    """
+    Writes rows (dictionaries or records) into a CSV incrementally, so the
+    rows never have to be held in memory. Every batch of rows is flushed
+    to the file as soon as it's written. The file (and the header taken
+    from the first row) is only created once the first row arrives.
+    :filepath: path of the CSV file
+    :append: if True the rows are appended to an existing file (keeping
+        its header) instead of overwriting it
+    """
+
+    # the rows are in the file as soon as write_rows returns
+    durable_writes: bool = True
+
+    def __init__(self, filepath: str, append: bool = False):
+        self.filepath = filepath
+        self.append = append
+        self.rows_written = 0
+        self._file: TextIO | None = None
+        self._writer: csv.DictWriter | None = None
+
+    def write_rows(self, rows: Iterable[Mapping]) -> None:
+        """Appends the rows to the file and flushes them to disk"""
+
+        for row in rows:
+            if not isinstance(row, Mapping):
+                raise ValueError("All the rows have to be dictionaires")
+
+            if self._writer is None:
+                self._writer = self._open(list(row.keys()))
+
+            self._writer.writerow(row)
+            self.rows_written += 1
+
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Closes the file"""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self, fieldnames: list) -> csv.DictWriter:
+        """
+        Creates the file and writes the header. When appending to an
+        existing file its header is used instead.
+        """
+
+        create_folder(self.filepath)
+
+        header = read_csv_header(self.filepath) if self.append else None
+
+        # pylint: disable=consider-using-with
+        if header:
+            truncate_partial_row(self.filepath)
+            self._file = open(self.filepath, "a", newline="", encoding="UTF-8")
+            return csv.DictWriter(self._file, fieldnames=header)
+
+        self._file = open(self.filepath, "w", newline="", encoding="UTF-8")
+        writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        writer.writeheader()
+
+        return writer
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_csv_header(filepath: str) -> list[str] | None:
+    """Reads the header of a CSV. Returns None if the file doesn't exist."""
+
+    if not os.path.exists(filepath):
+        return None
+
+    with open(filepath, newline="", encoding="UTF-8") as csv_file:
+        return next(csv.reader(csv_file), None)
+
+
+def truncate_partial_row(filepath: str, chunk_size: int = 4096) -> None:
+    """
+    Cuts off the last row of a file if it was only partially written
+    (e.g. the process was killed while writing it).
+    """
+
+    with open(filepath, "rb+") as csv_file:
+        pos = csv_file.seek(0, os.SEEK_END)
+
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            csv_file.seek(pos)
+            newline_idx = csv_file.read(step).rfind(b"\n")
+
+            if newline_idx != -1:
+                csv_file.truncate(pos + newline_idx + 1)
+                return
@@ -0,0 +1,66 @@
+"""
+This script contains the journal which records the games whose data
+has been saved, so an interrupted collection can be resumed. The same
+journal (never cleared) keeps the index of the ids of all the games
+collected so far.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+import os
+from typing import TextIO
+from baskref.data_saving.file_saver import create_folder
+
+
+class GameJournal:
+    """
+    Append-only log of the games (urls or game ids) whose rows are
+    completely saved. A game is recorded only after all its rows have been
+    written, so a game interrupted half way is collected again when
+    resuming.
+    :filepath: path of the journal file (one game per line)
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._file: TextIO | None = None
+
+    def load(self) -> set[str]:
+        """Reads the games recorded in the journal"""
+
+        if not os.path.exists(self.filepath):
+            return set()
+
+        with open(self.filepath, encoding="UTF-8") as journal_file:
+            return {line.strip() for line in journal_file if line.strip()}
+
+    def clear(self) -> None:
+        """Removes all the games from the journal"""
+
+        self.close()
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+    def record(self, game: str) -> None:
+        """Appends the game to the journal and flushes it to disk"""
+
+        if self._file is None:
+            create_folder(self.filepath)
+            # pylint: disable=consider-using-with
+            self._file = open(self.filepath, "a", encoding="UTF-8")
+
+        self._file.write(f"{game}\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Closes the journal file"""
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "GameJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,140 @@
+"""
+This script contains the saving of the rows into typed Parquet files
+(pip install baskref[parquet]). Unlike the CSVs the Parquet files keep
+the types of the values (e.g. game_time is a timestamp) and can be read
+column by column by the analytics tools.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+import os
+from collections.abc import Mapping
+from typing import Any, Iterable
+from baskref.data_saving.file_saver import create_folder
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+
+def build_schema(columns: tuple[tuple[str, str], ...]) -> Any:
+    """Builds the arrow schema out of the (name, type alias) columns"""
+
+    if pa is None:
+        raise ImportError(
+            "Saving Parquet files requires pyarrow. "
+            "Install it with: pip install baskref[parquet]"
+        )
+
+    return pa.schema(
+        [(name, pa.type_for_alias(alias)) for name, alias in columns]
+    )
+
+
+class ParquetStreamWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Writes rows (dictionaries or records) into a Parquet file with a fixed
+    schema. The rows are buffered and written as a row group whenever
+    row_group_size rows are collected, so only one row group is held in
+    memory. The file is written under a temporary name and moved into
+    place when the writer is closed, so a failed run never leaves a
+    broken file behind. The written rows are therefore only on disk once
+    the writer is closed (see durable_writes).
+    :filepath: path of the Parquet file
+    :columns: (name, arrow type alias) of the columns of the file
+    :append: if True the rows are added to the rows of an existing file
+        instead of overwriting it
+    :row_group_size: number of rows in a row group
+    """
+
+    # the rows are only in the file once the writer is closed
+    durable_writes: bool = False
+
+    def __init__(
+        self,
+        filepath: str,
+        columns: tuple[tuple[str, str], ...],
+        append: bool = False,
+        row_group_size: int = 10_000,
+    ):
+        self.filepath = filepath
+        self.append = append
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._schema = build_schema(columns)
+        self._names = set(self._schema.names)
+        self._buffer: list[Mapping] = []
+        self._writer: Any = None
+
+    def write_rows(self, rows: Iterable[Mapping]) -> None:
+        """Adds the rows to the file, a row group at a time"""
+
+        for row in rows:
+            if not isinstance(row, Mapping):
+                raise ValueError("All the rows have to be dictionaires")
+
+            unknown = row.keys() - self._names
+            if unknown:
+                raise ValueError(
+                    f"The columns {', '.join(sorted(unknown))} are not in "
+                    f"the schema of {self.filepath}"
+                )
+
+            self._buffer.append(row)
+            self.rows_written += 1
+
+            if len(self._buffer) >= self.row_group_size:
+                self._write_row_group()
+
+    def close(self) -> None:
+        """Writes the buffered rows and moves the file into place"""
+
+        if self._buffer:
+            self._write_row_group()
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            os.replace(self._tmp_path, self.filepath)
+
+    def _write_row_group(self) -> None:
+        """Writes the buffered rows as a row group"""
+
+        if self._writer is None:
+            self._writer = self._open()
+
+        table = pa.Table.from_pylist(self._buffer, schema=self._schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self._buffer = []
+
+    def _open(self) -> Any:
+        """
+        Creates the temporary file. When appending to an existing file
+        its rows are copied into the new file first.
+        """
+
+        create_folder(self.filepath)
+        writer = pq.ParquetWriter(self._tmp_path, self._schema)
+
+        if self.append and os.path.exists(self.filepath):
+            existing = pq.ParquetFile(self.filepath)
+            for group in range(existing.num_row_groups):
+                writer.write_table(
+                    existing.read_row_group(group).cast(self._schema)
+                )
+
+        return writer
+
+    @property
+    def _tmp_path(self) -> str:
+        """Path of the file while it's being written"""
+        return f"{self.filepath}.tmp"
+
+    def __enter__(self) -> "ParquetStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
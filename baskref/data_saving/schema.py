@@ -0,0 +1,88 @@
+"""
+This script contains the fixed schemas of the saved rows, shared by the
+savers which store typed values (Parquet, SQLite). The types are given as
+arrow type aliases.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+
+# (column name, arrow type alias) of the team stats of both teams
+TEAM_BASIC_STATS_TYPES: tuple[tuple[str, str], ...] = (
+    ("fg", "int64"),
+    ("fga", "int64"),
+    ("fg_pct", "double"),
+    ("fg3", "int64"),
+    ("fg3a", "int64"),
+    ("fg3_pct", "double"),
+    ("ft", "int64"),
+    ("fta", "int64"),
+    ("ft_pct", "double"),
+    ("orb", "int64"),
+    ("drb", "int64"),
+    ("trb", "int64"),
+    ("ast", "int64"),
+    ("stl", "int64"),
+    ("blk", "int64"),
+    ("tov", "int64"),
+    ("pf", "int64"),
+    ("pts", "int64"),
+)
+
+ADVANCED_STATS_NAMES: tuple[str, ...] = (
+    "ts_pct",
+    "efg_pct",
+    "fg3a_per_fga_pct",
+    "fta_per_fga_pct",
+    "orb_pct",
+    "drb_pct",
+    "trb_pct",
+    "ast_pct",
+    "stl_pct",
+    "blk_pct",
+    "tov_pct",
+)
+
+GAME_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("home_team", "string"),
+    ("away_team", "string"),
+    ("home_team_full_name", "string"),
+    ("away_team_full_name", "string"),
+    ("game_time", "timestamp[ms]"),
+    ("arena_name", "string"),
+    ("attendance", "int64"),
+    ("playin_game", "bool"),
+    ("playoff_game", "bool"),
+    ("playoff_conference", "string"),
+    ("playoff_round", "string"),
+    ("playoff_game_number", "int64"),
+    *(
+        (f"{team}_{name}", alias)
+        for team in ("home", "away")
+        for name, alias in TEAM_BASIC_STATS_TYPES
+    ),
+    *(
+        (f"{team}_{name}", "double")
+        for team in ("home", "away")
+        for name in (*ADVANCED_STATS_NAMES, "off_rtg", "def_rtg")
+    ),
+    ("game_id", "string"),
+    ("game_url", "string"),
+)
+
+PLAYER_STATS_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("player_name", "string"),
+    ("player_id", "string"),
+    ("mp", "string"),
+    *TEAM_BASIC_STATS_TYPES,
+    ("plsmin", "int64"),
+    ("team", "string"),
+    *((name, "double") for name in ADVANCED_STATS_NAMES),
+    ("usg_pct", "double"),
+    ("off_rtg", "double"),
+    ("def_rtg", "double"),
+    ("game_id", "string"),
+    ("game_url", "string"),
+)
+
+URL_COLUMNS: tuple[tuple[str, str], ...] = (("url", "string"),)
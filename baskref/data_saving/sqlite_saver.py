@@ -0,0 +1,176 @@
+"""
+This script contains the saving of the rows into a local SQLite database.
+The rows are upserted on the key of their table, so the games which are
+collected again (e.g. by a daily job) are updated instead of duplicated.
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+from datetime import datetime
+from collections.abc import Mapping
+import sqlite3
+from typing import Any, Iterable, NamedTuple
+from baskref.data_saving.file_saver import create_folder
+from baskref.data_saving.schema import (
+    GAME_COLUMNS,
+    PLAYER_STATS_COLUMNS,
+    URL_COLUMNS,
+)
+
+
+# SQLite types of the arrow type aliases of the schema
+SQLITE_TYPES: dict[str, str] = {
+    "string": "TEXT",
+    "int64": "INTEGER",
+    "double": "REAL",
+    "bool": "INTEGER",
+    "timestamp[ms]": "TEXT",
+}
+
+
+class SQLiteTable(NamedTuple):
+    """
+    Specification of a table of the database.
+    :name: name of the table
+    :columns: (name, arrow type alias) of the columns
+    :key: columns of the primary key, the rows are upserted on it
+    :indexes: additional indexed columns
+    """
+
+    name: str
+    columns: tuple[tuple[str, str], ...]
+    key: tuple[str, ...]
+    indexes: tuple[str, ...] = ()
+
+
+GAMES_TABLE = SQLiteTable("games", GAME_COLUMNS, ("game_id",), ("game_time",))
+
+PLAYER_STATS_TABLE = SQLiteTable(
+    "player_stats",
+    PLAYER_STATS_COLUMNS,
+    ("game_id", "player_id"),
+    ("player_id",),
+)
+
+GAME_URLS_TABLE = SQLiteTable("game_urls", URL_COLUMNS, ("url",))
+
+
+def create_table_sql(table: SQLiteTable) -> list[str]:
+    """The statements creating the table and its indexes"""
+
+    columns = ", ".join(
+        f"{name} {SQLITE_TYPES[alias]}" for name, alias in table.columns
+    )
+
+    return [
+        f"CREATE TABLE IF NOT EXISTS {table.name} "
+        f"({columns}, PRIMARY KEY ({', '.join(table.key)}))",
+        *(
+            f"CREATE INDEX IF NOT EXISTS {table.name}_{column} "
+            f"ON {table.name} ({column})"
+            for column in table.indexes
+        ),
+    ]
+
+
+def upsert_sql(table: SQLiteTable) -> str:
+    """The statement inserting a row or updating the row with its key"""
+
+    names = [name for name, _ in table.columns]
+    updates = ", ".join(
+        f"{name} = excluded.{name}" for name in names if name not in table.key
+    )
+
+    return (
+        f"INSERT INTO {table.name} ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' * len(names))}) "
+        f"ON CONFLICT ({', '.join(table.key)}) DO UPDATE SET {updates}"
+    )
+
+
+def to_sql_value(value: Any) -> Any:
+    """Converts the value into a type stored by SQLite"""
+
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+
+    return value
+
+
+class SQLiteStreamWriter:
+    """
+    Upserts rows (dictionaries or records) into a table of a SQLite
+    database. Every batch of rows is written with one executemany inside
+    its own transaction, so the rows are on disk as soon as write_rows
+    returns.
+    The database and the table are created if they don't exist.
+    :filepath: path of the database file
+    :table: the table the rows are written into
+    """
+
+    # the rows are in the database as soon as write_rows returns
+    durable_writes: bool = True
+
+    def __init__(self, filepath: str, table: SQLiteTable):
+        self.filepath = filepath
+        self.table = table
+        self.rows_written = 0
+        self._names = [name for name, _ in table.columns]
+        self._known_names = set(self._names)
+        self._sql = upsert_sql(table)
+        self._conn: sqlite3.Connection | None = None
+
+    def write_rows(self, rows: Iterable[Mapping]) -> None:
+        """Upserts the rows in one transaction"""
+
+        values = []
+        for row in rows:
+            if not isinstance(row, Mapping):
+                raise ValueError("All the rows have to be dictionaires")
+
+            unknown = row.keys() - self._known_names
+            if unknown:
+                raise ValueError(
+                    f"The columns {', '.join(sorted(unknown))} are not in "
+                    f"the table {self.table.name}"
+                )
+
+            values.append(
+                [to_sql_value(row.get(name)) for name in self._names]
+            )
+
+        if not values:
+            return
+
+        if self._conn is None:
+            self._conn = self._open()
+
+        with self._conn:
+            self._conn.executemany(self._sql, values)
+
+        self.rows_written += len(values)
+
+    def close(self) -> None:
+        """Closes the connection to the database"""
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _open(self) -> sqlite3.Connection:
+        """Connects to the database and creates the table"""
+
+        create_folder(self.filepath)
+        conn = sqlite3.connect(self.filepath)
+
+        with conn:
+            for statement in create_table_sql(self.table):
+                conn.execute(statement)
+
+        return conn
+
+    def __enter__(self) -> "SQLiteStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
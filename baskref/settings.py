@@ -5,10 +5,13 @@ Settings skeleton for the project
 
 from dataclasses import dataclass
 from datetime import date
+import datetime
+from baskref.data_collection.metrics import ScrapeMetrics
+from baskref.data_collection.user_agents import UserAgentPool
 
 
 @dataclass
-class InLine:
+class InLine:  # pylint: disable=too-many-instance-attributes
     """Class for storing command line passed arguments"""
 
     type: str
@@ -17,10 +20,42 @@ class InLine:
     year: int
     file_path: str
     proxy: str
+    user_agents_file: str | None = None
+    user_agent_rotation: str = "round_robin"
+    output: str = "csv"
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    keep_alive: bool = True
+    workers: int = 1
+    rate: float = 0.3
+    burst: int = 2
+    retries: int = 3
+    cache_dir: str | None = None
+    parser: str = "html.parser"
+    resume: bool = False
+    pipeline: bool = False
+    new_only: bool = False
+    since_last_run: bool = False
+    metrics: bool = False
+    metrics_file: str | None = None
+    parse_workers: int = 0
+    archive_dir: str | None = None
+    offline: bool = False
+    from_date: datetime.date | None = None
+    to_date: datetime.date | None = None
+    from_year: int | None = None
+    to_year: int | None = None
 
 
 @dataclass
 class Settings:
-    """Class for storing project parameters"""
+    """
+    Class for storing project parameters
+    :metrics: collects the timings of the run (shared by all the scrapers)
+    :user_agents: pool of the user agents (shared by all the scrapers),
+        the bundled pool if None
+    """
 
     in_line: InLine
+    metrics: ScrapeMetrics | None = None
+    user_agents: UserAgentPool | None = None
@@ -7,7 +7,10 @@ Author: Dominik Zulovec Sajovic, May 2022
 
 from datetime import datetime, date
 from argparse import ArgumentTypeError
+from importlib import import_module
+import sys
 from typing import Any
+from urllib import parse
 
 
 def valid_date(str_date: str) -> date:
@@ -18,6 +21,29 @@ def valid_date(str_date: str) -> date:
         raise ArgumentTypeError(f"not a valid date: {str_date!r}") from exc
 
 
+def season_of_date(game_date: date) -> int:
+    """
+    Returns the season (its ending year) in which a game on the given date
+    is played. The seasons start in October, except for the 2019-20 season
+    which was suspended and only finished in October 2020.
+    """
+
+    if game_date.year == 2020 and game_date.month < 12:
+        return 2020
+
+    return game_date.year + 1 if game_date.month >= 10 else game_date.year
+
+
+def parse_game_id(game_url: str) -> str:
+    """
+    Parses the game id out of a basketball reference game url
+    (e.g. https://www.basketball-reference.com/boxscores/202201070BOS.html
+    -> 202201070BOS).
+    """
+
+    return parse.urlsplit(game_url).path.split("/")[-1].replace(".html", "")
+
+
 def str_to_datetime(date_str: str, formats: list[str]) -> datetime:
     """
     tries to convert a string date into a datetime with multiple formats.
@@ -49,34 +75,24 @@ def num(char: str | None) -> float | int | None:
         return float(char)
 
 
-def broadcast(list_dicts: list[dict], key: str, val: Any) -> list[dict]:
-    """broadcasts a value into every dictionary in a list"""
-
-    for dic in list_dicts:
-        dic[key] = val
-
-    return list_dicts
-
-
-def join_list_dics(
-    ldics1: list[dict], ldics2: list[dict], col: str
-) -> list[dict]:
+def lazy_import(
+    module_name: str, name: str, lazy_imports: dict[str, str]
+) -> Any:
     """
-    Joins all dictionaries in two lists of dictionaries on a column.
-    Both lists need to be of the same length.
+    Looks up the name of the module level __getattr__ of a package, whose
+    heavy names are imported on first use.
+    :module_name: name of the package (its __name__)
+    :name: the requested attribute
+    :lazy_imports: name -> module the name is imported from
+    :return: the imported object, cached in the globals of the package
     """
 
-    if len(ldics1) != len(ldics2):
-        raise ValueError(
-            f"The lengths of ldics1({len(ldics1)}) and ldics2({len(ldics2)})"
-            "need to be the same"
+    if name not in lazy_imports:
+        raise AttributeError(
+            f"module {module_name!r} has no attribute {name!r}"
         )
 
-    ldics1 = sorted(ldics1, key=lambda d: d[col])
-    ldics2 = sorted(ldics2, key=lambda d: d[col])
-
-    joined_list = []
-    for dic1, dic2 in zip(ldics1, ldics2):
-        joined_list.append(dic1 | dic2)
+    value = getattr(import_module(lazy_imports[name]), name)
+    setattr(sys.modules[module_name], name, value)
 
-    return joined_list
+    return value
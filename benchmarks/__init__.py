@@ -0,0 +1,6 @@
+"""
+Offline benchmarks of the parsing of the saved basketball reference pages
+(see tests/fixtures).
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
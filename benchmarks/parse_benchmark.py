@@ -0,0 +1,325 @@
+"""
+This script benchmarks the parsing functions of the scrapers on the saved
+basketball reference pages, per parser backend. It runs fully offline, so
+it can be used to catch performance regressions before upgrading the
+parser libraries (or after changing the parsing functions).
+
+For every page, parsing function and backend it measures:
+- pages_per_s: pages per second (building the soup and parsing it)
+- soup_ms / parse_ms: median time of building the soup / of parsing it
+- peak_kb: peak memory allocated by python while parsing one page
+  (tracemalloc doesn't see the memory of the C trees of lxml and
+  selectolax, only the python objects built on top of them)
+
+python -m benchmarks.parse_benchmark --repeat 50 --save bench.json
+python -m benchmarks.parse_benchmark --compare bench.json
+python -m benchmarks.parse_benchmark --corpus path/to/saved/pages
+
+Author: Dominik Zulovec Sajovic, October 2026
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, NamedTuple
+from baskref.data_collection import BaskRefDataScraper, BaskRefUrlScraper
+from baskref.data_collection.parser_backends import (
+    PARSER_BACKENDS,
+    make_soup,
+)
+
+
+# the folder of the saved pages, by default the pages the tests use
+CORPUS_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "fixtures",
+)
+
+BOX_SCORES: dict[str, str] = {
+    "regular_season": "box_score_regular_season.html",
+    "playoffs": "box_score_playoffs.html",
+    "play_in": "box_score_play_in.html",
+    "in_season_tournament": "box_score_in_season_tournament.html",
+    "1950s": "box_score_1950s.html",
+}
+
+BOX_SCORE_PARSERS: tuple[str, ...] = (
+    "_parse_game_data",
+    "_parse_player_stats_data",
+)
+
+URL_PAGES: dict[str, tuple[str, str]] = {
+    "daily_games": ("daily_games.html", "_parse_daily_games"),
+    "season_games": ("season_games.html", "_parse_months_in_year"),
+    "month_games": ("month_games.html", "_parse_monthly_games"),
+}
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    A parsing function run on a saved page.
+    :page: name of the page (e.g. playoffs)
+    :file_name: the saved page in the corpus folder
+    :parse_fun_name: the parsing function of the scraper
+    :url_scraper: True for the functions of BaskRefUrlScraper
+    """
+
+    page: str
+    file_name: str
+    parse_fun_name: str
+    url_scraper: bool = False
+
+
+def benchmark_cases() -> list[BenchmarkCase]:
+    """All the benchmarked parsing functions and pages"""
+
+    cases = [
+        BenchmarkCase(page, file_name, parse_fun_name)
+        for page, file_name in BOX_SCORES.items()
+        for parse_fun_name in BOX_SCORE_PARSERS
+    ]
+    cases.extend(
+        BenchmarkCase(page, file_name, parse_fun_name, url_scraper=True)
+        for page, (file_name, parse_fun_name) in URL_PAGES.items()
+    )
+
+    return cases
+
+
+def read_page(file_name: str, corpus_dir: str = CORPUS_DIR) -> str:
+    """Reads a saved basketball reference page of the corpus"""
+
+    file_path = os.path.join(corpus_dir, file_name)
+    with open(file_path, encoding="UTF-8") as page_file:
+        return page_file.read()
+
+
+def available_backends() -> list[str]:
+    """The parser backends which are installed"""
+
+    backends = []
+    for backend in PARSER_BACKENDS:
+        try:
+            make_soup("<p></p>", backend)
+        except Exception:  # pylint: disable=broad-except
+            continue
+        backends.append(backend)
+
+    return backends
+
+
+def run_case(
+    case: BenchmarkCase,
+    backend: str,
+    repeat: int,
+    corpus_dir: str = CORPUS_DIR,
+) -> dict:
+    """
+    Benchmarks the case with the backend.
+    A parsing function which fails on the page is reported with its error
+    instead of the timings.
+    :corpus_dir: the folder of the saved pages
+    """
+
+    result: dict[str, Any] = {
+        "page": case.page,
+        "parser": case.parse_fun_name,
+        "backend": backend,
+    }
+
+    html = read_page(case.file_name, corpus_dir)
+    scraper = BaskRefUrlScraper() if case.url_scraper else BaskRefDataScraper()
+    parse_fun = getattr(scraper, case.parse_fun_name)
+
+    # the first run warms up the caches (e.g. the compiled regexes)
+    try:
+        parse_fun(make_soup(html, backend))
+    except Exception as exc:  # pylint: disable=broad-except
+        result["error"] = f"{type(exc).__name__}: {exc}"
+        return result
+
+    tracemalloc.start()
+    parse_fun(make_soup(html, backend))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    soup_time, parse_time = time_parsing(html, backend, parse_fun, repeat)
+
+    result["pages_per_s"] = round(1 / (soup_time + parse_time), 1)
+    result["soup_ms"] = round(soup_time * 1000, 3)
+    result["parse_ms"] = round(parse_time * 1000, 3)
+    result["peak_kb"] = round(peak / 1024, 1)
+
+    return result
+
+
+def time_parsing(
+    html: str, backend: str, parse_fun: Callable, repeat: int
+) -> tuple[float, float]:
+    """
+    Parses the page repeat times.
+    :return: the median time of building the soup and of parsing it
+    """
+
+    soup_times, parse_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        soup = make_soup(html, backend)
+        built = time.perf_counter()
+        parse_fun(soup)
+        soup_times.append(built - start)
+        parse_times.append(time.perf_counter() - built)
+
+    return statistics.median(soup_times), statistics.median(parse_times)
+
+
+def run_benchmarks(
+    backends: list[str],
+    repeat: int,
+    pages: list[str] | None = None,
+    corpus_dir: str = CORPUS_DIR,
+) -> list[dict]:
+    """
+    Benchmarks the cases with all the backends.
+    :pages: names of the benchmarked pages, default: all
+    :corpus_dir: the folder of the saved pages
+    """
+
+    return [
+        run_case(case, backend, repeat, corpus_dir)
+        for backend in backends
+        for case in benchmark_cases()
+        if pages is None or case.page in pages
+    ]
+
+
+def format_results(results: list[dict]) -> str:
+    """The results as a human readable table"""
+
+    lines = [
+        f"{'backend':<12}{'page':<22}{'parser':<26}"
+        f"{'pages/s':>10}{'soup ms':>10}{'parse ms':>10}{'peak KB':>10}"
+    ]
+
+    for res in results:
+        line = f"{res['backend']:<12}{res['page']:<22}{res['parser']:<26}"
+        if "error" in res:
+            lines.append(f"{line}  failed: {res['error']}")
+            continue
+        lines.append(
+            f"{line}{res['pages_per_s']:>10.1f}{res['soup_ms']:>10.2f}"
+            f"{res['parse_ms']:>10.2f}{res['peak_kb']:>10.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+def find_regressions(
+    results: list[dict], baseline: list[dict], tolerance: float
+) -> list[str]:
+    """
+    Compares the results with the results of an earlier run.
+    :tolerance: the allowed drop of the pages per second (0.25 -> 25%)
+    :return: a description of every case which got slower
+    """
+
+    def key(res: dict) -> tuple[str, str, str]:
+        return res["page"], res["parser"], res["backend"]
+
+    previous = {key(res): res for res in baseline}
+    regressions = []
+
+    for res in results:
+        before = previous.get(key(res))
+        if before is None or "pages_per_s" not in before:
+            continue
+
+        if "error" in res:
+            regressions.append(
+                f"{'/'.join(key(res))}: fails with {res['error']}"
+            )
+        elif res["pages_per_s"] < before["pages_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{'/'.join(key(res))}: {res['pages_per_s']} pages/s "
+                f"(was {before['pages_per_s']} pages/s)"
+            )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the benchmarks, returns 1 if there are regressions"""
+
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the parsing of the saved pages offline"
+    )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        action="append",
+        choices=PARSER_BACKENDS,
+        help="backend to benchmark (repeatable), default: all installed",
+    )
+    parser.add_argument(
+        "-p",
+        "--page",
+        action="append",
+        choices=[*BOX_SCORES, *URL_PAGES],
+        help="page to benchmark (repeatable), default: all",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=20,
+        help="number of times each page is parsed",
+    )
+    parser.add_argument(
+        "--corpus",
+        default=CORPUS_DIR,
+        help="folder of the saved pages, default: tests/fixtures",
+    )
+    parser.add_argument("--save", help="save the results into a JSON file")
+    parser.add_argument(
+        "--compare", help="compare with the results saved in a JSON file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed drop of the pages per second when comparing",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.backend or available_backends(),
+        args.repeat,
+        args.page,
+        args.corpus,
+    )
+    print(format_results(results))
+
+    if args.save:
+        with open(args.save, "w", encoding="UTF-8") as json_file:
+            json.dump(results, json_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="UTF-8") as json_file:
+            baseline = json.load(json_file)
+
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
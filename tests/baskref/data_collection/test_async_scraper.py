@@ -0,0 +1,160 @@
+"""
+Holds the tests for the async scraper classes
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import asyncio
+from unittest.mock import patch
+import pytest
+from baskref.data_collection.html_scraper import (
+    ScrapingError,
+    TooManyRequests,
+    PermissionDenied,
+)
+
+pytest.importorskip("aiohttp")
+
+# pylint: disable=wrong-import-position,protected-access,unused-argument
+from baskref.data_collection.async_html_scraper import (
+    AsyncHTMLScraper,
+    AsyncResponse,
+)
+from baskref.data_collection.rate_limiter import Backoff
+from baskref.data_collection.async_baskref_scraper import (
+    AsyncBaskRefUrlScraper,
+    AsyncBaskRefDataScraper,
+)
+from tests.fixtures import read_fixture
+
+
+def _fake_get_page(status_codes: dict, html: str):
+    """Creates a fake AsyncHTMLScraper.get_page"""
+
+    async def get_page(url: str, rand_agent: bool = False) -> AsyncResponse:
+        await asyncio.sleep(0)
+        return AsyncResponse(url, status_codes[rand_agent], html)
+
+    return get_page
+
+
+class TestAsyncHTMLScraper:
+    """Class for AsyncHTMLScraper class"""
+
+    test_get_pages_raise: list[tuple] = [
+        (429, TooManyRequests),
+        (403, PermissionDenied),
+        (404, ScrapingError),
+        (500, ScrapingError),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("code, raise_err", test_get_pages_raise)
+    def test_get_page_logic_raise(self, code, raise_err):
+        """Tests the function get_page_logic."""
+
+        scp = AsyncHTMLScraper(backoff=Backoff(base=0.0))
+        fake = _fake_get_page({False: code, True: code}, "<div>ok</div>")
+
+        with patch.object(scp, "get_page", fake):
+            with pytest.raises(raise_err):
+                asyncio.run(scp.get_page_logic("https://fake.url"))
+
+    @pytest.mark.unittest
+    def test_scrape_rand_agent_fallback(self):
+        """Tests that scrape falls back to a random user agent."""
+
+        scp = AsyncHTMLScraper()
+        fake = _fake_get_page({False: 429, True: 200}, "<p>27.2 ppg</p>")
+
+        with patch.object(scp, "get_page", fake):
+            text = asyncio.run(
+                scp.scrape("https://fake.url", lambda soup: soup.p.text)
+            )
+
+        assert text == "27.2 ppg"
+
+    @pytest.mark.unittest
+    def test_gather_order_and_raise(self):
+        """Tests that _gather keeps order and raises the first error."""
+
+        async def delayed(value: int):
+            await asyncio.sleep(0.01 * (5 - value))
+            if value == 3:
+                raise TooManyRequests("https://fake.url", 429)
+            return value
+
+        scp = AsyncHTMLScraper()
+
+        assert asyncio.run(scp._gather(delayed(v) for v in range(3))) == [
+            0,
+            1,
+            2,
+        ]
+
+        with pytest.raises(TooManyRequests):
+            asyncio.run(scp._gather(delayed(v) for v in range(5)))
+
+
+class TestAsyncBaskRefUrlScraper:
+    """Class for AsyncBaskRefUrlScraper class"""
+
+    @pytest.mark.unittest
+    def test_get_game_urls_year(self):
+        """Tests the month pages are parsed with the sync parsers."""
+
+        season_html = (
+            '<div class="filter"><div><a href="/m1.html">Oct</a></div>'
+            '<div><a href="/m2.html">Nov</a></div></div>'
+        )
+
+        def month_html(nr: int) -> str:
+            return (
+                '<td data-stat="box_score_text">'
+                f'<a href="/boxscores/{nr}.html">Box Score</a></td>'
+            )
+
+        pages = {
+            "https://br/leagues/NBA_2006_games.html": season_html,
+            "https://br/m1.html": month_html(1),
+            "https://br/m2.html": month_html(2),
+        }
+
+        async def get_page(url: str, rand_agent: bool = False):
+            return AsyncResponse(url, 200, pages[url])
+
+        scp = AsyncBaskRefUrlScraper(base_url="https://br")
+
+        with patch.object(scp, "get_page", get_page):
+            game_urls = asyncio.run(scp.get_game_urls_year(2006))
+
+        assert game_urls == [
+            "https://br/boxscores/1.html",
+            "https://br/boxscores/2.html",
+        ]
+        assert scp._parser.session is None
+
+
+class TestAsyncBaskRefDataScraper:
+    """Class for AsyncBaskRefDataScraper class"""
+
+    @pytest.mark.unittest
+    def test_get_games_and_player_stats_data(self):
+        """Tests the game pages are parsed and tagged like the sync ones."""
+
+        game_url = "https://br/boxscores/202201070ATL.html"
+        html = read_fixture("box_score_regular_season.html")
+
+        async def get_page(url: str, rand_agent: bool = False):
+            return AsyncResponse(url, 200, html)
+
+        scp = AsyncBaskRefDataScraper()
+
+        with patch.object(scp, "get_page", get_page):
+            games, players = asyncio.run(
+                scp.get_games_and_player_stats_data([game_url])
+            )
+
+        assert games[0]["game_id"] == players[0]["game_id"] == "202201070ATL"
+        assert {pl["game_url"] for pl in players} == {game_url}
+        assert scp._parser.session is None
@@ -3,3 +3,275 @@ Holds the tests for the basketball refernce data scraper class
 
 Author: Dominik Zulovec Sajovic - September 2022
 """
+
+import time
+from unittest.mock import patch
+import pytest
+from baskref.data_collection import (
+    BaskRefDataScraper,
+)
+from baskref.data_collection.html_scraper import (
+    TooManyRequests,
+    PermissionDenied,
+)
+from baskref.data_collection.parser_backends import make_soup
+from tests.fixtures import read_fixture
+
+# pylint: disable=protected-access
+
+
+def _fake_scrape_game_data(game_url: str) -> dict:
+    """Fake game scraper which finishes the first urls last"""
+
+    game_nr = int(game_url.split("/")[-1])
+    time.sleep(0.01 * (10 - game_nr))
+
+    if game_nr == 7:
+        raise TooManyRequests(game_url, 429)
+    if game_nr == 8:
+        raise PermissionDenied(game_url, 403)
+
+    return {"game_url": game_url}
+
+
+class TestBaskRefDataScraper:
+    """Class for BaskRefDataScraper class"""
+
+    test_workers: list[int] = [1, 2, 8]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", test_workers)
+    def test_get_games_data_order(self, workers):
+        """Tests that get_games_data keeps the order of the game urls."""
+
+        game_urls = [f"https://fake.url/{nr}" for nr in range(7)]
+        br_scraper = BaskRefDataScraper(workers=workers)
+
+        with patch.object(
+            br_scraper, "_scrape_game_data", _fake_scrape_game_data
+        ):
+            games = br_scraper.get_games_data(game_urls)
+
+        assert [game["game_url"] for game in games] == game_urls
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", test_workers)
+    def test_get_games_data_raise(self, workers):
+        """Tests that the first failing game url raises its error."""
+
+        game_urls = [f"https://fake.url/{nr}" for nr in range(10)]
+        br_scraper = BaskRefDataScraper(workers=workers)
+
+        with patch.object(
+            br_scraper, "_scrape_game_data", _fake_scrape_game_data
+        ):
+            with pytest.raises(TooManyRequests):
+                br_scraper.get_games_data(game_urls)
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", test_workers)
+    def test_get_games_and_player_stats_data(self, workers):
+        """Tests every game page is scraped once for both datasets."""
+
+        game_urls = [
+            "https://fake.url/boxscores/202201070ATL.html",
+            "https://fake.url/boxscores/202201070BOS.html",
+        ]
+        br_scraper = BaskRefDataScraper(workers=workers)
+
+        def fake_scrape(url, _parser_fun):
+            return {"home_team": url[-8:-5]}, [{"pl": 1}, {"pl": 2}]
+
+        with patch.object(br_scraper, "scrape", wraps=fake_scrape) as scp:
+            games, players = br_scraper.get_games_and_player_stats_data(
+                game_urls
+            )
+
+        assert scp.call_count == 2
+        assert [game["home_team"] for game in games] == ["ATL", "BOS"]
+        assert [game["game_id"] for game in games] == [
+            "202201070ATL",
+            "202201070BOS",
+        ]
+        assert len(players) == 4
+        assert players[2]["game_url"] == game_urls[1]
+
+    test_invalid_workers: list = [0, -3, None, 2.5]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", test_invalid_workers)
+    def test_workers_raise(self, workers):
+        """Tests that an invalid number of workers is rejected."""
+
+        with pytest.raises(ValueError):
+            BaskRefDataScraper(workers=workers)
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("parse_workers", [-1, None, 1.5])
+    def test_parse_workers_raise(self, parse_workers):
+        """Tests that an invalid number of parse workers is rejected."""
+
+        with pytest.raises(ValueError):
+            BaskRefDataScraper(parse_workers=parse_workers)
+
+    @pytest.mark.unittest
+    def test_parse_workers(self):
+        """Tests the process pool parses the same data in the same order."""
+
+        fixtures = {
+            f"https://fake.url/boxscores/20220107{nr}ABC.html": file_name
+            for nr, file_name in enumerate(
+                [
+                    "box_score_regular_season.html",
+                    "box_score_playoffs.html",
+                    "box_score_play_in.html",
+                    "box_score_in_season_tournament.html",
+                ]
+            )
+        }
+
+        def fake_fetch(url):
+            return read_fixture(fixtures[url])
+
+        data = {}
+        for parse_workers in [0, 2]:
+            br_scraper = BaskRefDataScraper(
+                workers=2, parse_workers=parse_workers
+            )
+            with patch.object(br_scraper, "fetch", fake_fetch):
+                data[
+                    parse_workers
+                ] = br_scraper.get_games_and_player_stats_data(fixtures)
+
+        games, players = data[2]
+
+        assert [game["game_url"] for game in games] == list(fixtures)
+        assert players[-1]["game_id"] == "202201073ABC"
+        assert data[2] == data[0]
+
+    test_game_info: list[tuple] = [
+        ("box_score_regular_season.html", 17358),
+        ("box_score_playoffs.html", 18013),
+        ("box_score_play_in.html", 18978),
+        ("box_score_in_season_tournament.html", 17987),
+        ("box_score_1950s.html", None),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("file_name, attendance", test_game_info)
+    def test_parse_game_info(self, file_name, attendance):
+        """Tests the attendance is parsed out of the labelled game info."""
+
+        br_scraper = BaskRefDataScraper()
+        game_page = make_soup(read_fixture(file_name))
+        game_info = br_scraper._parse_game_info(game_page)
+
+        assert game_info["Officials"] == "Scott Foster, Bill Kennedy"
+        assert ("Attendance" in game_info) == (attendance is not None)
+        assert br_scraper._parse_attendance(game_info) == attendance
+        assert br_scraper._parse_game_data(game_page)["attendance"] == (
+            attendance
+        )
+
+    test_backends: list[str] = ["html.parser", "lxml", "selectolax"]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("backend", test_backends)
+    def test_parse_game_info_layout(self, backend):
+        """Tests the labels are found at any depth of the info blocks."""
+
+        if backend != "html.parser":
+            pytest.importorskip(backend)
+
+        game_page = make_soup(
+            '<div id="content">'
+            '<div id="all_box"><div><strong>Notes:</strong> 1</div></div>'
+            '<div><div class="info"><div>'
+            "<strong>Attendance:\xa0</strong>\xa018,013</div>"
+            "<p><span><strong> Time of Game: </strong>2:11</span></p>"
+            "<div><strong>Inactive</strong> None</div>"
+            "</div></div></div>",
+            backend,
+        )
+        br_scraper = BaskRefDataScraper()
+
+        assert br_scraper._parse_game_info(game_page) == {
+            "Attendance": "18,013",
+            "Time of Game": "2:11",
+        }
+        assert not br_scraper._parse_game_info(make_soup("<div></div>"))
+
+    @pytest.mark.unittest
+    def test_parse_game_data_old_game(self):
+        """Tests the team stats of a game without the modern stats."""
+
+        game_page = make_soup(read_fixture("box_score_1950s.html"))
+        game = BaskRefDataScraper()._parse_game_data(game_page)
+
+        assert game["home_team"] == "MNL"
+        assert game["attendance"] is None
+        assert (game["home_fg"], game["home_fta"], game["home_pts"]) == (
+            69,
+            64,
+            175,
+        )
+        assert game["home_ft_pct"] == 0.578
+
+        # no three pointers, offensive rebounds or advanced stats
+        for stat in ["fg3", "fg3_pct", "orb", "tov", "ts_pct", "def_rtg"]:
+            assert game[f"home_{stat}"] is None
+            assert game[f"away_{stat}"] is None
+
+    @pytest.mark.unittest
+    def test_parse_player_stats_data_order(self):
+        """Tests the players keep the order of the box score."""
+
+        game_page = make_soup(read_fixture("box_score_regular_season.html"))
+        players = BaskRefDataScraper()._parse_player_stats_data(game_page)
+
+        box_score_ids = [
+            th["data-append-csv"]
+            for team in ["ATL", "MIL"]
+            for th in game_page.select(
+                f"#box-{team}-game-basic tbody > tr > th[data-append-csv]"
+            )
+        ]
+
+        assert [pl["player_id"] for pl in players] == box_score_ids
+        assert {pl["team"] for pl in players[:5]} == {"ATL"}
+
+    @pytest.mark.unittest
+    def test_parse_player_stats_data_one_table(self):
+        """Tests the players missing in one of the tables are kept."""
+
+        game_page = make_soup(read_fixture("box_score_regular_season.html"))
+        rows = "tbody > tr:not([class='thead'])"
+        advanced_rows = game_page.select(f"#box-ATL-game-advanced {rows}")
+        basic_rows = game_page.select(f"#box-ATL-game-basic {rows}")
+
+        only_basic = advanced_rows[0].th["data-append-csv"]
+        only_advanced = basic_rows[1].th["data-append-csv"]
+        advanced_rows[0].decompose()
+        basic_rows[1].decompose()
+
+        players = BaskRefDataScraper()._parse_player_stats_data(game_page)
+        by_id = {pl["player_id"]: pl for pl in players}
+
+        assert len(players) == 26
+        assert by_id[only_basic]["pts"] is not None
+        assert by_id[only_basic]["ts_pct"] is None
+        assert by_id[only_advanced]["pts"] is None
+        assert by_id[only_advanced]["ts_pct"] is not None
+        assert players.index(by_id[only_advanced]) == len(basic_rows) - 1
+
+    @pytest.mark.unittest
+    def test_parse_player_stats_data_old_game(self):
+        """Tests the player stats of a game without advanced stats."""
+
+        game_page = make_soup(read_fixture("box_score_1950s.html"))
+        players = BaskRefDataScraper()._parse_player_stats_data(game_page)
+
+        assert len(players) == 26
+        assert players[0]["team"] == "MNL"
+        assert all(pl["usg_pct"] is None for pl in players)
+        assert sum(pl["pts"] or 0 for pl in players[:13]) == 175
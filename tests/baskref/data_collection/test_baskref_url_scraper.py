@@ -5,6 +5,7 @@ Author: Dominik Zulovec Sajovic - August 2022
 """
 
 from datetime import date
+from unittest.mock import patch
 import pytest
 from baskref.data_collection import (
     BaskRefUrlScraper,
@@ -120,3 +121,136 @@ class TestBaskRefUrlScraper:
         with pytest.raises(raise_err.expected_exception):
             returned_status = br_scraper._generate_daily_games_url(game_date)
             assert expected_status == returned_status
+
+    @staticmethod
+    def _fake_scrape(url: str, _parser_fun) -> list:
+        """Fake scrape returning two months per season and games per month"""
+
+        if url.endswith("_games.html"):
+            year = url.split("_")[1]
+            return [f"/{year}-02.html", f"/{year}-06.html"]
+
+        year, month = url[1:-5].split("-")
+        return [f"/boxscores/{year}{month}{day:02}0BOS.html" for day in (1, 2)]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_get_game_urls_years(self, workers):
+        """Tests the game urls of multiple seasons are kept per season."""
+
+        br_scraper = BaskRefUrlScraper(base_url="", workers=workers)
+
+        with patch.object(br_scraper, "scrape", self._fake_scrape):
+            game_urls = br_scraper.get_game_urls_years([2005, 2006])
+            single_season = br_scraper.get_game_urls_year(2006)
+
+        assert list(game_urls) == [2005, 2006]
+        assert (
+            game_urls[2006]
+            == single_season
+            == [
+                "/boxscores/200602010BOS.html",
+                "/boxscores/200602020BOS.html",
+                "/boxscores/200606010BOS.html",
+                "/boxscores/200606020BOS.html",
+            ]
+        )
+
+    @pytest.mark.unittest
+    def test_get_game_urls_dates(self):
+        """Tests only the games between the dates are kept."""
+
+        br_scraper = BaskRefUrlScraper(base_url="")
+
+        with patch.object(br_scraper, "scrape", self._fake_scrape):
+            game_urls = br_scraper.get_game_urls_dates(
+                date(2005, 6, 2), date(2006, 2, 1)
+            )
+
+        assert game_urls == {
+            2005: ["/boxscores/200506020BOS.html"],
+            2006: ["/boxscores/200602010BOS.html"],
+        }
+
+    @pytest.mark.unittest
+    def test_get_game_urls_dates_months(self):
+        """Tests only the month pages overlapping the dates are scraped."""
+
+        months = ["october-2019", "november", "december", "january"]
+        month_urls = [f"/leagues/NBA_2020_games-{mon}.html" for mon in months]
+        br_scraper = BaskRefUrlScraper(base_url="")
+        scraped = []
+
+        def fake_scrape(url: str, _parser_fun) -> list:
+            scraped.append(url)
+            if url == "/leagues/NBA_2020_games.html":
+                return month_urls
+            return ["/boxscores/201912300BOS.html"]
+
+        with patch.object(br_scraper, "scrape", fake_scrape):
+            game_urls = br_scraper.get_game_urls_dates(
+                date(2019, 12, 30), date(2019, 12, 31)
+            )
+
+        assert game_urls == {2020: ["/boxscores/201912300BOS.html"]}
+        assert scraped == ["/leagues/NBA_2020_games.html", month_urls[2]]
+
+    @pytest.mark.unittest
+    def test_iter_game_urls_days(self):
+        """Tests the daily page of every day is scraped once."""
+
+        br_scraper = BaskRefUrlScraper(base_url="")
+        scraped = []
+
+        def fake_get_game_urls_day(game_date: date) -> list:
+            scraped.append(game_date)
+            return [f"/boxscores/{game_date:%Y%m%d}0BOS.html"]
+
+        with patch.object(
+            br_scraper, "get_game_urls_day", fake_get_game_urls_day
+        ):
+            game_urls = list(
+                br_scraper.iter_game_urls_days(
+                    date(2022, 9, 30), date(2022, 10, 1)
+                )
+            )
+
+        assert game_urls == [
+            (2022, "/boxscores/202209300BOS.html"),
+            (2023, "/boxscores/202210010BOS.html"),
+        ]
+        assert scraped == [date(2022, 9, 30), date(2022, 10, 1)]
+
+    test_month_urls: list[tuple] = [
+        (2022, "/leagues/NBA_2022_games-october.html", (2021, 10)),
+        (2022, "/leagues/NBA_2022_games-june.html", (2022, 6)),
+        (2020, "/leagues/NBA_2020_games-october-2020.html", (2020, 10)),
+        (2020, "/leagues/NBA_2020_games-august.html", (2020, 8)),
+        (2022, "/2022-02.html", None),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("year, month_url, expected", test_month_urls)
+    def test_parse_month(self, year, month_url, expected):
+        """Tests the function _parse_month."""
+
+        assert BaskRefUrlScraper._parse_month(year, month_url) == expected
+
+    @pytest.mark.unittest
+    def test_iter_game_urls_years_lazy(self):
+        """Tests the first game urls come before all the months are scraped."""
+
+        br_scraper = BaskRefUrlScraper(base_url="")
+        scraped = []
+
+        def fake_scrape(url: str, parser_fun) -> list:
+            scraped.append(url)
+            return self._fake_scrape(url, parser_fun)
+
+        with patch.object(br_scraper, "scrape", fake_scrape):
+            game_urls = br_scraper.iter_game_urls_years([2005, 2006])
+
+            assert next(game_urls) == (2005, "/boxscores/200502010BOS.html")
+            assert scraped == ["/leagues/NBA_2005_games.html", "/2005-02.html"]
+
+            assert len(list(game_urls)) == 7
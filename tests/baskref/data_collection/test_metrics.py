@@ -0,0 +1,126 @@
+"""
+Holds the tests for the scraping metrics
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from datetime import timedelta
+import json
+from unittest.mock import patch
+import pytest
+from requests import Response
+from baskref.data_collection.html_scraper import HTMLScraper
+from baskref.data_collection.metrics import Histogram, ScrapeMetrics
+from baskref.data_collection.rate_limiter import Backoff
+
+BOX_SCORE_URL = "https://www.basketball-reference.com/boxscores/2022.html"
+
+
+def _generate_response(html_cont: str, status_code: int) -> Response:
+    """Generates a requests.Response to be used for testing"""
+
+    res = Response()
+    res._content = html_cont.encode("utf-8")  # pylint: disable=W0212
+    res.status_code = status_code
+    res.elapsed = timedelta(milliseconds=30)
+
+    return res
+
+
+class TestHistogram:
+    """Class for Histogram class"""
+
+    @pytest.mark.unittest
+    def test_add(self):
+        """Tests the durations are counted into their buckets."""
+
+        hist = Histogram(bounds=(0.01, 0.1, 1.0))
+        for value in [0.005, 0.05, 0.06, 0.5, 3.0]:
+            hist.add(value)
+
+        assert hist.buckets == [1, 2, 1, 1]
+        assert hist.count == 5
+        assert hist.max == 3.0
+        assert hist.to_dict()["mean"] == pytest.approx(0.723)
+        assert hist.to_dict()["buckets"] == {
+            "<=0.01": 1,
+            "<=0.1": 2,
+            "<=1.0": 1,
+            ">1.0": 1,
+        }
+
+    test_quantiles: list[tuple] = [(0.2, 0.01), (0.5, 0.1), (0.8, 1.0)]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("quant, expected_status", test_quantiles)
+    def test_quantile(self, quant, expected_status):
+        """Tests the quantile is the upper bound of its bucket."""
+
+        hist = Histogram(bounds=(0.01, 0.1, 1.0))
+        for value in [0.005, 0.05, 0.06, 0.5, 3.0]:
+            hist.add(value)
+
+        assert hist.quantile(quant) == expected_status
+        assert hist.quantile(1.0) == 3.0
+        assert Histogram().quantile(0.5) == 0.0
+
+
+class TestScrapeMetrics:
+    """Class for ScrapeMetrics class"""
+
+    @pytest.mark.unittest
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_scrape(self, req_mock, _sleep_mock):
+        """Tests the requests, retries and timings are recorded."""
+
+        req_mock.side_effect = [
+            _generate_response("<div>slow down</div>", 429),
+            _generate_response("<div>slow down</div>", 429),
+            _generate_response("<div>27.2 ppg</div>", 200),
+        ]
+
+        metrics = ScrapeMetrics()
+        scp = HTMLScraper(backoff=Backoff(retries=3), metrics=metrics)
+        text = scp.scrape(BOX_SCORE_URL, lambda soup: soup.div.text)
+
+        report = metrics.report()
+
+        assert text == "27.2 ppg"
+        assert list(report) == ["box_score"]
+
+        box_scores = report["box_score"]
+        assert box_scores["requests"] == 3
+        assert box_scores["retries"] == 2
+        assert box_scores["status_codes"] == {"429": 2, "200": 1}
+        assert box_scores["bytes"] == 2 * 20 + 19
+        assert box_scores["timings"]["ttfb"]["count"] == 3
+        assert box_scores["timings"]["ttfb"]["mean"] == pytest.approx(0.03)
+        assert box_scores["timings"]["soup"]["count"] == 1
+        assert box_scores["timings"]["parse"]["count"] == 1
+
+    @pytest.mark.unittest
+    def test_report(self, tmp_path):
+        """Tests the report is formatted and saved as JSON."""
+
+        metrics = ScrapeMetrics()
+        metrics.record_request(
+            BOX_SCORE_URL, _generate_response("<p></p>", 200), 0.05
+        )
+        metrics.record_cache_hit("https://www.basketball-reference.com")
+
+        assert metrics.format_report().splitlines()[:2] == [
+            "box_score: 1 requests (200: 1), 0 cached, 0 retries, 0.0 MB",
+            "    ttfb     n=1      mean=30.0ms p50<=30ms p90<=30ms "
+            "p99<=30ms max=30ms",
+        ]
+        assert "other: 0 requests (none), 1 cached" in metrics.format_report()
+
+        file_path = tmp_path / "metrics.json"
+        metrics.save_json(str(file_path))
+
+        saved = json.loads(file_path.read_text(encoding="UTF-8"))
+        assert saved == metrics.report()
+        assert saved["box_score"]["timings"]["download"]["max"] == (
+            pytest.approx(0.02)
+        )
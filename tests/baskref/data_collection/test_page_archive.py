@@ -0,0 +1,93 @@
+"""
+Holds the tests for the archive of the game pages
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from datetime import date
+from unittest.mock import patch
+import pytest
+from baskref.data_collection import BaskRefDataScraper
+from baskref.data_collection.html_scraper import ScrapingError
+from baskref.data_collection.page_archive import (
+    PageArchive,
+    parse_game_date,
+)
+from tests.fixtures import read_fixture
+
+BR_URL = "https://www.basketball-reference.com"
+
+
+class TestPageArchive:
+    """Class for PageArchive class"""
+
+    @pytest.mark.unittest
+    def test_store_load(self, tmp_path):
+        """Tests that a stored page is loaded back unchanged."""
+
+        archive = PageArchive(str(tmp_path))
+        archive.store("202201070ATL", "<html>Čačak</html>")
+
+        assert archive.load("202201070ATL") == "<html>Čačak</html>"
+        assert archive.load("202201070BOS") is None
+        assert "202201070ATL" in archive
+        assert "202201070BOS" not in archive
+        assert (tmp_path / "2022" / "202201070ATL.html.gz").exists()
+
+    @pytest.mark.unittest
+    def test_iter_game_ids(self, tmp_path):
+        """Tests that the archived games are listed ordered by date."""
+
+        archive = PageArchive(str(tmp_path))
+        assert not list(archive.iter_game_ids())
+
+        for game_id in ["202201070BOS", "195001140MNL", "202201060ATL"]:
+            archive.store(game_id, "<html></html>")
+        (tmp_path / "2022" / "notes.txt").write_text("not a page")
+
+        assert list(archive.iter_game_ids()) == [
+            "195001140MNL",
+            "202201060ATL",
+            "202201070BOS",
+        ]
+
+    @pytest.mark.unittest
+    def test_parse_game_date(self):
+        """Tests the function parse_game_date."""
+
+        assert parse_game_date("202201070BOS") == date(2022, 1, 7)
+
+    @pytest.mark.unittest
+    def test_archive_and_offline(self, tmp_path):
+        """Tests that the offline scraper parses the archived pages."""
+
+        game_url = f"{BR_URL}/boxscores/202201070ATL.html"
+        archive = PageArchive(str(tmp_path))
+        html = read_fixture("box_score_regular_season.html")
+
+        online_scraper = BaskRefDataScraper(archive=archive)
+        with patch(
+            "baskref.data_collection.html_scraper.HTMLScraper.fetch",
+            return_value=html,
+        ):
+            online_games = online_scraper.get_games_data([game_url])
+
+        assert archive.load("202201070ATL") == html
+
+        offline_scraper = BaskRefDataScraper(archive=archive, offline=True)
+        with patch("requests.Session.get") as get:
+            offline_games = offline_scraper.get_games_data([game_url])
+            with pytest.raises(ScrapingError):
+                offline_scraper.get_games_data(
+                    [f"{BR_URL}/boxscores/202201070BOS.html"]
+                )
+
+        assert get.call_count == 0
+        assert offline_games == online_games
+
+    @pytest.mark.unittest
+    def test_offline_without_archive(self):
+        """Tests that the offline mode requires an archive."""
+
+        with pytest.raises(ValueError):
+            BaskRefDataScraper(offline=True)
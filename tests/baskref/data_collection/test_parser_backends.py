@@ -0,0 +1,79 @@
+"""
+Holds the tests for the html parser backends
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import pytest
+from baskref.data_collection import (
+    BaskRefUrlScraper,
+    BaskRefDataScraper,
+)
+from baskref.data_collection.parser_backends import make_soup
+from tests.fixtures import read_fixture
+
+# pylint: disable=protected-access
+
+# the optional backends (named after the module they need)
+backends = ["lxml", "selectolax"]
+
+box_scores = [
+    "box_score_regular_season.html",
+    "box_score_playoffs.html",
+    "box_score_play_in.html",
+    "box_score_in_season_tournament.html",
+]
+
+
+class TestParserBackends:
+    """Class for the parser backends"""
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("backend", backends)
+    @pytest.mark.parametrize("file_name", box_scores)
+    def test_game_data_identical(self, backend, file_name):
+        """Tests the game parsers return the same data on every backend."""
+
+        pytest.importorskip(backend)
+        html = read_fixture(file_name)
+        br_scraper = BaskRefDataScraper()
+
+        expected = br_scraper._parse_game_and_player_stats_data(
+            make_soup(html, "html.parser")
+        )
+        returned = br_scraper._parse_game_and_player_stats_data(
+            make_soup(html, backend)
+        )
+
+        assert returned == expected
+
+    test_url_parsers: list[tuple] = [
+        ("daily_games.html", "_parse_daily_games", 5),
+        ("season_games.html", "_parse_months_in_year", 9),
+        ("month_games.html", "_parse_monthly_games", 37),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("backend", backends)
+    @pytest.mark.parametrize("file_name, parser, count", test_url_parsers)
+    def test_url_parsers_identical(self, backend, file_name, parser, count):
+        """Tests the url parsers return the same urls on every backend."""
+
+        pytest.importorskip(backend)
+        html = read_fixture(file_name)
+        parser_fun = getattr(BaskRefUrlScraper(), parser)
+
+        expected = parser_fun(make_soup(html, "html.parser"))
+
+        assert len(expected) == count
+        assert parser_fun(make_soup(html, backend)) == expected
+
+    @pytest.mark.unittest
+    def test_make_soup_raise(self):
+        """Tests an unknown backend is rejected."""
+
+        with pytest.raises(ValueError):
+            make_soup("<p></p>", "html5")
+
+        with pytest.raises(ValueError):
+            BaskRefDataScraper(parser="html5")
@@ -0,0 +1,109 @@
+"""
+Holds the tests for the rate limiter and backoff classes
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+from baskref.data_collection.rate_limiter import (
+    RateLimiter,
+    Backoff,
+    parse_retry_after,
+)
+
+
+class TestRateLimiter:
+    """Class for RateLimiter class"""
+
+    test_bursts: list[tuple] = [
+        (1.0, 1),
+        (0.5, 3),
+        (10.0, 5),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("rate, burst", test_bursts)
+    def test_reserve(self, rate, burst):
+        """Tests the burst is free and the next request waits 1/rate."""
+
+        limiter = RateLimiter(rate, burst)
+
+        waits = [limiter.reserve() for _ in range(burst)]
+        assert waits == [0.0] * burst
+
+        assert limiter.reserve() == pytest.approx(1 / rate, rel=0.05)
+        assert limiter.reserve() == pytest.approx(2 / rate, rel=0.05)
+
+    @pytest.mark.unittest
+    def test_pause(self):
+        """Tests that a pause holds back the requests."""
+
+        limiter = RateLimiter(100.0, 10)
+        limiter.pause(5)
+
+        assert limiter.reserve() == pytest.approx(5, rel=0.05)
+
+    test_limiter_raise: list[tuple] = [
+        (0, 1),
+        (-1, 1),
+        (1, 0),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("rate, burst", test_limiter_raise)
+    def test_rate_limiter_raise(self, rate, burst):
+        """Tests that invalid rates and bursts are rejected."""
+
+        with pytest.raises(ValueError):
+            RateLimiter(rate, burst)
+
+
+class TestBackoff:
+    """Class for Backoff class"""
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("attempt", [0, 1, 2, 3, 10])
+    def test_delay(self, attempt):
+        """Tests the delay grows exponentially up to the cap."""
+
+        backoff = Backoff(base=2.0, cap=10.0)
+
+        for _ in range(20):
+            delay = backoff.delay(attempt)
+            assert 0 <= delay <= min(10.0, 2.0 * 2**attempt)
+
+    @pytest.mark.unittest
+    def test_delay_retry_after(self):
+        """Tests the Retry-After header is honored up to the cap."""
+
+        assert Backoff(cap=10.0).delay(0, "3") == 3
+        assert Backoff(cap=10.0).delay(0, "120") == 10
+        assert Backoff(cap=10.0).delay(0, "1e308") == 10
+
+    test_retry_afters: list[tuple] = [
+        ("3", 3.0),
+        ("0", 0.0),
+        ("-5", 0.0),
+        ("", None),
+        (None, None),
+        ("soon", None),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("retry_after, expected", test_retry_afters)
+    def test_parse_retry_after(self, retry_after, expected):
+        """Tests the function parse_retry_after."""
+
+        assert parse_retry_after(retry_after) == expected
+
+    @pytest.mark.unittest
+    def test_parse_retry_after_date(self):
+        """Tests the function parse_retry_after with a HTTP date."""
+
+        retry_date = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        assert parse_retry_after(
+            format_datetime(retry_date, usegmt=True)
+        ) == pytest.approx(60, abs=2)
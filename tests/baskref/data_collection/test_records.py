@@ -0,0 +1,103 @@
+"""
+Holds the tests for the records of the scraped rows
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import csv
+import pickle
+import sys
+import pytest
+from baskref.data_collection.records import GameRecord, PlayerStatRecord
+from baskref.data_saving.file_saver import CSVStreamWriter
+from baskref.data_saving.schema import PLAYER_STATS_COLUMNS
+from tests.fixtures import parse_fixture
+
+# the fields of the records are generated out of the schema
+# pylint: disable=no-member
+
+
+class TestRecords:
+    """Class for GameRecord and PlayerStatRecord classes"""
+
+    @pytest.mark.unittest
+    def test_dict_view(self):
+        """Tests the record can be used like a dictionary."""
+
+        record = PlayerStatRecord(player_id="doejo01", pts=27)
+        record["ast"] = 8
+
+        assert record.pts == 27
+        assert record["ast"] == record.ast == 8
+        assert record["trb"] is None
+        assert record.get("missing", 0) == 0
+        assert "pts" in record and "missing" not in record
+        assert list(record) == [name for name, _ in PLAYER_STATS_COLUMNS]
+        assert record.to_dict() == dict(record) == {**record}
+        assert record == PlayerStatRecord(ast=8, pts=27, player_id="doejo01")
+        assert record != PlayerStatRecord(player_id="doejo01")
+
+    @pytest.mark.unittest
+    def test_delete(self):
+        """Tests deleting the fields of the record sets them to None."""
+
+        record = PlayerStatRecord(player_id="doejo01", pts=27, ast=8)
+
+        del record["pts"]
+        assert record.pop("ast") == 8
+        assert record.pts is None and record.ast is None
+        assert len(record) == len(PLAYER_STATS_COLUMNS)
+
+        record.clear()
+        assert record == PlayerStatRecord()
+
+    test_unknown_column: list = [
+        lambda: PlayerStatRecord(missing=1),
+        lambda: PlayerStatRecord().__setitem__("missing", 1),
+        lambda: PlayerStatRecord()["missing"],
+        lambda: PlayerStatRecord().__delitem__("missing"),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("fun", test_unknown_column)
+    def test_unknown_column_raise(self, fun):
+        """Tests the columns which are not in the schema are rejected."""
+
+        with pytest.raises((ValueError, KeyError)):
+            fun()
+
+    @pytest.mark.unittest
+    def test_parsed_records(self):
+        """Tests the scraper produces compact records which pickle."""
+
+        file_name = "box_score_playoffs.html"
+        game = parse_fixture(file_name, "_parse_game_data")[0]
+        players = parse_fixture(file_name, "_parse_player_stats_data")
+
+        assert isinstance(game, GameRecord)
+        assert all(isinstance(pl, PlayerStatRecord) for pl in players)
+        assert game.game_id == players[0].game_id == "box_score_playoffs"
+        assert pickle.loads(pickle.dumps(players)) == players
+
+        # no per row dictionary
+        assert not hasattr(game, "__dict__")
+        assert sys.getsizeof(game) < sys.getsizeof(game.to_dict()) / 2
+
+    @pytest.mark.unittest
+    def test_save_records(self, tmp_path):
+        """Tests the records are saved like dictionaries."""
+
+        players = parse_fixture(
+            "box_score_regular_season.html", "_parse_player_stats_data"
+        )
+        file_path = tmp_path / "players.csv"
+
+        with CSVStreamWriter(str(file_path)) as writer:
+            writer.write_rows(players)
+
+        with open(file_path, newline="", encoding="UTF-8") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+
+        assert len(rows) == len(players)
+        assert list(rows[0]) == list(players[0])
+        assert rows[0]["player_id"] == players[0].player_id
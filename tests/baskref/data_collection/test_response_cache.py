@@ -0,0 +1,103 @@
+"""
+Holds the tests for the response cache
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from datetime import date
+from unittest.mock import patch
+import pytest
+from requests import Response
+from baskref.data_collection.html_scraper import HTMLScraper
+from baskref.data_collection.response_cache import (
+    ResponseCache,
+    classify_url,
+)
+
+BR_URL = "https://www.basketball-reference.com"
+
+
+def _generate_response(html_cont: str, status_code: int, **headers):
+    """Generates a requests.Response to be used for testing"""
+
+    res = Response()
+    res._content = html_cont.encode("utf-8")  # pylint: disable=W0212
+    res.status_code = status_code
+    res.encoding = "utf-8"
+    res.headers.update(headers)
+
+    return res
+
+
+class TestResponseCache:
+    """Class for ResponseCache class"""
+
+    test_url_classes: list[tuple] = [
+        (f"{BR_URL}/boxscores/202201070ATL.html", "box_score"),
+        (f"{BR_URL}/boxscores/?month=1&day=7&year=2022", "past_schedule"),
+        (f"{BR_URL}/boxscores/?month=3&day=9&year=2024", "current_schedule"),
+        (f"{BR_URL}/boxscores/?month=3&day=10&year=2024", "current_schedule"),
+        (f"{BR_URL}/boxscores/?month=3&year=2024", "other"),
+        (f"{BR_URL}/leagues/NBA_2006_games.html", "past_schedule"),
+        (f"{BR_URL}/leagues/NBA_2023_games-april.html", "past_schedule"),
+        (f"{BR_URL}/leagues/NBA_2024_games-march.html", "current_schedule"),
+        (f"{BR_URL}/playoffs/NBA_2024_games.html", "current_schedule"),
+        (f"{BR_URL}/players/j/jamesle01.html", "other"),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("url, expected_class", test_url_classes)
+    def test_classify_url(self, url, expected_class):
+        """Tests the function classify_url."""
+
+        assert classify_url(url, date(2024, 3, 10)) == expected_class
+
+    @pytest.mark.unittest
+    def test_store_load(self, tmp_path):
+        """Tests a stored response can be loaded back."""
+
+        url = f"{BR_URL}/boxscores/202201070ATL.html"
+        cache = ResponseCache(str(tmp_path))
+
+        assert cache.load(url) is None
+
+        cache.store(url, _generate_response("<p>Škoda</p>", 200, ETag="x1"))
+        page = cache.load(url)
+
+        assert page.etag == "x1"
+        assert page.validators() == {"If-None-Match": "x1"}
+        assert page.to_response().text == "<p>Škoda</p>"
+        assert cache.is_fresh(page)
+
+    @pytest.mark.unittest
+    @patch("requests.Session.get")
+    def test_get_page_immutable(self, req_mock, tmp_path):
+        """Tests box scores are only downloaded once."""
+
+        url = f"{BR_URL}/boxscores/202201070ATL.html"
+        req_mock.return_value = _generate_response("<p>box</p>", 200)
+
+        scp = HTMLScraper(cache=ResponseCache(str(tmp_path)))
+
+        assert scp.get_page_logic(url).text == "<p>box</p>"
+        assert scp.get_page_logic(url).text == "<p>box</p>"
+        assert req_mock.call_count == 1
+
+    @pytest.mark.unittest
+    @patch("requests.Session.get")
+    def test_get_page_revalidate(self, req_mock, tmp_path):
+        """Tests stale pages are revalidated with the stored ETag."""
+
+        url = f"{BR_URL}/players/j/jamesle01.html"
+        cache = ResponseCache(str(tmp_path), {"other": 0})
+        scp = HTMLScraper(cache=cache)
+
+        req_mock.return_value = _generate_response("<p>v1</p>", 200, ETag="a")
+        scp.get_page_logic(url)
+
+        req_mock.return_value = _generate_response("", 304)
+        page = scp.get_page_logic(url)
+
+        assert page.status_code == 200
+        assert page.text == "<p>v1</p>"
+        assert req_mock.call_args.kwargs["headers"] == {"If-None-Match": "a"}
@@ -9,9 +9,12 @@ from unittest.mock import patch
 import pytest
 from requests import Response
 from baskref.data_collection.html_scraper import (
+    create_session,
     HTMLScraper,
     ScrapingError,
+    TooManyRequests,
 )
+from baskref.data_collection.rate_limiter import Backoff
 
 # pylint: disable=protected-access
 
@@ -50,6 +53,59 @@ class TestScraper:
         assert page.text == website_html
         assert page.status_code == code
 
+    @pytest.mark.unittest
+    @patch("requests.Session.get")
+    def test_get_page_shared_session(self, req_mock):
+        """Tests that scrapers sharing a session reuse the same pool."""
+
+        req_mock.return_value = self._generate_response("<p>ok</p>", 200)
+
+        session = create_session()
+        scp1 = HTMLScraper(session=session)
+        scp2 = HTMLScraper(session=session)
+
+        scp1.get_page("https://fake.url/1")
+        scp2.get_page("https://fake.url/2")
+
+        assert scp1.session is scp2.session
+        assert req_mock.call_count == 2
+
+    @pytest.mark.unittest
+    @patch("requests.Session.get")
+    def test_session_on_first_request(self, req_mock):
+        """Tests the session is only created by the first request."""
+
+        req_mock.return_value = self._generate_response("<p>ok</p>", 200)
+
+        with HTMLScraper() as scp:
+            assert scp.session is None
+
+            scp.get_page("https://fake.url/1")
+            session = scp.session
+            scp.get_page("https://fake.url/2")
+
+            assert session is not None and scp.session is session
+
+    test_create_sessions: list[tuple] = [
+        (10, 10, True),
+        (1, 32, True),
+        (4, 4, False),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize(
+        "pool_connections, pool_maxsize, keep_alive", test_create_sessions
+    )
+    def test_create_session(self, pool_connections, pool_maxsize, keep_alive):
+        """Tests the function create_session."""
+
+        session = create_session(pool_connections, pool_maxsize, keep_alive)
+        adapter = session.get_adapter("https://fake.url")
+
+        assert adapter._pool_connections == pool_connections
+        assert adapter._pool_maxsize == pool_maxsize
+        assert (session.headers["Connection"] == "keep-alive") == keep_alive
+
     test_get_pages_raise: list[tuple] = [
         (404, None, pytest.raises(ScrapingError)),
         (100, None, pytest.raises(ScrapingError)),
@@ -73,6 +129,64 @@ class TestScraper:
             returned_status = scp.get_page_logic("https://fake.url")
             assert expected_status == returned_status
 
+    @pytest.mark.unittest
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_get_page_logic_backoff(self, req_mock, sleep_mock):
+        """Tests throttled requests are retried honoring Retry-After."""
+
+        throttled = self._generate_response("<div>slow down</div>", 429)
+        throttled.headers["Retry-After"] = "7"
+        req_mock.side_effect = [
+            throttled,
+            throttled,
+            throttled,
+            self._generate_response("<div>ok</div>", 200),
+        ]
+
+        scp = HTMLScraper(backoff=Backoff(retries=3))
+        page = scp.get_page_logic("https://fake.url")
+
+        assert page.status_code == 200
+        assert req_mock.call_count == 4
+        sleep_mock.assert_called_with(7.0)
+
+    @pytest.mark.unittest
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_get_page_logic_backoff_raise(self, req_mock, sleep_mock):
+        """Tests TooManyRequests is raised once the retries run out."""
+
+        req_mock.return_value = self._generate_response("<div>no</div>", 429)
+
+        scp = HTMLScraper(backoff=Backoff(retries=2))
+
+        with pytest.raises(TooManyRequests):
+            scp.get_page_logic("https://fake.url")
+
+        assert req_mock.call_count == 4
+        assert sleep_mock.call_count == 2
+
+    test_workers: list[int] = [1, 2, 8]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("workers", test_workers)
+    def test_imap_lazy(self, workers):
+        """Tests that _imap only runs a few items ahead of the consumer."""
+
+        started = []
+
+        def fun(item: int) -> int:
+            started.append(item)
+            return item * 2
+
+        scp = HTMLScraper(workers=workers)
+        results = scp._imap(fun, range(1000))
+
+        assert next(results) == 0
+        assert len(started) <= 2 * workers
+        assert list(results) == [item * 2 for item in range(1, 1000)]
+
     test_succ_codes: list[tuple] = [
         (0, False),
         (20, False),
@@ -0,0 +1,105 @@
+"""
+Holds the tests for the table extractor
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import pytest
+from baskref.data_collection.parser_backends import make_soup
+from baskref.data_collection.table_extractor import (
+    Column,
+    read_cells,
+    extract_columns,
+    empty_columns,
+    prefix_columns,
+)
+from baskref.utils import num
+
+ROW_HTML = (
+    "<table><tbody><tr>"
+    '<th data-stat="player" data-append-csv="jamesle01">'
+    '<a href="/players/j/jamesle01.html">LeBron James</a></th>'
+    '<td data-stat="mp">38:12</td>'
+    '<td data-stat="pts">31</td>'
+    '<td data-stat="fg_pct">.524</td>'
+    '<td data-stat="fg3_pct"></td>'
+    "<td>no stat</td>"
+    "</tr></tbody></table>"
+)
+
+columns = (
+    Column("player_name", "player", str),
+    Column("player_id", "player", str, attr="data-append-csv"),
+    Column("mp", "mp", str),
+    Column("pts", "pts", num),
+    Column("fg_pct", "fg_pct", num),
+    Column("fg3_pct", "fg3_pct", float, 0.0),
+    Column("plsmin", "plus_minus", num),
+)
+
+
+class TestTableExtractor:
+    """Class for the table extractor functions"""
+
+    test_backends: list[str] = ["html.parser", "lxml", "selectolax"]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("backend", test_backends)
+    def test_read_cells(self, backend):
+        """Tests the function read_cells."""
+
+        if backend != "html.parser":
+            pytest.importorskip(backend)
+
+        row = make_soup(ROW_HTML, backend).select_one("tr")
+        cells = read_cells(row)
+
+        assert list(cells) == ["player", "mp", "pts", "fg_pct", "fg3_pct"]
+        assert cells["pts"].text == "31"
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("backend", test_backends)
+    def test_extract_columns(self, backend):
+        """Tests the function extract_columns."""
+
+        if backend != "html.parser":
+            pytest.importorskip(backend)
+
+        row = make_soup(ROW_HTML, backend).select_one("tr")
+
+        assert extract_columns(read_cells(row), columns) == {
+            "player_name": "LeBron James",
+            "player_id": "jamesle01",
+            "mp": "38:12",
+            "pts": 31,
+            "fg_pct": 0.524,
+            "fg3_pct": 0.0,
+            "plsmin": None,
+        }
+
+    @pytest.mark.unittest
+    def test_extract_columns_into(self):
+        """Tests the values are written into the given mapping."""
+
+        row = make_soup(ROW_HTML).select_one("tr")
+        values = {"team": "LAL", "pts": 0}
+
+        returned = extract_columns(read_cells(row), columns[2:4], values)
+
+        assert returned is values
+        assert values == {"team": "LAL", "pts": 31, "mp": "38:12"}
+
+    @pytest.mark.unittest
+    def test_empty_columns(self):
+        """Tests the function empty_columns."""
+
+        assert empty_columns(columns[2:4]) == {"mp": None, "pts": None}
+
+    @pytest.mark.unittest
+    def test_prefix_columns(self):
+        """Tests the function prefix_columns."""
+
+        prefixed = prefix_columns(columns[2:4], "home_")
+
+        assert [col.name for col in prefixed] == ["home_mp", "home_pts"]
+        assert [col.stat for col in prefixed] == ["mp", "pts"]
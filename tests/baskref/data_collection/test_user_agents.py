@@ -0,0 +1,128 @@
+"""
+Holds the tests for the pool of user agents
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from unittest.mock import patch
+import pytest
+from requests import Response
+from baskref.data_collection.html_scraper import HTMLScraper
+from baskref.data_collection.user_agents import (
+    USER_AGENTS,
+    UserAgentPool,
+    default_user_agent_pool,
+)
+
+BOX_SCORE_URL = "https://www.basketball-reference.com/boxscores/2022.html"
+
+
+def _generate_response(status_code: int) -> Response:
+    """Generates a requests.Response to be used for testing"""
+
+    res = Response()
+    res._content = b"<div>27.2 ppg</div>"  # pylint: disable=W0212
+    res.status_code = status_code
+
+    return res
+
+
+class TestUserAgentPool:
+    """Class for UserAgentPool class"""
+
+    @pytest.mark.unittest
+    def test_round_robin(self):
+        """Tests the user agents are used one after another."""
+
+        pool = UserAgentPool(["a", "b", "c"])
+
+        assert [pool.next() for _ in range(5)] == ["a", "b", "c", "a", "b"]
+
+    @pytest.mark.unittest
+    def test_random(self):
+        """Tests the random rotation is repeatable with the same seed."""
+
+        pools = [UserAgentPool(USER_AGENTS, "random", seed=7) for _ in "ab"]
+        rotations = [[pool.next() for _ in range(20)] for pool in pools]
+
+        assert rotations[0] == rotations[1]
+        assert len(set(rotations[0])) > 1
+
+    @pytest.mark.unittest
+    def test_best(self):
+        """Tests the user agents the server accepts are preferred."""
+
+        pool = UserAgentPool(["a", "b", "c"], "best")
+        assert pool.next() == "a"
+
+        pool.record("a", False)
+        pool.record("b", True)
+        pool.record("unknown", True)
+
+        assert pool.next() == "b"
+        assert pool.stats() == {
+            "a": {"requests": 1, "successes": 0},
+            "b": {"requests": 1, "successes": 1},
+        }
+        assert pool.format_stats().splitlines() == ["0/1 ok  a", "1/1 ok  b"]
+
+    @pytest.mark.unittest
+    def test_from_file(self, tmp_path):
+        """Tests the user agents are loaded from a file."""
+
+        file_path = tmp_path / "user_agents.txt"
+        file_path.write_text("# browsers\nagent a\n\n  agent b \n")
+
+        pool = UserAgentPool.from_file(str(file_path), strategy="best")
+
+        assert pool.user_agents == ("agent a", "agent b")
+        assert pool.strategy == "best"
+
+    test_invalid_pool: list = [
+        lambda tmp_path: UserAgentPool([]),
+        lambda tmp_path: UserAgentPool(strategy="fastest"),
+        lambda tmp_path: UserAgentPool.from_file(str(tmp_path / "empty.txt")),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("fun", test_invalid_pool)
+    def test_invalid_pool_raise(self, fun, tmp_path):
+        """Tests the pool can't be created without valid user agents."""
+
+        (tmp_path / "empty.txt").write_text("# no user agents\n")
+
+        with pytest.raises(ValueError):
+            fun(tmp_path)
+
+    @pytest.mark.unittest
+    def test_default_pool(self):
+        """Tests the bundled pool is created once per process."""
+
+        assert default_user_agent_pool() is default_user_agent_pool()
+        assert default_user_agent_pool().user_agents == USER_AGENTS
+        assert HTMLScraper().user_agents is default_user_agent_pool()
+
+    @pytest.mark.unittest
+    @patch("requests.Session.get")
+    def test_get_page(self, req_mock):
+        """Tests the scraper rotates the user agents and records them."""
+
+        req_mock.side_effect = [
+            _generate_response(403),
+            _generate_response(200),
+            _generate_response(200),
+        ]
+
+        pool = UserAgentPool(["a", "b"])
+        scp = HTMLScraper(user_agents=pool)
+
+        scp.get_page(BOX_SCORE_URL, rand_agent=True)
+        scp.get_page(BOX_SCORE_URL, rand_agent=True)
+        scp.get_page(BOX_SCORE_URL)
+
+        sent = [call.kwargs["headers"] for call in req_mock.call_args_list]
+        assert sent == [{"User-Agent": "a"}, {"User-Agent": "b"}, None]
+        assert pool.stats() == {
+            "a": {"requests": 1, "successes": 0},
+            "b": {"requests": 1, "successes": 1},
+        }
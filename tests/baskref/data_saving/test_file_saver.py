@@ -10,6 +10,7 @@ import pandas as pd
 from baskref.data_saving.file_saver import (
     check_all_elements_dicts,
     save_file_from_list,
+    CSVStreamWriter,
 )
 
 
@@ -191,3 +192,84 @@ class TestFileSaver:
             if os.path.exists(input_file_path):
                 os.remove(input_file_full_path)
                 os.rmdir(input_file_path)
+
+
+class TestCSVStreamWriter:
+    """Class for CSVStreamWriter class"""
+
+    @pytest.mark.unittest
+    def test_write_rows(self, tmp_path):
+        """Tests that every batch is on disk as soon as it's written."""
+
+        file_path = os.path.join(tmp_path, "temp", "temp.csv")
+
+        with CSVStreamWriter(file_path) as writer:
+            writer.write_rows([{"A": 2, "B": "0022"}])
+
+            read_data = pd.read_csv(file_path, dtype=str)
+            assert read_data.to_dict("records") == [{"A": "2", "B": "0022"}]
+
+            writer.write_rows(iter([{"A": 1, "B": "0011"}, {"A": 0}]))
+
+        read_data = pd.read_csv(file_path, dtype=str, keep_default_na=False)
+
+        assert writer.rows_written == 3
+        assert read_data.to_dict("records") == [
+            {"A": "2", "B": "0022"},
+            {"A": "1", "B": "0011"},
+            {"A": "0", "B": ""},
+        ]
+
+    @pytest.mark.unittest
+    def test_write_no_rows(self, tmp_path):
+        """Tests that no file is created without rows."""
+
+        file_path = os.path.join(tmp_path, "temp.csv")
+
+        with CSVStreamWriter(file_path) as writer:
+            writer.write_rows([])
+
+        assert writer.rows_written == 0
+        assert not os.path.exists(file_path)
+
+    @pytest.mark.unittest
+    def test_write_rows_raise(self, tmp_path):
+        """Tests that rows which aren't dictionaries are rejected."""
+
+        with CSVStreamWriter(os.path.join(tmp_path, "temp.csv")) as writer:
+            with pytest.raises(ValueError):
+                writer.write_rows([{"A": 2}, 3])
+
+    @pytest.mark.unittest
+    def test_write_rows_append(self, tmp_path):
+        """Tests appending to a file keeps its header and rows."""
+
+        file_path = os.path.join(tmp_path, "temp.csv")
+
+        with CSVStreamWriter(file_path) as writer:
+            writer.write_rows([{"A": 2, "B": "0022"}])
+
+        # a row which was cut off when the previous run was killed
+        with open(file_path, "a", encoding="UTF-8") as csv_file:
+            csv_file.write("1,00")
+
+        with CSVStreamWriter(file_path, append=True) as writer:
+            writer.write_rows([{"B": "0011", "A": 1}])
+
+        read_data = pd.read_csv(file_path, dtype=str)
+
+        assert read_data.to_dict("records") == [
+            {"A": "2", "B": "0022"},
+            {"A": "1", "B": "0011"},
+        ]
+
+    @pytest.mark.unittest
+    def test_write_rows_append_new_file(self, tmp_path):
+        """Tests appending to a file which doesn't exist creates it."""
+
+        file_path = os.path.join(tmp_path, "temp.csv")
+
+        with CSVStreamWriter(file_path, append=True) as writer:
+            writer.write_rows([{"A": 2}])
+
+        assert pd.read_csv(file_path).to_dict("records") == [{"A": 2}]
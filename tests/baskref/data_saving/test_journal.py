@@ -0,0 +1,49 @@
+"""
+Holds the tests for the game journal
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import os
+import pytest
+from baskref.data_saving.journal import GameJournal
+
+
+class TestGameJournal:
+    """Class for GameJournal class"""
+
+    @pytest.mark.unittest
+    def test_record_and_load(self, tmp_path):
+        """Tests that the recorded games are loaded by the next run."""
+
+        file_path = os.path.join(tmp_path, "temp", "2006_gs.journal")
+        game_urls = [
+            f"https://fake.url/boxscores/{nr}.html" for nr in range(3)
+        ]
+
+        assert GameJournal(file_path).load() == set()
+
+        with GameJournal(file_path) as journal:
+            journal.record(game_urls[0])
+            journal.record(game_urls[1])
+
+            # every game is on disk as soon as it's recorded
+            assert GameJournal(file_path).load() == set(game_urls[:2])
+
+        with GameJournal(file_path) as journal:
+            journal.record(game_urls[2])
+
+        assert GameJournal(file_path).load() == set(game_urls)
+
+    @pytest.mark.unittest
+    def test_clear(self, tmp_path):
+        """Tests that a cleared journal is empty."""
+
+        file_path = os.path.join(tmp_path, "2006_gs.journal")
+
+        with GameJournal(file_path) as journal:
+            journal.record("https://fake.url/boxscores/1.html")
+            journal.clear()
+
+        assert GameJournal(file_path).load() == set()
+        assert not os.path.exists(file_path)
@@ -0,0 +1,107 @@
+"""
+Holds the tests for the parquet saver
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+from datetime import datetime
+import pytest
+from baskref.data_saving.parquet_saver import ParquetStreamWriter
+from baskref.data_saving.schema import (
+    GAME_COLUMNS,
+    PLAYER_STATS_COLUMNS,
+    URL_COLUMNS,
+)
+from tests.fixtures import parse_fixture
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestParquetStreamWriter:
+    """Class for ParquetStreamWriter class"""
+
+    @pytest.mark.unittest
+    def test_schema_matches_rows(self):
+        """Tests the columns of the schemas match the parsed rows."""
+
+        file_name = "box_score_regular_season.html"
+        game = parse_fixture(file_name, "_parse_game_data")[0]
+        players = parse_fixture(file_name, "_parse_player_stats_data")
+
+        assert [name for name, _ in GAME_COLUMNS] == list(game)
+        assert [name for name, _ in PLAYER_STATS_COLUMNS] == list(players[0])
+
+    @pytest.mark.unittest
+    def test_write_rows(self, tmp_path):
+        """Tests the rows are saved typed in row groups."""
+
+        game, old_game = [
+            parse_fixture(file_name, "_parse_game_data")[0]
+            for file_name in [
+                "box_score_regular_season.html",
+                "box_score_1950s.html",
+            ]
+        ]
+        file_path = str(tmp_path / "games" / "2022_g.parquet")
+
+        with ParquetStreamWriter(
+            file_path, GAME_COLUMNS, row_group_size=2
+        ) as writer:
+            for row in [game, old_game, game]:
+                writer.write_rows([row])
+
+        assert writer.rows_written == 3
+        assert pq.ParquetFile(file_path).num_row_groups == 2
+
+        table = pq.read_table(file_path)
+        assert str(table.schema.field("game_time").type) == "timestamp[ms]"
+        assert str(table.schema.field("home_pts").type) == "int64"
+
+        rows = table.to_pylist()
+        assert isinstance(rows[0]["game_time"], datetime)
+        assert rows[0]["game_time"] == game["game_time"]
+        assert rows[0]["home_fg_pct"] == game["home_fg_pct"]
+        assert rows[1]["home_fg3"] is None
+        assert rows[1]["attendance"] is None
+
+    @pytest.mark.unittest
+    def test_write_no_rows(self, tmp_path):
+        """Tests no file is created if there are no rows."""
+
+        file_path = tmp_path / "2022_gu.parquet"
+
+        with ParquetStreamWriter(str(file_path), URL_COLUMNS) as writer:
+            writer.write_rows([])
+
+        assert not file_path.exists()
+
+    test_invalid_rows: list = [["a"], [{"url": "a", "other": 2}]]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("rows", test_invalid_rows)
+    def test_write_rows_raise(self, tmp_path, rows):
+        """Tests rows which don't match the schema are rejected."""
+
+        writer = ParquetStreamWriter(str(tmp_path / "a.parquet"), URL_COLUMNS)
+
+        with pytest.raises(ValueError):
+            writer.write_rows(rows)
+
+    @pytest.mark.unittest
+    def test_append(self, tmp_path):
+        """Tests the rows are added to the rows of an existing file."""
+
+        file_path = str(tmp_path / "2022_gu.parquet")
+
+        with ParquetStreamWriter(file_path, URL_COLUMNS) as writer:
+            writer.write_rows([{"url": "a"}, {"url": "b"}])
+
+        with ParquetStreamWriter(file_path, URL_COLUMNS, True) as writer:
+            writer.write_rows([{"url": "c"}])
+
+        assert pq.read_table(file_path).column("url").to_pylist() == [
+            "a",
+            "b",
+            "c",
+        ]
+        assert not (tmp_path / "2022_gu.parquet.tmp").exists()
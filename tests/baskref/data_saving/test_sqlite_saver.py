@@ -0,0 +1,105 @@
+"""
+Holds the tests for the sqlite saver
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import sqlite3
+import pytest
+from baskref.data_saving.sqlite_saver import (
+    SQLiteStreamWriter,
+    GAMES_TABLE,
+    PLAYER_STATS_TABLE,
+    GAME_URLS_TABLE,
+)
+from tests.fixtures import parse_fixture
+
+
+def _query(db_path: str, sql: str) -> list[tuple]:
+    """Runs the query on the database and returns all the rows"""
+
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+class TestSQLiteStreamWriter:
+    """Class for SQLiteStreamWriter class"""
+
+    @pytest.mark.unittest
+    def test_write_rows(self, tmp_path):
+        """Tests the games and the player stats are saved typed."""
+
+        file_name = "box_score_regular_season.html"
+        games = parse_fixture(file_name, "_parse_game_data")
+        players = parse_fixture(file_name, "_parse_player_stats_data")
+        db_path = str(tmp_path / "db" / "baskref.sqlite")
+
+        with SQLiteStreamWriter(db_path, GAMES_TABLE) as games_writer:
+            games_writer.write_rows(games)
+        with SQLiteStreamWriter(db_path, PLAYER_STATS_TABLE) as pl_writer:
+            pl_writer.write_rows(players)
+
+        assert games_writer.rows_written == 1
+        assert pl_writer.rows_written == len(players)
+
+        assert _query(
+            db_path,
+            "SELECT game_id, game_time, playoff_game, home_pts, home_fg_pct "
+            "FROM games",
+        ) == [
+            (
+                games[0]["game_id"],
+                games[0]["game_time"].isoformat(sep=" "),
+                0,
+                games[0]["home_pts"],
+                games[0]["home_fg_pct"],
+            )
+        ]
+        assert _query(db_path, "SELECT COUNT(*) FROM player_stats") == [
+            (len(players),)
+        ]
+
+    @pytest.mark.unittest
+    def test_upsert(self, tmp_path):
+        """Tests the rows with the same key are updated, not duplicated."""
+
+        db_path = str(tmp_path / "baskref.sqlite")
+        players = [
+            {"game_id": "1", "player_id": "a", "pts": 10},
+            {"game_id": "1", "player_id": "b", "pts": 20},
+        ]
+
+        with SQLiteStreamWriter(db_path, PLAYER_STATS_TABLE) as writer:
+            writer.write_rows(players)
+            writer.write_rows([{"game_id": "1", "player_id": "a", "pts": 11}])
+            writer.write_rows([{"game_id": "2", "player_id": "a", "pts": 5}])
+
+        assert _query(
+            db_path,
+            "SELECT game_id, player_id, pts FROM player_stats "
+            "ORDER BY game_id, player_id",
+        ) == [("1", "a", 11), ("1", "b", 20), ("2", "a", 5)]
+
+    @pytest.mark.unittest
+    def test_write_no_rows(self, tmp_path):
+        """Tests no database is created if there are no rows."""
+
+        db_path = tmp_path / "baskref.sqlite"
+
+        with SQLiteStreamWriter(str(db_path), GAME_URLS_TABLE) as writer:
+            writer.write_rows([])
+
+        assert not db_path.exists()
+
+    test_invalid_rows: list = [["a"], [{"url": "a", "other": 2}]]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("rows", test_invalid_rows)
+    def test_write_rows_raise(self, tmp_path, rows):
+        """Tests rows which don't match the table are rejected."""
+
+        db_path = str(tmp_path / "baskref.sqlite")
+
+        with SQLiteStreamWriter(db_path, GAME_URLS_TABLE) as writer:
+            with pytest.raises(ValueError):
+                writer.write_rows(rows)
@@ -0,0 +1,285 @@
+"""
+Holds the tests for the collection and the saving managers of baskref
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import csv
+from datetime import date
+from unittest.mock import patch
+import pytest
+from baskref import (
+    CollectedGame,
+    collect_games_data,
+    get_journal_path,
+    load_completed_games,
+    load_last_run,
+    run_baskref,
+    run_data_saving_manager,
+)
+from baskref.data_collection.baskref_url_scraper import BaskRefUrlScraper
+from baskref.data_collection.html_scraper import ScrapingError
+from baskref.data_saving.journal import GameJournal
+from baskref.settings import InLine, Settings
+
+BOX_SCORE_URL = "https://www.basketball-reference.com/boxscores/{}.html"
+
+
+def _settings(tmp_path, data_type: str = "g", **kwargs) -> Settings:
+    """Generates the settings of a run to be used for testing"""
+
+    in_line = InLine(
+        type=data_type,
+        date=date(2022, 1, 7),
+        namechar="",
+        year=2022,
+        file_path=str(tmp_path),
+        proxy="",
+        **kwargs,
+    )
+
+    return Settings(in_line=in_line)
+
+
+def _game(game_id: str) -> CollectedGame:
+    """Generates the collected rows of a game to be used for testing"""
+
+    url = BOX_SCORE_URL.format(game_id)
+    return CollectedGame("20220107", url, {"g": [{"game_id": game_id}]})
+
+
+def _read_csv(file_path: str, column: str = "game_id") -> list[str]:
+    """Reads the game ids (or another column) saved into a CSV file"""
+
+    with open(file_path, newline="", encoding="UTF-8") as csv_file:
+        return [row[column] for row in csv.DictReader(csv_file)]
+
+
+def _run_baskref(
+    args: list[str], day_games: dict[date, list[str]], today: date
+) -> list[date]:
+    """
+    Runs baskref from the command line with the games of the daily pages
+    and the date of today faked.
+    :return: the days whose daily pages were scraped
+    """
+
+    scraped = []
+
+    def fake_get_game_urls_day(_self, game_date: date) -> list:
+        scraped.append(game_date)
+        if game_date not in day_games:
+            raise ScrapingError(str(game_date), 500)
+        return [BOX_SCORE_URL.format(game) for game in day_games[game_date]]
+
+    class FakeDate(date):
+        """The date with the faked today"""
+
+        @classmethod
+        def today(cls):
+            return today
+
+    with patch("sys.argv", ["baskref", *args, "-r", "0"]), patch(
+        "baskref.date", FakeDate
+    ), patch.object(
+        BaskRefUrlScraper, "get_game_urls_day", fake_get_game_urls_day
+    ):
+        run_baskref()
+
+    return scraped
+
+
+class TestCollectGamesData:
+    """Class for the function collect_games_data"""
+
+    @pytest.mark.unittest
+    def test_url_modes_skip(self):
+        """Tests the url modes skip the collected games and record urls."""
+
+        game_urls = [
+            ("2022", BOX_SCORE_URL.format("202201070ATL")),
+            ("2022", BOX_SCORE_URL.format("202201070BOS")),
+        ]
+
+        games = list(
+            collect_games_data(None, game_urls, "gu", {"202201070ATL"})
+        )
+
+        assert games == [
+            CollectedGame(
+                "2022", game_urls[1][1], {"gu": [{"url": game_urls[1][1]}]}
+            )
+        ]
+
+
+class TestDataSaving:
+    """Class for the saving of the collected games"""
+
+    @pytest.mark.unittest
+    def test_run_data_saving_manager(self, tmp_path):
+        """Tests the games are saved, journaled and indexed."""
+
+        settings = _settings(tmp_path)
+        run_data_saving_manager(settings, [_game("202201070BOS")])
+
+        assert _read_csv(tmp_path / "20220107_g.csv") == ["202201070BOS"]
+        assert load_completed_games(settings) == set()
+        assert (tmp_path / "g.index").read_text() == "202201070BOS\n"
+
+        resumed = _settings(tmp_path, resume=True)
+        assert load_completed_games(resumed) == {
+            BOX_SCORE_URL.format("202201070BOS")
+        }
+
+        run_data_saving_manager(resumed, [_game("202201070ATL")])
+
+        assert _read_csv(tmp_path / "20220107_g.csv") == [
+            "202201070BOS",
+            "202201070ATL",
+        ]
+        assert load_completed_games(resumed) == {
+            BOX_SCORE_URL.format("202201070BOS"),
+            BOX_SCORE_URL.format("202201070ATL"),
+        }
+
+    @pytest.mark.unittest
+    def test_run_data_saving_manager_restart(self, tmp_path):
+        """Tests a run without --resume starts a new journal and file."""
+
+        run_data_saving_manager(_settings(tmp_path), [_game("202201070BOS")])
+        run_data_saving_manager(_settings(tmp_path), [_game("202201070ATL")])
+
+        assert _read_csv(tmp_path / "20220107_g.csv") == ["202201070ATL"]
+        assert load_completed_games(_settings(tmp_path, resume=True)) == {
+            BOX_SCORE_URL.format("202201070ATL")
+        }
+
+    @pytest.mark.unittest
+    def test_load_completed_games(self, tmp_path):
+        """Tests the journal is loaded when resuming, the index with
+        --new_only and --since_last_run.
+        """
+
+        assert load_completed_games(_settings(tmp_path / "new")) == set()
+
+        (tmp_path / "20220107_g.journal").write_text("url_a\nurl_b\n")
+        (tmp_path / "g.index").write_text("id_a\n\nid_c\n")
+
+        assert load_completed_games(_settings(tmp_path)) == set()
+        assert load_completed_games(_settings(tmp_path, resume=True)) == {
+            "url_a",
+            "url_b",
+        }
+        assert load_completed_games(_settings(tmp_path, new_only=True)) == {
+            "id_a",
+            "id_c",
+        }
+        assert load_completed_games(
+            _settings(tmp_path, resume=True, since_last_run=True)
+        ) == {"url_a", "url_b", "id_a", "id_c"}
+
+    test_journaled_outputs: list[tuple] = [
+        ("csv", True),
+        ("sqlite", True),
+        ("parquet", False),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("output, durable", test_journaled_outputs)
+    def test_journal_durable_rows(self, tmp_path, output, durable):
+        """Tests a game is journaled only once its rows are on disk."""
+
+        if output == "parquet":
+            pytest.importorskip("pyarrow")
+
+        settings = _settings(tmp_path, output=output)
+        journal = GameJournal(get_journal_path(settings))
+        game_url = BOX_SCORE_URL.format("202201070BOS")
+        journaled = []
+
+        def collect():
+            yield _game("202201070BOS")
+            # a hard kill at this point keeps only what is journaled
+            journaled.append(journal.load())
+            raise RuntimeError("killed")
+
+        with pytest.raises(RuntimeError):
+            run_data_saving_manager(settings, collect())
+
+        assert journaled == [{game_url} if durable else set()]
+        assert journal.load() == {game_url}
+
+
+class TestRunBaskref:
+    """Class for the command line runs of baskref"""
+
+    @pytest.mark.unittest
+    def test_new_only(self, tmp_path):
+        """Tests --new_only appends only the new games to the file."""
+
+        args = ["-t", "gu", "-d", "2022-01-07", "-fp", str(tmp_path)]
+        today = date(2022, 1, 8)
+
+        _run_baskref(args, {date(2022, 1, 7): ["202201070BOS"]}, today)
+        _run_baskref(
+            [*args, "--new_only"],
+            {date(2022, 1, 7): ["202201070BOS", "202201070ATL"]},
+            today,
+        )
+
+        assert _read_csv(tmp_path / "20220107_gu.csv", "url") == [
+            BOX_SCORE_URL.format("202201070BOS"),
+            BOX_SCORE_URL.format("202201070ATL"),
+        ]
+        assert (tmp_path / "gu.index").read_text().split() == [
+            "202201070BOS",
+            "202201070ATL",
+        ]
+
+    @pytest.mark.unittest
+    def test_since_last_run(self, tmp_path):
+        """Tests --since_last_run scrapes the daily pages since the day
+        before the last successful run and records the run.
+        """
+
+        args = ["-t", "gu", "-fp", str(tmp_path), "--since_last_run"]
+        day_games = {
+            date(2022, 1, 7): ["202201070BOS"],
+            date(2022, 1, 8): ["202201080BOS"],
+            date(2022, 1, 9): ["202201090BOS"],
+        }
+        settings = _settings(tmp_path, "gu")
+
+        scraped = _run_baskref(args, day_games, date(2022, 1, 8))
+
+        assert scraped == [date(2022, 1, 8)]
+        assert load_last_run(settings) == date(2022, 1, 8)
+
+        scraped = _run_baskref(args, day_games, date(2022, 1, 9))
+
+        assert scraped == [
+            date(2022, 1, 7),
+            date(2022, 1, 8),
+            date(2022, 1, 9),
+        ]
+        assert _read_csv(
+            tmp_path / "2022_20220107-20220109_gu.csv", "url"
+        ) == [
+            BOX_SCORE_URL.format("202201070BOS"),
+            BOX_SCORE_URL.format("202201090BOS"),
+        ]
+        assert load_last_run(settings) == date(2022, 1, 9)
+
+    @pytest.mark.unittest
+    def test_record_successful_run(self, tmp_path):
+        """Tests a failed run doesn't replace the last successful run."""
+
+        args = ["-t", "gu", "-fp", str(tmp_path), "--since_last_run"]
+        settings = _settings(tmp_path, "gu")
+
+        _run_baskref(args, {date(2022, 1, 7): []}, date(2022, 1, 7))
+
+        with pytest.raises(SystemExit):
+            _run_baskref(args, {}, date(2022, 1, 8))
+
+        assert load_last_run(settings) == date(2022, 1, 7)
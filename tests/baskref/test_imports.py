@@ -0,0 +1,141 @@
+"""
+Holds the tests for the lazy imports and the import time of the package
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+import baskref
+import baskref.data_collection
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+# the dependencies which may only be imported when they are used
+HEAVY_MODULES = ("requests", "bs4", "aiohttp", "pyarrow", "selectolax")
+
+# the scrapers whose import (requests, bs4, aiohttp) is deferred by baskref
+SCRAPER_MODULES = (
+    "baskref.data_collection.baskref_data_scraper",
+    "baskref.data_collection.async_baskref_scraper",
+)
+
+# the budget of import baskref relative to the deferred scrapers, both
+# measured in the same interpreter so the budget doesn't depend on the
+# speed of the machine (around 0.2, it was 1 + 0.2 when the scrapers were
+# imported eagerly)
+IMPORT_TIME_BUDGET = 0.5
+
+# runs the code given as the first argument and prints the top level
+# names of the imported modules (also when the code exits, e.g. --help)
+IMPORTED_MODULES_CODE = """
+import sys
+try:
+    exec(sys.argv[1])
+except SystemExit:
+    pass
+print(*sorted({name.split(".")[0] for name in sys.modules}), file=sys.stderr)
+"""
+
+
+def _imported_modules(code: str) -> set[str]:
+    """
+    Runs the code in a new interpreter.
+    :return: the top level names of the modules imported by the code
+    """
+
+    res = subprocess.run(
+        [sys.executable, "-c", IMPORTED_MODULES_CODE, code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(res.stderr.split())
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """
+    Runs the code in a new interpreter with -X importtime.
+    :return: the cumulative import time (us) of every imported module
+    """
+
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestImports:
+    """Class for the lazy imports of the package"""
+
+    test_light_code: list[str] = [
+        "import baskref",
+        "from baskref import valid_date",
+        "import sys; sys.argv = ['baskref', '--help']; "
+        "import baskref; baskref.run_baskref()",
+        "from baskref.data_collection.metrics import ScrapeMetrics",
+        "from baskref.data_collection.parser_backends import PARSER_BACKENDS",
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("code", test_light_code)
+    def test_light_imports(self, code):
+        """Tests the heavy dependencies aren't imported until used."""
+
+        imported = _imported_modules(code)
+
+        assert "baskref" in imported
+        assert not [mod for mod in HEAVY_MODULES if mod in imported]
+
+    @pytest.mark.unittest
+    def test_import_time_budget(self):
+        """Tests import baskref takes a fraction of the deferred imports."""
+
+        code = "; ".join(
+            f"import {mod}" for mod in ("baskref", *SCRAPER_MODULES)
+        )
+
+        def share() -> float:
+            times = _import_times(code)
+            deferred = sum(times[mod] for mod in SCRAPER_MODULES)
+            return times["baskref"] / deferred
+
+        # the best of a few runs (the first one also compiles the .pyc)
+        assert min(share() for _ in range(3)) < IMPORT_TIME_BUDGET
+
+    @pytest.mark.unittest
+    def test_heavy_imports(self):
+        """Tests the dependencies are imported with the scrapers."""
+
+        imported = _imported_modules("from baskref import BaskRefDataScraper")
+
+        assert {"requests", "bs4"} <= imported
+
+    @pytest.mark.unittest
+    def test_lazy_attributes(self):
+        """Tests the lazy names are imported on first use."""
+
+        scraper_cls = baskref.data_collection.BaskRefDataScraper
+
+        assert scraper_cls.__name__ == "BaskRefDataScraper"
+        assert baskref.BaskRefDataScraper is scraper_cls
+        assert "GameRecord" in dir(baskref.data_collection)
+
+        with pytest.raises(AttributeError):
+            _ = baskref.MissingScraper
@@ -4,10 +4,10 @@ Holds the tests for the util.
 Author: Dominik Zulovec Sajovic - August 2022
 """
 
-from datetime import datetime
+from datetime import datetime, date
 from argparse import ArgumentTypeError
 import pytest
-from baskref.utils import valid_date
+from baskref.utils import valid_date, season_of_date, parse_game_id
 
 
 class TestDateUtils:
@@ -47,3 +47,35 @@ class TestDateUtils:
 
         returned_status = valid_date(str_date)
         assert expected_status == returned_status
+
+    test_seasons = [
+        (date(2022, 1, 7), 2022),
+        (date(2022, 6, 16), 2022),
+        (date(2021, 10, 19), 2022),
+        (date(2011, 12, 25), 2012),
+        (date(1951, 11, 3), 1952),
+        (date(2020, 10, 11), 2020),
+        (date(2020, 12, 22), 2021),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("game_date, expected_status", test_seasons)
+    def test_season_of_date(self, game_date, expected_status):
+        """Tests the function season_of_date."""
+
+        assert season_of_date(game_date) == expected_status
+
+    test_game_urls = [
+        (
+            "https://www.basketball-reference.com/boxscores/202201070BOS.html",
+            "202201070BOS",
+        ),
+        ("http://localhost:8000/boxscores/195001140MNL.html", "195001140MNL"),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("game_url, expected_status", test_game_urls)
+    def test_parse_game_id(self, game_url, expected_status):
+        """Tests the function parse_game_id."""
+
+        assert parse_game_id(game_url) == expected_status
@@ -0,0 +1,146 @@
+"""
+Holds the tests for the parsing benchmarks
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import pytest
+from benchmarks.parse_benchmark import (
+    CORPUS_DIR,
+    BenchmarkCase,
+    benchmark_cases,
+    find_regressions,
+    format_results,
+    main,
+    run_case,
+)
+
+
+def _result(pages_per_s: float, backend: str = "lxml") -> dict:
+    """Generates the result of a benchmark to be used for testing"""
+
+    return {
+        "page": "playoffs",
+        "parser": "_parse_game_data",
+        "backend": backend,
+        "pages_per_s": pages_per_s,
+        "soup_ms": 1.0,
+        "parse_ms": 1.0,
+        "peak_kb": 10.0,
+    }
+
+
+class TestParseBenchmark:
+    """Class for the parsing benchmarks"""
+
+    @pytest.mark.unittest
+    def test_benchmark_cases(self):
+        """Tests all the box scores and url pages are benchmarked."""
+
+        cases = benchmark_cases()
+
+        assert len(cases) == 5 * 2 + 3
+        assert {case.page for case in cases} >= {"1950s", "play_in"}
+        assert [case.url_scraper for case in cases].count(True) == 3
+
+    @pytest.mark.unittest
+    def test_run_case(self):
+        """Tests the timings and the memory of a case are measured."""
+
+        case = BenchmarkCase(
+            "daily_games",
+            "daily_games.html",
+            "_parse_daily_games",
+            url_scraper=True,
+        )
+        result = run_case(case, "html.parser", 2)
+
+        assert result["page"] == "daily_games"
+        assert result["backend"] == "html.parser"
+        assert result["pages_per_s"] > 0
+        assert result["peak_kb"] > 0
+        assert "daily_games" in format_results([result])
+
+    @pytest.mark.unittest
+    def test_run_case_error(self):
+        """Tests a parsing function failing on the page is reported."""
+
+        case = BenchmarkCase("daily", "daily_games.html", "_parse_game_data")
+        result = run_case(case, "html.parser", 2)
+
+        assert "pages_per_s" not in result
+        assert result["error"].startswith("AttributeError")
+        assert "failed: AttributeError" in format_results([result])
+
+    test_regressions: list[tuple] = [
+        ([_result(80.0)], 0),
+        ([_result(70.0)], 1),
+        ([_result(10.0, "selectolax")], 0),
+        ([{**_result(0), "error": "ValueError: x"}], 1),
+    ]
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("results, expected", test_regressions)
+    def test_find_regressions(self, results, expected):
+        """Tests the cases slower than the tolerance are reported."""
+
+        regressions = find_regressions(results, [_result(100.0)], 0.25)
+
+        assert len(regressions) == expected
+
+    @pytest.mark.unittest
+    def test_main(self, tmp_path, capsys):
+        """Tests the results are saved and compared with a baseline."""
+
+        results_path = tmp_path / "results.json"
+        args = ["-b", "html.parser", "-p", "daily_games", "-r", "1"]
+
+        assert main([*args, "--save", str(results_path)]) == 0
+
+        results = json.loads(results_path.read_text(encoding="UTF-8"))
+        assert [res["parser"] for res in results] == ["_parse_daily_games"]
+
+        results[0]["pages_per_s"] = 1e9
+        results_path.write_text(json.dumps(results), encoding="UTF-8")
+
+        assert main([*args, "--compare", str(results_path)]) == 1
+        assert "REGRESSION daily_games" in capsys.readouterr().out
+
+    @pytest.mark.unittest
+    def test_corpus(self, tmp_path):
+        """Tests the pages are read from the corpus folder."""
+
+        args = ["-b", "html.parser", "-p", "daily_games", "-r", "1"]
+        results_path = tmp_path / "results.json"
+
+        with pytest.raises(FileNotFoundError):
+            main([*args, "--corpus", str(tmp_path)])
+
+        shutil.copy(f"{CORPUS_DIR}/daily_games.html", tmp_path)
+        main([*args, "--corpus", str(tmp_path), "--save", str(results_path)])
+
+        assert "pages_per_s" in json.loads(results_path.read_text())[0]
+
+    @pytest.mark.unittest
+    def test_no_tests_import(self):
+        """Tests the benchmarks don't depend on the tests package."""
+
+        res = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, benchmarks.parse_benchmark; "
+                "print('tests' in sys.modules)",
+            ],
+            cwd=os.path.dirname(os.path.dirname(CORPUS_DIR)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert res.stdout.strip() == "False"
@@ -0,0 +1,44 @@
+"""
+Saved basketball reference pages used by the tests
+
+Author: Dominik Zulovec Sajovic - October 2026
+"""
+
+import os
+from baskref.data_collection import BaskRefDataScraper
+from baskref.data_collection.baskref_data_scraper import (
+    tag_game_data,
+    tag_player_stats_data,
+)
+from baskref.data_collection.records import GameRecord, PlayerStatRecord
+from baskref.data_collection.parser_backends import make_soup
+
+fixtures_path = os.path.dirname(os.path.abspath(__file__))
+
+
+def read_fixture(file_name: str) -> str:
+    """Reads a saved basketball reference page"""
+
+    with open(os.path.join(fixtures_path, file_name), encoding="UTF-8") as fh:
+        return fh.read()
+
+
+def parse_fixture(
+    file_name: str, parse_fun_name: str
+) -> list[GameRecord] | list[PlayerStatRecord]:
+    """
+    Parses the rows out of a saved game page like the data scraper does
+    (with the game id and the game url).
+    :parse_fun_name: _parse_game_data or _parse_player_stats_data
+    """
+
+    scraper = BaskRefDataScraper()
+    game_page = make_soup(read_fixture(file_name))
+    rows = getattr(scraper, parse_fun_name)(game_page)
+
+    game_url = f"https://fake.url/boxscores/{file_name[:-5]}.html"
+
+    if isinstance(rows, GameRecord):
+        return [tag_game_data(game_url, rows)]
+
+    return tag_player_stats_data(game_url, rows)